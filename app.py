@@ -10,13 +10,15 @@ from werkzeug.utils import secure_filename
 import threading
 import time
 import os
+import atexit
 from datetime import datetime
 import json
 
 from config import Config
-from postgres_database import PostgresApplicationDatabase
+from storage import create_database, clamp_page_size, HISTORY_PAGE_SIZE, release_thread_connections
 from logger_config import setup_logger
-from saramin_bot import SaraminBot
+from saramin_bot import SaraminBot, launch_chrome
+from driver_pool import DriverPool
 from resume_analyzer import ResumeAnalyzer
 
 app = Flask(__name__)
@@ -42,12 +44,64 @@ if not os.path.exists(UPLOAD_FOLDER):
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB 제한
 
+@app.teardown_appcontext
+def cleanup_db_session(exception=None):
+    """요청 종료 시 스레드의 데이터베이스 연결 반환"""
+    release_thread_connections()
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+# 예열된 Chrome 드라이버 풀 (DRIVER_POOL_SIZE가 0이면 사용 안 함)
+driver_pool = None
+driver_pool_lock = threading.Lock()
+
+def get_driver_pool(config):
+    """프로세스 공용 드라이버 풀 (처음 호출 시 생성)"""
+    global driver_pool
+    if config.driver_pool_size <= 0:
+        return None
+    with driver_pool_lock:
+        if driver_pool is None:
+            pool_logger = setup_logger()
+            driver_pool = DriverPool(
+                lambda pool_config: launch_chrome(pool_config, pool_logger),
+                size=config.driver_pool_size,
+                max_navigations=config.driver_pool_max_navigations,
+                max_memory_mb=config.driver_pool_max_memory_mb,
+                logger=pool_logger
+            )
+            atexit.register(driver_pool.shutdown)
+        return driver_pool
+
+def warm_driver_pool():
+    """현재 설정의 계정으로 드라이버 풀 예열 (로그인 정보가 없으면 생략)"""
+    try:
+        config = Config()
+    except ValueError:
+        return
+    pool = get_driver_pool(config)
+    if pool is not None:
+        pool.warm(config)
+
+def create_bot(config, db, logger):
+    """봇 생성 (드라이버 풀이 있으면 예열된 브라우저 연결, 없으면 로그인 시 직접 실행)"""
+    bot = SaraminBot(config, db, logger)
+    pool = get_driver_pool(config)
+    if pool is not None:
+        try:
+            pooled = pool.acquire(config, timeout=config.driver_pool_acquire_timeout)
+            bot.attach_driver(pooled.driver, pooled.profile, lease=pooled)
+        except TimeoutError:
+            raise  # 풀이 가득 찬 상태에서 직접 실행하면 브라우저 수 제한을 넘게 됨
+        except Exception as e:
+            logger.warning(f"드라이버 풀에서 브라우저를 받지 못해 직접 실행합니다: {str(e)}")
+    return bot
+
 def run_bot_background(config_data):
     """백그라운드에서 봇 실행"""
     global app_state
+    bot = None
     
     try:
         app_state['running'] = True
@@ -61,7 +115,7 @@ def run_bot_background(config_data):
         logger = setup_logger("saramin_bot.log", "INFO")
         
         # 데이터베이스 초기화
-        db = PostgresApplicationDatabase()
+        db = create_database()
         
         # 당일 실행 확인
         today = datetime.now().strftime('%Y-%m-%d')
@@ -75,9 +129,9 @@ def run_bot_background(config_data):
         
         # 봇 실행
         config = Config()
-        bot = SaraminBot(config, db, logger)
-        
         app_state['progress'] = "브라우저 시작 중..."
+        bot = create_bot(config, db, logger)
+        
         add_log("Chrome 브라우저 시작")
         
         # 로그인
@@ -85,7 +139,6 @@ def run_bot_background(config_data):
         if not bot.login():
             app_state['error'] = "로그인 실패"
             app_state['running'] = False
-            bot.close()
             return
         
         add_log("로그인 성공")
@@ -95,7 +148,7 @@ def run_bot_background(config_data):
         applied_count = bot.search_and_apply_jobs()
         
         # 실행 기록
-        db.record_execution(today, applied_count)
+        db.record_execution(today, applied_count, keyword_stats=bot.keyword_overlap_stats())
         
         # 결과 업데이트
         app_state['stats'] = {
@@ -107,13 +160,15 @@ def run_bot_background(config_data):
         app_state['progress'] = f"완료: {applied_count}개 지원"
         add_log(f"총 {applied_count}개 채용공고에 지원 완료")
         
-        bot.close()
-        
     except Exception as e:
         app_state['error'] = f"오류 발생: {str(e)}"
         add_log(f"오류: {str(e)}")
     finally:
+        # 오류로 중단되어도 브라우저 종료/반환과 프로필 잠금 해제
+        if bot is not None:
+            bot.close()
         app_state['running'] = False
+        release_thread_connections()
 
 def run_hybrid_bot_background(config_data):
     """웹 기반 하이브리드 모드 봇 실행"""
@@ -220,6 +275,7 @@ def stop_automation():
 def run_web_automation_background(config_data):
     """웹 자동화 백그라운드 실행"""
     global app_state
+    bot = None
     
     try:
         app_state['running'] = True
@@ -230,11 +286,11 @@ def run_web_automation_background(config_data):
         
         # 설정 구성
         from config import Config
-        from postgres_database import PostgresApplicationDatabase
+        from storage import create_database
         from logger_config import setup_logger
         
         config = Config()
-        db = PostgresApplicationDatabase()
+        db = create_database()
         logger = setup_logger()
         
         # 키워드 설정
@@ -258,8 +314,9 @@ def run_web_automation_background(config_data):
         # 헤드리스 모드로 봇 실행 (백그라운드)
         from saramin_bot import SaraminBot
         
-        bot = SaraminBot(config, db, logger)
-        bot.setup_driver()  # 헤드리스 모드
+        bot = create_bot(config, db, logger)
+        if bot.driver is None:
+            bot.setup_driver()  # 헤드리스 모드
         
         app_state['progress'] = "채용공고 검색 중..."
         add_log("자동 채용공고 검색을 시작합니다")
@@ -277,7 +334,7 @@ def run_web_automation_background(config_data):
         applied_count = bot.search_and_apply_jobs()
         
         # 실행 기록
-        db.record_execution(today, applied_count)
+        db.record_execution(today, applied_count, keyword_stats=bot.keyword_overlap_stats())
         
         # 결과 업데이트
         app_state['stats'] = {
@@ -289,14 +346,16 @@ def run_web_automation_background(config_data):
         app_state['progress'] = f"완료: {applied_count}개 지원"
         add_log(f"총 {applied_count}개 채용공고에 지원 완료")
         
-        bot.close()
-        
     except Exception as e:
         app_state['error'] = f"웹 자동화 오류: {str(e)}"
         add_log(f"오류 발생: {str(e)}")
         
     finally:
+        # 오류로 중단되어도 브라우저 종료/반환과 프로필 잠금 해제
+        if bot is not None:
+            bot.close()
         app_state['running'] = False
+        release_thread_connections()
 
 def add_log(message):
     """로그 추가"""
@@ -332,20 +391,16 @@ BROWSER_TIMEOUT=30
     
     # 데이터베이스에 마지막 사용 설정 저장
     try:
-        from postgres_database import PostgresApplicationDatabase
-        db = PostgresApplicationDatabase()
-        
-        # 마지막 사용 설정 저장
-        if config_data.get('keywords'):
-            db.save_last_used_keywords(config_data['keywords'])
-        
-        location = config_data.get('locations', config_data.get('location'))
-        if location:
-            db.save_last_used_location(location)
+        from storage import create_database
+        db = create_database()
         
+        # 마지막 사용 설정을 한 번에 저장
         max_apps = config_data.get('max_applications', config_data.get('max_apps'))
-        if max_apps:
-            db.save_last_used_max_applications(int(max_apps))
+        db.save_last_used_settings(
+            keywords=config_data.get('keywords'),
+            location=config_data.get('locations', config_data.get('location')),
+            max_applications=int(max_apps) if max_apps else None
+        )
             
         add_log("설정이 데이터베이스에 저장되었습니다")
             
@@ -362,8 +417,8 @@ def get_config():
     """현재 설정 조회"""
     try:
         # PostgreSQL에서 저장된 설정값 직접 조회
-        from postgres_database import PostgresApplicationDatabase
-        db = PostgresApplicationDatabase()
+        from storage import create_database
+        db = create_database()
         
         # 데이터베이스에서 마지막 사용 설정 조회
         keywords = db.get_last_used_keywords() or '바이오,생명공학,제약,의료기기'
@@ -393,6 +448,8 @@ def save_config():
     try:
         config_data = request.json
         update_config(config_data)
+        # 저장된 계정으로 브라우저를 미리 실행하여 다음 실행의 시작 시간 단축
+        warm_driver_pool()
         return jsonify({'success': True, 'message': '설정이 저장되었습니다'})
     except Exception as e:
         return jsonify({'success': False, 'message': f'설정 저장 실패: {str(e)}'})
@@ -461,27 +518,49 @@ def get_status():
 
 @app.route('/api/history', methods=['GET'])
 def get_history():
-    """지원 이력 조회"""
+    """지원 이력 조회 (page_size, cursor, execution_cursor로 키셋 페이지네이션)"""
     try:
-        db = PostgresApplicationDatabase()
+        db = create_database()
+        page_size = clamp_page_size(request.args.get('page_size', HISTORY_PAGE_SIZE))
         
         # 최근 지원 이력
-        applications = db.get_application_history(days=30)
-        
-        # 실행 이력
-        executions = db.get_execution_history(days=30)
+        try:
+            applications = db.get_application_history_page(page_size, request.args.get('cursor'))
+            executions = db.get_execution_history_page(page_size, request.args.get('execution_cursor'))
+        except ValueError:
+            return jsonify({'error': '잘못된 페이지 커서입니다'}), 400
         
-        # 통계
-        stats = db.get_statistics()
+        # 통계 (첫 페이지에서만 계산)
+        stats = None
+        if not request.args.get('cursor') and not request.args.get('execution_cursor'):
+            stats = db.get_statistics()
         
         return jsonify({
-            'applications': applications,
-            'executions': executions,
+            'applications': applications['items'],
+            'next_cursor': applications['next_cursor'],
+            'executions': executions['items'],
+            'executions_next_cursor': executions['next_cursor'],
             'statistics': stats
         })
     except Exception as e:
         return jsonify({'error': str(e)})
 
+@app.route('/api/db-pool', methods=['GET'])
+def get_db_pool_status():
+    """데이터베이스 커넥션 풀 상태 조회"""
+    try:
+        db = create_database()
+        return jsonify(db.get_pool_status())
+    except Exception as e:
+        return jsonify({'error': str(e)})
+
+@app.route('/api/driver-pool', methods=['GET'])
+def get_driver_pool_status():
+    """드라이버 풀 사용 현황 조회"""
+    if driver_pool is None:
+        return jsonify({'enabled': False})
+    return jsonify({'enabled': True, **driver_pool.status()})
+
 @app.route('/api/test-login', methods=['POST'])
 def test_login():
     """고급 봇 탐지 우회 로그인 테스트"""
@@ -490,6 +569,7 @@ def test_login():
     if not config_data.get('username') or not config_data.get('password'):
         return jsonify({'success': False, 'message': '로그인 정보를 입력해주세요'})
     
+    bot = None
     try:
         add_log("고급 봇 탐지 우회 로그인 테스트 시작...")
         add_log(f"사용자: {config_data.get('username')}")
@@ -499,12 +579,12 @@ def test_login():
         
         # 고급 봇 탐지 우회 시스템 적용
         config = Config()
-        db = PostgresApplicationDatabase()
+        db = create_database()
         logger = setup_logger()
         
-        bot = SaraminBot(config, db, logger)
+        bot = create_bot(config, db, logger)
         
-        if bot.setup_driver():
+        if bot.driver is not None or bot.setup_driver():
             add_log("스텔스 브라우저 설정 완료")
             add_log("- 봇 탐지 우회 스크립트 적용됨")
             add_log("- 사람처럼 보이는 User-Agent 설정됨")
@@ -515,15 +595,12 @@ def test_login():
                 
                 if success:
                     add_log("로그인 성공! 봇 탐지 우회 효과적")
-                    bot.close()
                     return jsonify({'success': True, 'message': '로그인 테스트 성공 - 봇 탐지 우회 시스템 작동'})
                 else:
                     add_log("로그인 실패 - 사람인 서버 문제 또는 추가 우회 필요")
-                    bot.close()
                     return jsonify({'success': False, 'message': '로그인 실패 - 사람인 서버 상태 확인 필요'})
             except Exception as e:
                 add_log(f"로그인 테스트 오류: {str(e)}")
-                bot.close()
                 return jsonify({'success': False, 'message': f'로그인 오류: {str(e)}'})
         else:
             add_log("브라우저 설정 실패")
@@ -532,6 +609,10 @@ def test_login():
     except Exception as e:
         add_log(f"로그인 테스트 오류: {str(e)}")
         return jsonify({'success': False, 'message': f'오류: {str(e)}'})
+    finally:
+        # 로그인 중 예외가 나도 브라우저 종료/반환과 프로필 잠금 해제
+        if bot is not None:
+            bot.close()
 
 @app.route('/api/fetch-saramin-resume', methods=['POST'])
 def fetch_saramin_resume():
@@ -620,4 +701,7 @@ if __name__ == '__main__':
     print("사람인 자동 지원 웹 앱을 시작합니다...")
     print("Replit 우상단의 'Open in new tab' 버튼을 클릭하거나")
     print("브라우저에서 접속 URL을 확인하세요")
+    # 디버그 리로더의 감시 프로세스가 아닌 실제 서버 프로세스에서만 예열
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        warm_driver_pool()
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
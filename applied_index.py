@@ -0,0 +1,171 @@
+"""
+지원 이력 중복 확인 인덱스 모듈
+In-memory applied-job index for constant-time duplicate checks during a run
+"""
+
+import hashlib
+import math
+import os
+import struct
+from datetime import datetime, timedelta
+
+class BloomFilter:
+    """파일로 저장 가능한 Bloom 필터 (대용량 지원 이력용)"""
+
+    MAGIC = b"SRB2"  # 공고 ID 형식이 바뀌면 변경 (이전 형식 파일은 새로 생성)
+    HEADER = struct.Struct(">4sQIQQ")  # magic, 비트 수, 해시 수, 항목 수, 마지막 반영 id
+
+    def __init__(self, capacity=1000000, error_rate=0.001):
+        bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_bits = max(bits, 8)
+        self.num_hashes = max(int(round(self.num_bits / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+        self.last_id = 0
+
+    def _positions(self, item):
+        """이중 해싱으로 비트 위치 계산"""
+        digest = hashlib.blake2b(str(item).encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item):
+        """항목 추가"""
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def save(self, path):
+        """파일로 저장 (임시 파일 작성 후 교체)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.num_bits, self.num_hashes, self.count, self.last_id))
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """파일에서 불러오기 (형식이 맞지 않으면 None)"""
+        with open(path, "rb") as f:
+            header = f.read(cls.HEADER.size)
+            if len(header) != cls.HEADER.size:
+                return None
+            magic, num_bits, num_hashes, count, last_id = cls.HEADER.unpack(header)
+            if magic != cls.MAGIC:
+                return None
+            bits = bytearray(f.read())
+
+        if len(bits) != (num_bits + 7) // 8:
+            return None
+
+        bloom = cls.__new__(cls)
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.bits = bits
+        bloom.count = count
+        bloom.last_id = last_id
+        return bloom
+
+class AppliedJobIndex:
+    """실행 시작 시 한 번에 불러오는 지원 이력 인덱스
+
+    job_id 집합과 회사별 마지막 지원일(최근 N일)을 메모리에 유지하여
+    실행 중 중복 확인을 I/O 없이 상수 시간에 처리한다.
+    bloom_file이 지정되면 job_id 집합 대신 파일로 저장된 Bloom 필터를 사용하고,
+    필터에 걸린 경우에만 데이터베이스로 재확인한다.
+    """
+
+    def __init__(self, database, company_window_days=30, bloom_file=None):
+        self.database = database
+        self.company_window_days = company_window_days
+        self.bloom_file = bloom_file or None
+        self.job_ids = set()
+        self.bloom = None
+        self.company_last_applied = {}
+        self.stats = {'lookups': 0, 'bloom_confirmations': 0}
+
+    @classmethod
+    def load(cls, database, company_window_days=30, bloom_file=None):
+        """데이터베이스에서 일괄 조회하여 인덱스 생성"""
+        index = cls(database, company_window_days, bloom_file)
+        index.refresh()
+        return index
+
+    def refresh(self):
+        """지원 이력을 한 번의 쿼리로 다시 불러오기"""
+        since_id = 0
+        if self.bloom_file:
+            self.bloom = self._load_bloom()
+            since_id = self.bloom.last_id
+
+        snapshot = self.database.get_dedup_snapshot(days=self.company_window_days, since_id=since_id)
+
+        if self.bloom is not None:
+            for job_id in snapshot['job_ids']:
+                self.bloom.add(job_id)
+            if snapshot['max_id'] > self.bloom.last_id:
+                self.bloom.last_id = snapshot['max_id']
+                self.bloom.save(self.bloom_file)
+        else:
+            self.job_ids = set(snapshot['job_ids'])
+
+        self.company_last_applied = dict(snapshot['companies'])
+
+    def _load_bloom(self):
+        """Bloom 필터 파일 불러오기 (없거나 손상된 경우 새로 생성)"""
+        if os.path.exists(self.bloom_file):
+            try:
+                bloom = BloomFilter.load(self.bloom_file)
+                if bloom is not None:
+                    return bloom
+            except OSError:
+                pass
+        return BloomFilter()
+
+    def is_already_applied(self, job_id):
+        """job_id 중복 지원 여부"""
+        self.stats['lookups'] += 1
+        if self.bloom is None:
+            return job_id in self.job_ids
+
+        if job_id in self.job_ids:
+            return True
+        if job_id not in self.bloom:
+            return False
+
+        # Bloom 필터 양성은 오탐일 수 있으므로 데이터베이스로 재확인
+        self.stats['bloom_confirmations'] += 1
+        applied = self.database.is_already_applied(job_id)
+        if applied:
+            self.job_ids.add(job_id)
+        return applied
+
+    def is_company_already_applied(self, company_name, days=None):
+        """회사 기준 최근 N일 내 지원 여부"""
+        self.stats['lookups'] += 1
+        last_applied = self.company_last_applied.get(company_name)
+        if last_applied is None:
+            return False
+        cutoff_date = datetime.now() - timedelta(days=days or self.company_window_days)
+        return last_applied >= cutoff_date
+
+    def add(self, job_id, company_name=None, application_date=None):
+        """지원 기록 반영"""
+        self.job_ids.add(job_id)
+        if self.bloom is not None:
+            self.bloom.add(job_id)
+        if company_name:
+            self.company_last_applied[company_name] = application_date or datetime.now()
+
+    def save(self):
+        """Bloom 필터 파일 저장 (실행 중 추가된 항목 포함)"""
+        if self.bloom is not None and self.bloom_file:
+            self.bloom.save(self.bloom_file)
+
+    def __len__(self):
+        return self.bloom.count if self.bloom is not None else len(self.job_ids)
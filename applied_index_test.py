@@ -0,0 +1,117 @@
+"""
+지원 이력 인덱스 테스트
+Unit tests for BloomFilter persistence and AppliedJobIndex lookups
+"""
+
+from datetime import datetime, timedelta
+
+from applied_index import AppliedJobIndex, BloomFilter
+
+class FakeDatabase:
+    """get_dedup_snapshot/is_already_applied만 제공하는 메모리 저장소"""
+
+    def __init__(self, applications):
+        self.applications = applications  # [(id, job_id, 회사명, 지원일)]
+        self.snapshot_calls = []
+        self.lookups = []
+
+    def get_dedup_snapshot(self, days=30, since_id=0):
+        self.snapshot_calls.append(since_id)
+        cutoff_date = datetime.now() - timedelta(days=days)
+        rows = [row for row in self.applications if row[0] > since_id]
+        companies = {}
+        for _, _, company_name, application_date in self.applications:
+            if application_date >= cutoff_date:
+                companies[company_name] = max(companies.get(company_name, application_date), application_date)
+        return {
+            'job_ids': [row[1] for row in rows],
+            'companies': companies,
+            'max_id': max((row[0] for row in rows), default=since_id)
+        }
+
+    def is_already_applied(self, job_id):
+        self.lookups.append(job_id)
+        return any(row[1] == job_id for row in self.applications)
+
+def test_bloom_filter_round_trip(tmp_path):
+    """저장한 필터를 다시 불러와도 같은 항목을 포함"""
+    path = str(tmp_path / "applied.bloom")
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(100):
+        bloom.add(f"job-{i}")
+    bloom.last_id = 42
+    bloom.save(path)
+
+    loaded = BloomFilter.load(path)
+    assert loaded.count == 100
+    assert loaded.last_id == 42
+    assert loaded.num_bits == bloom.num_bits
+    assert loaded.num_hashes == bloom.num_hashes
+    assert all(f"job-{i}" in loaded for i in range(100))
+    assert sum(f"other-{i}" in loaded for i in range(1000)) < 50
+
+def test_bloom_filter_rejects_other_format(tmp_path):
+    """magic이 다르거나 잘린 파일은 None"""
+    path = tmp_path / "applied.bloom"
+    BloomFilter(capacity=100).save(str(path))
+    data = path.read_bytes()
+
+    path.write_bytes(b"SRB1" + data[4:])
+    assert BloomFilter.load(str(path)) is None
+
+    path.write_bytes(data[:-1])
+    assert BloomFilter.load(str(path)) is None
+
+    path.write_bytes(data[:5])
+    assert BloomFilter.load(str(path)) is None
+
+def test_index_with_job_id_set():
+    """Bloom 파일 없이 불러오면 job_id 집합과 회사별 지원일로 판정"""
+    now = datetime.now()
+    database = FakeDatabase([
+        (1, '100', '가회사', now - timedelta(days=40)),
+        (2, '200', '나회사', now - timedelta(days=3))
+    ])
+    index = AppliedJobIndex.load(database)
+
+    assert len(index) == 2
+    assert index.is_already_applied('100')
+    assert not index.is_already_applied('300')
+    assert index.is_company_already_applied('나회사')
+    assert not index.is_company_already_applied('가회사')
+    assert not database.lookups
+
+    index.add('300', '다회사')
+    assert index.is_already_applied('300')
+    assert index.is_company_already_applied('다회사')
+
+def test_index_with_bloom_file(tmp_path):
+    """Bloom 필터 양성은 데이터베이스로 재확인하고, 다음 실행에는 새 기록만 읽음"""
+    bloom_file = str(tmp_path / "applied.bloom")
+    database = FakeDatabase([(1, '100', '가회사', datetime.now()), (2, '200', '나회사', datetime.now())])
+
+    index = AppliedJobIndex.load(database, bloom_file=bloom_file)
+    assert database.snapshot_calls == [0]
+    assert index.is_already_applied('100')
+    assert database.lookups == ['100']
+    assert index.is_already_applied('100')
+    assert database.lookups == ['100']
+    assert index.stats['bloom_confirmations'] == 1
+
+    database.applications.append((3, '300', '다회사', datetime.now()))
+    reloaded = AppliedJobIndex.load(database, bloom_file=bloom_file)
+    assert database.snapshot_calls == [0, 2]
+    assert reloaded.bloom.last_id == 3
+    assert len(reloaded) == 3
+    assert reloaded.is_already_applied('300')
+
+def test_index_recreates_damaged_bloom_file(tmp_path):
+    """손상된 Bloom 파일은 새로 만들어 전체 이력을 다시 읽음"""
+    bloom_file = tmp_path / "applied.bloom"
+    bloom_file.write_bytes(b"broken")
+    database = FakeDatabase([(1, '100', '가회사', datetime.now())])
+
+    index = AppliedJobIndex.load(database, bloom_file=str(bloom_file))
+    assert database.snapshot_calls == [0]
+    assert index.is_already_applied('100')
+    assert BloomFilter.load(str(bloom_file)).last_id == 1
@@ -0,0 +1,99 @@
+"""
+계정별 영구 브라우저 프로필 모듈
+Persistent per-account Chrome profile with cookie jar and logged-in probe
+
+계정마다 고정된 user-data-dir을 사용하여 로그인 쿠키와 디스크 캐시를 실행 간에 유지한다.
+Chrome이 종료 시 버리는 세션 쿠키는 쿠키 저장소(cookies.json)에 따로 저장했다가 복원한다.
+같은 프로필을 두 Chrome이 동시에 쓰지 않도록 파일 잠금으로 보호한다.
+"""
+
+import os
+import json
+import hashlib
+
+try:
+    import fcntl
+except ImportError:  # Windows: 잠금 없이 사용
+    fcntl = None
+
+LOCK_FILE = ".profile.lock"
+COOKIE_JAR_FILE = "cookies.json"
+
+# 로그인 상태 확인용 페이지와 판별 스크립트 (로그인 시 상단에 로그아웃 링크 표시)
+LOGIN_PROBE_URL = "https://www.saramin.co.kr/zf_user/"
+LOGGED_IN_SCRIPT = """
+return document.querySelector("a[href*='logout'], a[href*='/auth/logout']") !== null;
+"""
+
+class BrowserProfile:
+    """계정별 Chrome user-data-dir과 쿠키 저장소"""
+
+    def __init__(self, base_dir, username, logger=None):
+        # 계정명을 그대로 폴더명으로 쓰지 않도록 해시 사용
+        account = hashlib.blake2b(username.encode("utf-8"), digest_size=8).hexdigest()
+        self.path = os.path.abspath(os.path.join(base_dir, account))
+        self.cookie_file = os.path.join(self.path, COOKIE_JAR_FILE)
+        self.logger = logger
+        self._lock = None
+
+    def acquire(self):
+        """프로필 잠금 획득 (다른 실행이 사용 중이면 False)"""
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        self._lock = open(os.path.join(self.path, LOCK_FILE), "w")
+        if fcntl is None:
+            return True
+        try:
+            fcntl.flock(self._lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            self._lock.close()
+            self._lock = None
+            return False
+
+    def release(self):
+        """프로필 잠금 해제"""
+        if self._lock is not None:
+            if fcntl is not None:
+                fcntl.flock(self._lock, fcntl.LOCK_UN)
+            self._lock.close()
+            self._lock = None
+
+    def save_cookies(self, driver):
+        """현재 쿠키를 저장소에 기록 (소유자만 읽기 가능)"""
+        try:
+            cookies = driver.get_cookies()
+            temp_file = self.cookie_file + ".tmp"
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cookies, f)
+            os.replace(temp_file, self.cookie_file)
+            return len(cookies)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"쿠키 저장 실패: {str(e)}")
+            return 0
+
+    def load_cookies(self, driver):
+        """저장된 쿠키를 현재 도메인에 복원 (사람인 페이지를 연 상태에서 호출)"""
+        if not os.path.exists(self.cookie_file):
+            return 0
+        try:
+            with open(self.cookie_file, encoding="utf-8") as f:
+                cookies = json.load(f)
+        except (OSError, ValueError) as e:
+            if self.logger:
+                self.logger.warning(f"쿠키 저장소 읽기 실패: {str(e)}")
+            return 0
+
+        restored = 0
+        for cookie in cookies:
+            if "saramin" not in cookie.get("domain", ""):
+                continue
+            if "expiry" in cookie:
+                cookie["expiry"] = int(cookie["expiry"])
+            try:
+                driver.add_cookie(cookie)
+                restored += 1
+            except Exception:
+                continue  # 만료/도메인 불일치 쿠키는 건너뜀
+        return restored
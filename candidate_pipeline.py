@@ -0,0 +1,135 @@
+"""
+검색/지원 2단계 파이프라인 모듈
+Bounded candidate queue and stage metrics for the discover/apply pipeline
+
+검색 단계는 모든 키워드/페이지에서 후보를 수집하고 걸러 우선순위 큐에 넣고,
+지원 단계는 큐에서 점수가 높은 후보부터 꺼내 설정된 간격으로 지원한다.
+큐 크기를 제한하여 검색이 지원보다 지나치게 앞서 나가지 않게 하고,
+지원 간격 대기 동안 검색이 진행되도록 한다.
+"""
+
+import time
+import queue
+import itertools
+import threading
+
+POLL_INTERVAL = 0.5
+
+class CandidateQueue:
+    """검색 단계와 지원 단계를 잇는 크기 제한 우선순위 큐
+
+    항목은 (우선순위, 값, 검색 위치)로 넣고 우선순위가 작은 것부터 꺼낸다.
+    검색이 끝나면 close(), 지원 단계가 더 받지 않으면 stop()을 호출한다.
+    """
+
+    def __init__(self, maxsize=100):
+        self._queue = queue.PriorityQueue(maxsize=max(maxsize, 1))
+        self._sequence = itertools.count()  # 같은 우선순위는 넣은 순서대로
+        self._stopped = threading.Event()
+        self._ready = threading.Event()  # 큐가 가득 찼거나 검색이 끝남
+        self._lock = threading.Lock()
+        self._pending = {}  # 검색 위치 -> 아직 꺼내지 않은 후보 수
+
+    @property
+    def stopped(self):
+        return self._stopped.is_set()
+
+    def _put(self, entry):
+        """자리가 날 때까지 넣기 시도 (stop() 후에는 False)"""
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(entry, timeout=POLL_INTERVAL)
+                return True
+            except queue.Full:
+                self._ready.set()
+        return False
+
+    def put(self, priority, item, position=None):
+        """후보 추가 (큐가 가득 차면 대기, 지원 단계가 멈췄으면 False)"""
+        with self._lock:
+            self._pending[position] = self._pending.get(position, 0) + 1
+        if self._put((0, priority, next(self._sequence), position, item)):
+            return True
+        self._taken(position)
+        return False
+
+    def close(self):
+        """검색 완료 표시 (남은 후보를 모두 꺼낸 뒤 get()이 None 반환)"""
+        self._put((1, (), next(self._sequence), None, None))
+        self._ready.set()
+
+    def wait_ready(self):
+        """큐가 가득 차거나 검색이 끝날 때까지 대기 (우선순위 비교 대상을 먼저 모음)"""
+        while not self._ready.wait(POLL_INTERVAL):
+            if self._stopped.is_set():
+                return
+
+    def get(self):
+        """다음 후보 (검색이 끝나 더 없으면 None)"""
+        while True:
+            try:
+                flag, _, _, position, item = self._queue.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                if self._stopped.is_set():
+                    return None
+                continue
+            if flag == 0:
+                self._taken(position)
+            return item
+
+    def _taken(self, position):
+        """꺼낸 후보의 검색 위치 기록 정리"""
+        with self._lock:
+            self._pending[position] -= 1
+            if not self._pending[position]:
+                del self._pending[position]
+
+    def oldest_pending(self):
+        """아직 꺼내지 않은 후보 중 가장 앞선 검색 위치 (없으면 None)"""
+        with self._lock:
+            positions = [position for position in self._pending if position is not None]
+        return min(positions, default=None)
+
+    def stop(self):
+        """지원 단계 종료 (대기 중인 검색 단계도 멈춤)"""
+        self._stopped.set()
+
+    def drain(self):
+        """꺼내지 않고 남은 후보 목록"""
+        remaining = []
+        while True:
+            try:
+                _, _, _, _, item = self._queue.get_nowait()
+            except queue.Empty:
+                return remaining
+            if item is not None:
+                remaining.append(item)
+
+class StageMetrics:
+    """단계별 처리량 (작업 시간과 큐 대기 시간 구분)"""
+
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.busy_seconds = 0.0
+        self.waiting_seconds = 0.0
+        self.started_at = None
+        self.finished_at = None
+
+    def start(self):
+        self.started_at = time.monotonic()
+
+    def finish(self):
+        self.finished_at = time.monotonic()
+
+    def elapsed(self):
+        """단계 시작부터 종료(진행 중이면 현재)까지 시간"""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    def summary_line(self, unit="개", waiting_label="큐 대기"):
+        elapsed = self.elapsed()
+        per_minute = self.items / elapsed * 60 if elapsed > 0 else 0.0
+        return (f"{self.name}: {self.items}{unit}, 경과 {elapsed:.1f}초, 작업 {self.busy_seconds:.1f}초, "
+                f"{waiting_label} {self.waiting_seconds:.1f}초, 분당 {per_minute:.1f}{unit}")
@@ -0,0 +1,52 @@
+"""
+검색/지원 파이프라인 큐 테스트
+Unit tests for CandidateQueue ordering and pending search positions
+"""
+
+import threading
+
+from candidate_pipeline import CandidateQueue
+
+def test_get_returns_lowest_priority_first():
+    """우선순위가 작은 것부터, 같은 우선순위는 넣은 순서대로 꺼내고 close() 후에는 None"""
+    candidates = CandidateQueue(maxsize=10)
+    candidates.put(0.5, "b")
+    candidates.put(0.1, "a")
+    candidates.put(0.5, "c")
+    candidates.close()
+
+    assert [candidates.get() for _ in range(4)] == ["a", "b", "c", None]
+
+def test_oldest_pending_tracks_untaken_positions():
+    """아직 꺼내지 않은 후보 중 가장 앞선 검색 위치"""
+    candidates = CandidateQueue(maxsize=10)
+    assert candidates.oldest_pending() is None
+
+    candidates.put(0.9, "p1-a", position=(0, 1))
+    candidates.put(0.1, "p2-a", position=(0, 2))
+    candidates.put(0.2, "p1-b", position=(0, 1))
+    candidates.put(0.0, "no-position")
+    assert candidates.oldest_pending() == (0, 1)
+
+    assert candidates.get() == "no-position"
+    assert candidates.get() == "p2-a"
+    assert candidates.get() == "p1-b"
+    assert candidates.oldest_pending() == (0, 1)
+    assert candidates.get() == "p1-a"
+    assert candidates.oldest_pending() is None
+
+def test_stop_releases_blocked_producer():
+    """큐가 가득 찬 상태에서 stop()하면 대기 중인 put()이 False를 반환하고 위치 기록을 정리"""
+    candidates = CandidateQueue(maxsize=1)
+    candidates.put(0.1, "first", position=(0, 1))
+    results = []
+    producer = threading.Thread(target=lambda: results.append(candidates.put(0.2, "second", position=(0, 2))))
+    producer.start()
+
+    candidates.wait_ready()
+    candidates.stop()
+    producer.join(timeout=5)
+
+    assert results == [False]
+    assert candidates.oldest_pending() == (0, 1)
+    assert candidates.drain() == ["first"]
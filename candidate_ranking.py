@@ -0,0 +1,87 @@
+"""
+지원 후보 우선순위 모듈
+Vectorised candidate scoring from keyword yield, freshness and deadline proximity
+
+일일 지원 수 제한이 있을 때 키워드 순서가 아니라 점수가 높은 후보부터 지원하도록
+검색 결과 페이지 단위로 후보 점수를 계산한다. 점수는 키워드별 과거 지원 수
+(get_statistics의 keyword_statistics), 등록일 기준 최신성, 마감 임박도의 가중합이며,
+페이지의 후보 전체를 NumPy 배열로 한 번에 계산한다.
+"""
+
+import math
+import re
+from datetime import date
+
+import numpy as np
+
+# 점수 가중치 (합계 1)
+KEYWORD_YIELD_WEIGHT = 0.5
+FRESHNESS_WEIGHT = 0.3
+DEADLINE_WEIGHT = 0.2
+
+FRESHNESS_HALF_LIFE_DAYS = 7.0  # 등록 후 이 기간마다 최신성 점수가 절반
+DEADLINE_HALF_LIFE_DAYS = 7.0  # 마감까지 남은 기간이 이만큼 늘 때마다 임박도 점수가 절반
+UNKNOWN_FRESHNESS = 0.5  # 등록일을 알 수 없는 후보의 최신성 점수
+
+# 목록의 마감일 표시 (예: "~ 10/25(금)", "오늘마감", "내일마감", "상시채용")
+DEADLINE_DATE_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})")
+DEADLINE_RELATIVE_DAYS = {"오늘마감": 0, "내일마감": 1}
+
+def deadline_days_left(deadline, today):
+    """마감까지 남은 일수 (상시채용 등 알 수 없으면 None)"""
+    if not deadline:
+        return None
+    for label, days in DEADLINE_RELATIVE_DAYS.items():
+        if label in deadline:
+            return days
+    match = DEADLINE_DATE_PATTERN.search(deadline)
+    if not match:
+        return None
+    month, day = (int(group) for group in match.groups())
+    try:
+        closes = date(today.year, month, day)
+    except ValueError:
+        return None
+    if (today - closes).days > 180:  # 연말에 표시된 내년 초 마감일
+        closes = date(today.year + 1, month, day)
+    return (closes - today).days
+
+class CandidateRanker:
+    """키워드별 과거 지원 수와 공고 정보로 후보 점수 계산"""
+
+    def __init__(self, keyword_counts, today=None):
+        self.today = today or date.today()
+        # 과거 지원 수는 로그 스케일로 줄여 가장 많이 지원한 키워드를 1로 정규화
+        scaled = {keyword: math.log1p(max(count, 0)) for keyword, count in (keyword_counts or {}).items()}
+        top = max(scaled.values(), default=0.0)
+        self.keyword_yield = {keyword: value / top for keyword, value in scaled.items()} if top else {}
+        self.stats = {'scored': 0, 'batches': 0}
+
+    def features(self, candidates):
+        """후보별 (등록 후 경과 일수, 마감까지 남은 일수) - 알 수 없으면 None"""
+        ages = []
+        days_left = []
+        for candidate in candidates:
+            registered_at = candidate.registered_at
+            ages.append((self.today - registered_at.date()).days if registered_at else None)
+            days_left.append(deadline_days_left(candidate.deadline, self.today))
+        return ages, days_left
+
+    def score(self, keyword, candidates):
+        """검색 키워드가 같은 후보 목록의 점수 (0~1, 높을수록 먼저 지원)"""
+        if not candidates:
+            return []
+        keyword_yield = self.keyword_yield.get(keyword, 0.0)
+        ages, days_left = self.features(candidates)
+        self.stats['scored'] += len(candidates)
+        self.stats['batches'] += 1
+
+        # 알 수 없는 값(None)은 NaN으로 두고 기본 점수로 대체
+        age = np.maximum(np.array(ages, dtype=float), 0)
+        left = np.maximum(np.array(days_left, dtype=float), 0)
+        freshness = np.where(np.isnan(age), UNKNOWN_FRESHNESS, np.exp2(-age / FRESHNESS_HALF_LIFE_DAYS))
+        urgency = np.where(np.isnan(left), 0.0, np.exp2(-left / DEADLINE_HALF_LIFE_DAYS))
+        scores = (KEYWORD_YIELD_WEIGHT * keyword_yield
+                  + FRESHNESS_WEIGHT * freshness
+                  + DEADLINE_WEIGHT * urgency)
+        return scores.tolist()
@@ -0,0 +1,66 @@
+"""
+지원 후보 우선순위 테스트
+Unit tests for deadline parsing and CandidateRanker scores
+"""
+
+from datetime import date
+
+import pytest
+
+from candidate_ranking import CandidateRanker, deadline_days_left
+from job_candidate import JobCandidate
+
+TODAY = date(2026, 10, 18)
+
+def candidate(deadline=None, registered=None):
+    return JobCandidate(url="u", title="t", company="c", deadline=deadline, registered=registered)
+
+def test_deadline_days_left():
+    """목록의 마감일 표시를 남은 일수로 변환"""
+    assert deadline_days_left("오늘마감", TODAY) == 0
+    assert deadline_days_left("내일마감", TODAY) == 1
+    assert deadline_days_left("~ 10/20(화)", TODAY) == 2
+    assert deadline_days_left("~ 10/01(목)", TODAY) == -17
+    assert deadline_days_left("상시채용", TODAY) is None
+    assert deadline_days_left("~ 02/30", TODAY) is None
+    assert deadline_days_left(None, TODAY) is None
+
+def test_deadline_rolls_over_to_next_year():
+    """연말에 표시된 내년 초 마감일은 다음 해로 계산"""
+    assert deadline_days_left("~ 01/05(화)", TODAY) == 79
+    assert deadline_days_left("~ 12/30", date(2026, 12, 28)) == 2
+
+def test_keyword_yield_is_log_normalized():
+    """과거 지원 수는 로그 스케일로 줄여 최댓값을 1로 정규화"""
+    ranker = CandidateRanker({'a': 10, 'b': 0, 'c': 100}, today=TODAY)
+    assert ranker.keyword_yield['c'] == 1.0
+    assert ranker.keyword_yield['a'] == pytest.approx(0.5195737064824407)
+    assert ranker.keyword_yield['b'] == 0.0
+    assert CandidateRanker({'a': 0}, today=TODAY).keyword_yield == {}
+
+def test_score_combines_yield_freshness_and_urgency():
+    """점수는 키워드 수익률, 최신성, 마감 임박도의 가중합"""
+    ranker = CandidateRanker({'a': 10, 'c': 100}, today=TODAY)
+    candidates = [
+        candidate("~ 10/20(화)", "등록일 26/10/17"),
+        candidate("오늘마감"),
+        candidate("상시채용", "수정일 26/09/01"),
+        candidate(),
+    ]
+    assert ranker.features(candidates) == ([1, None, 47, None], [2, 0, None, None])
+
+    scores = ranker.score('c', candidates)
+    assert scores == pytest.approx([
+        0.5 + 0.3 * 2 ** (-1 / 7) + 0.2 * 2 ** (-2 / 7),
+        0.5 + 0.3 * 0.5 + 0.2,
+        0.5 + 0.3 * 2 ** (-47 / 7),
+        0.5 + 0.3 * 0.5,
+    ])
+    assert ranker.score('unknown', candidates[3:]) == pytest.approx([0.15])
+    assert ranker.score('c', []) == []
+    assert ranker.stats == {'scored': 5, 'batches': 2}
+
+def test_past_deadline_counts_as_most_urgent():
+    """이미 지난 마감일과 미래 등록일은 0일로 보정"""
+    ranker = CandidateRanker({}, today=TODAY)
+    assert ranker.score('a', [candidate("~ 10/01", "등록일 26/10/20")]) == pytest.approx([0.5])
@@ -0,0 +1,59 @@
+"""
+실행 단위 후보 공고 레지스트리 모듈
+Run-scoped candidate registry that merges hits across overlapping keywords
+
+겹치는 키워드(예: 바이오, 생명공학, 제약)는 같은 공고를 여러 번 반환한다.
+공고 번호(rec_idx)를 기준으로 한 실행 안에서 처음 본 후보만 평가/방문하도록 넘겨주고,
+공고마다 검색된 키워드를 모두 기록하여 키워드별 중복 통계를 만든다.
+"""
+
+class CandidateRegistry:
+    """한 실행에서 본 후보 공고와 공고별 검색 키워드"""
+
+    def __init__(self):
+        self._keywords = {}  # 공고 ID -> 검색된 키워드 목록 (처음 검색된 순서)
+        self.keyword_stats = {}
+
+    @staticmethod
+    def canonical_id(candidate):
+        """공고 식별값 (키워드마다 달라지는 URL 대신 공고 번호, 번호가 없으면 URL)"""
+        return candidate.rec_idx or candidate.url
+
+    def register(self, keyword, candidates):
+        """키워드의 검색 결과를 기록하고 이번 실행에서 처음 본 후보만 반환"""
+        stats = self.keyword_stats.setdefault(keyword, {
+            'results': 0,
+            'new': 0,
+            'overlap': 0,
+            'overlap_with': {}
+        })
+
+        fresh = []
+        for candidate in candidates:
+            job_id = self.canonical_id(candidate)
+            matched = self._keywords.get(job_id)
+            stats['results'] += 1
+            if matched is None:
+                self._keywords[job_id] = [keyword]
+                stats['new'] += 1
+                fresh.append(candidate)
+                continue
+            if keyword in matched:
+                continue  # 같은 키워드의 다음 페이지에서 다시 나온 공고
+            stats['overlap'] += 1
+            for other in matched:
+                stats['overlap_with'][other] = stats['overlap_with'].get(other, 0) + 1
+            matched.append(keyword)
+        return fresh
+
+    def keywords_for(self, candidate):
+        """후보 공고가 검색된 모든 키워드"""
+        return list(self._keywords.get(self.canonical_id(candidate), []))
+
+    def __len__(self):
+        return len(self._keywords)
+
+    def summary(self):
+        """키워드별 결과/신규/중복 수 (실행 기록 저장용)"""
+        return {keyword: {**stats, 'overlap_with': dict(stats['overlap_with'])}
+                for keyword, stats in self.keyword_stats.items()}
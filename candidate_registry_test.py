@@ -0,0 +1,50 @@
+"""
+후보 공고 레지스트리 테스트
+Unit tests for CandidateRegistry keyword overlap statistics
+"""
+
+from candidate_registry import CandidateRegistry
+from job_candidate import JobCandidate
+
+def candidate(rec_idx, nonce="1"):
+    """같은 공고라도 검색마다 URL이 달라지는 후보"""
+    url = f"https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx={rec_idx}&relayNonce={nonce}"
+    return JobCandidate(url=url, title=f"공고 {rec_idx}", company="회사", rec_idx=rec_idx)
+
+def test_register_returns_first_seen_candidates():
+    """여러 키워드에서 검색된 공고는 처음 한 번만 반환"""
+    registry = CandidateRegistry()
+    assert registry.register("바이오", [candidate("1"), candidate("2")]) == [candidate("1"), candidate("2")]
+
+    fresh = registry.register("제약", [candidate("2", nonce="9"), candidate("3")])
+    assert [item.rec_idx for item in fresh] == ["3"]
+    assert len(registry) == 3
+    assert registry.keywords_for(candidate("2")) == ["바이오", "제약"]
+    assert registry.keywords_for(candidate("4")) == []
+
+def test_overlap_statistics():
+    """키워드별 결과/신규/중복 수와 겹친 키워드"""
+    registry = CandidateRegistry()
+    registry.register("바이오", [candidate("1"), candidate("2")])
+    registry.register("생명공학", [candidate("1"), candidate("3")])
+    registry.register("제약", [candidate("1"), candidate("2")])
+    # 같은 키워드의 다음 페이지에서 다시 나온 공고는 중복으로 세지 않음
+    registry.register("제약", [candidate("1")])
+
+    summary = registry.summary()
+    assert summary["바이오"] == {'results': 2, 'new': 2, 'overlap': 0, 'overlap_with': {}}
+    assert summary["생명공학"] == {'results': 2, 'new': 1, 'overlap': 1, 'overlap_with': {"바이오": 1}}
+    assert summary["제약"] == {
+        'results': 3,
+        'new': 0,
+        'overlap': 2,
+        'overlap_with': {"바이오": 2, "생명공학": 1}
+    }
+
+def test_candidate_without_rec_idx_uses_url():
+    """공고 번호가 없으면 URL로 식별"""
+    registry = CandidateRegistry()
+    item = JobCandidate(url="https://example.com/job", title="공고", company="회사")
+    assert registry.register("a", [item]) == [item]
+    assert registry.register("b", [item]) == []
+    assert registry.keywords_for(item) == ["a", "b"]
@@ -17,8 +17,8 @@ class Config:
         
         # 마지막 사용 설정 불러오기 (데이터베이스 우선, 환경변수는 백업)
         try:
-            from postgres_database import PostgresApplicationDatabase
-            db = PostgresApplicationDatabase()
+            from storage import create_database
+            db = create_database()
             
             # 검색 조건 - 데이터베이스에서 마지막 사용한 값 우선 사용
             last_keywords = db.get_last_used_keywords()
@@ -44,13 +44,39 @@ class Config:
         # 지원 설정
         self.max_pages = int(os.getenv("MAX_PAGES", "5"))
         
+        # 검색 단계가 지원 단계보다 앞서 쌓아 둘 수 있는 후보 수 (가득 차면 검색 일시 중지)
+        self.candidate_queue_size = int(os.getenv("CANDIDATE_QUEUE_SIZE", "100"))
+        
+        # 상세 페이지 파싱 결과 캐시 유효 시간 (이 시간 안에 확인한 마감/지원 불가 공고는 방문 생략, 0이면 사용 안 함)
+        self.job_posting_cache_hours = int(os.getenv("JOB_POSTING_CACHE_HOURS", "24"))
+        
         # 대기 시간 설정 (초)
         self.min_delay_between_applications = int(os.getenv("MIN_DELAY_BETWEEN_APPLICATIONS", "30"))
         self.max_delay_between_applications = int(os.getenv("MAX_DELAY_BETWEEN_APPLICATIONS", "60"))
         
+        # 페이지 이동 후 조건 대기 최대 시간 (초, 조건 충족 시 즉시 진행)
+        self.page_wait_timeout = int(os.getenv("PAGE_WAIT_TIMEOUT", "10"))
+        
         # 브라우저 설정
         self.headless = os.getenv("HEADLESS", "false").lower() == "true"
         
+        # 페이지 로드 전략 (eager: DOMContentLoaded 후 진행, normal: 모든 리소스 로드 후 진행)
+        self.page_load_strategy = os.getenv("PAGE_LOAD_STRATEGY", "eager").lower()
+        
+        # 이미지/글꼴/광고 등 불필요한 리소스 차단 (추가 차단/예외 URL 패턴은 쉼표로 구분)
+        self.resource_blocking = os.getenv("RESOURCE_BLOCKING", "true").lower() == "true"
+        self.resource_block_patterns = [pattern.strip() for pattern in os.getenv("RESOURCE_BLOCK_PATTERNS", "").split(",") if pattern.strip()]
+        self.resource_allow_patterns = [pattern.strip() for pattern in os.getenv("RESOURCE_ALLOW_PATTERNS", "").split(",") if pattern.strip()]
+        
+        # 계정별 영구 브라우저 프로필 폴더 (로그인 세션/디스크 캐시 유지, 비어 있으면 매번 새 프로필)
+        self.browser_profile_dir = os.getenv("BROWSER_PROFILE_DIR", "browser_profiles")
+        
+        # 웹 앱 드라이버 풀 (미리 실행해 둘 브라우저 수, 0이면 사용 안 함)
+        self.driver_pool_size = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+        self.driver_pool_max_navigations = int(os.getenv("DRIVER_POOL_MAX_NAVIGATIONS", "300"))
+        self.driver_pool_max_memory_mb = int(os.getenv("DRIVER_POOL_MAX_MEMORY_MB", "1024"))
+        self.driver_pool_acquire_timeout = int(os.getenv("DRIVER_POOL_ACQUIRE_TIMEOUT", "60"))
+        
         # 로그 설정
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
         self.log_file = os.getenv("LOG_FILE", "saramin_bot.log")
@@ -58,6 +84,15 @@ class Config:
         # 데이터베이스 설정
         self.db_file = os.getenv("DB_FILE", "applications.db")
         
+        # 지원 기록을 백그라운드에서 일괄 저장 (종료 시 자동 저장)
+        self.write_behind = os.getenv("WRITE_BEHIND", "true").lower() == "true"
+        
+        # 지원 이력 Bloom 필터 파일 (대용량 이력용, 비어 있으면 메모리 집합 사용)
+        self.applied_index_bloom_file = os.getenv("APPLIED_INDEX_BLOOM_FILE", "")
+        
+        # 방문한 상세 페이지 HTML 저장 폴더 (비어 있으면 저장 안 함, 파서 벤치마크용)
+        self.detail_page_save_dir = os.getenv("DETAIL_PAGE_SAVE_DIR", "")
+        
         self.validate_config()
     
     def validate_config(self):
@@ -76,3 +111,12 @@ class Config:
         
         if self.max_delay_between_applications < self.min_delay_between_applications:
             raise ValueError("최대 대기 시간은 최소 대기 시간 이상이어야 합니다.")
+        
+        if self.job_posting_cache_hours < 0:
+            raise ValueError("공고 캐시 유효 시간은 0 이상이어야 합니다.")
+        
+        if self.candidate_queue_size <= 0:
+            raise ValueError("후보 큐 크기는 1 이상이어야 합니다.")
+        
+        if self.page_load_strategy not in ("normal", "eager", "none"):
+            raise ValueError("페이지 로드 전략은 normal, eager, none 중 하나여야 합니다.")
@@ -0,0 +1,106 @@
+"""
+설정 캐시 모듈
+In-process cache for user_configurations with cross-process version checks
+
+user_configurations 전체를 한 번의 쿼리로 읽어 메모리에서 조회하고,
+저장 시에는 데이터베이스에 먼저 쓴 뒤(write-through) 캐시를 갱신한다.
+다른 프로세스의 변경은 버전 카운터 행(CONFIG_VERSION_KEY)으로 감지한다.
+"""
+
+import os
+import threading
+import time
+
+# 설정이 바뀔 때마다 1씩 증가하는 버전 카운터 행의 키
+CONFIG_VERSION_KEY = "_config_version"
+
+# 다른 프로세스의 변경 여부를 다시 확인하기까지의 간격 (초)
+DEFAULT_CHECK_INTERVAL = float(os.getenv("CONFIG_CACHE_TTL", "5"))
+
+class ConfigurationCache:
+    """user_configurations 전체를 담는 프로세스 내 캐시
+
+    load_all()은 {키: 값} 전체(버전 행 포함)를, read_version()은 버전 카운터만,
+    write_many(items)는 {키: (값, 설명)}을 한 트랜잭션으로 저장하고 새 버전을 반환한다.
+    """
+
+    def __init__(self, load_all, read_version, write_many, check_interval=DEFAULT_CHECK_INTERVAL):
+        self.load_all = load_all
+        self.read_version = read_version
+        self.write_many = write_many
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._values = None
+        self._version = None
+        self._checked_at = 0.0
+        self.stats = {
+            'hits': 0,
+            'loads': 0,
+            'version_checks': 0,
+            'writes': 0
+        }
+
+    def get(self, key, default_value=None):
+        """설정값 조회 (캐시가 오래되었으면 버전 확인 후 필요할 때만 다시 읽음)"""
+        with self._lock:
+            self._ensure_fresh()
+            self.stats['hits'] += 1
+            return self._values.get(key, default_value)
+
+    def get_all(self):
+        """전체 설정 사본 조회"""
+        with self._lock:
+            self._ensure_fresh()
+            return dict(self._values)
+
+    def set_many(self, items):
+        """설정값 여러 개를 한 번에 저장하고 캐시 갱신"""
+        if not items:
+            return
+        with self._lock:
+            version = self.write_many(items)
+            self.stats['writes'] += 1
+            if self._values is not None and version == (self._version or 0) + 1:
+                # 다른 프로세스의 변경이 끼어들지 않았으면 캐시만 갱신
+                for key, (value, _) in items.items():
+                    self._values[key] = str(value)
+                self._version = version
+                self._checked_at = time.monotonic()
+            else:
+                self._values = None
+
+    def invalidate(self):
+        """캐시 무효화 (다음 조회 시 다시 읽음)"""
+        with self._lock:
+            self._values = None
+
+    def _ensure_fresh(self):
+        """캐시가 비었거나 버전이 바뀌었으면 전체 다시 읽기"""
+        now = time.monotonic()
+        if self._values is not None:
+            if now - self._checked_at < self.check_interval:
+                return
+            self.stats['version_checks'] += 1
+            if self.read_version() == self._version:
+                self._checked_at = now
+                return
+
+        values = self.load_all()
+        self.stats['loads'] += 1
+        self._version = int(values.pop(CONFIG_VERSION_KEY, 0) or 0)
+        self._values = values
+        self._checked_at = now
+
+_configuration_caches = {}
+_configuration_caches_lock = threading.Lock()
+
+def get_configuration_cache(key, factory):
+    """저장소별 설정 캐시 조회 (최초 호출 시 생성)"""
+    cache = _configuration_caches.get(key)
+    if cache is None:
+        with _configuration_caches_lock:
+            cache = _configuration_caches.get(key)
+            if cache is None:
+                cache = factory()
+                _configuration_caches[key] = cache
+    return cache
@@ -0,0 +1,88 @@
+"""
+설정 캐시 테스트
+Unit tests for ConfigurationCache version-based invalidation
+"""
+
+from config_cache import ConfigurationCache, CONFIG_VERSION_KEY
+
+class FakeConfigStore:
+    """user_configurations 테이블을 흉내 내는 메모리 저장소"""
+
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+        self.version = 0
+        self.load_calls = 0
+
+    def load_all(self):
+        self.load_calls += 1
+        values = dict(self.values)
+        values[CONFIG_VERSION_KEY] = str(self.version)
+        return values
+
+    def read_version(self):
+        return self.version
+
+    def write_many(self, items):
+        for key, (value, _) in items.items():
+            self.values[key] = str(value)
+        self.version += 1
+        return self.version
+
+def make_cache(store, check_interval=0):
+    return ConfigurationCache(store.load_all, store.read_version, store.write_many, check_interval)
+
+def test_get_loads_once_while_version_unchanged():
+    """버전이 그대로면 다시 읽지 않음"""
+    store = FakeConfigStore({'max_applications': '10'})
+    cache = make_cache(store)
+
+    assert cache.get('max_applications') == '10'
+    assert cache.get('max_applications') == '10'
+    assert cache.get('missing', 'default') == 'default'
+    assert store.load_calls == 1
+    assert cache.stats['version_checks'] == 2
+    assert CONFIG_VERSION_KEY not in cache.get_all()
+
+def test_other_writer_invalidates_cache():
+    """다른 프로세스가 설정을 바꿔 버전이 오르면 전체를 다시 읽음"""
+    store = FakeConfigStore({'max_applications': '10'})
+    cache = make_cache(store)
+    assert cache.get('max_applications') == '10'
+
+    store.write_many({'max_applications': (20, '')})
+    assert cache.get('max_applications') == '20'
+    assert store.load_calls == 2
+
+def test_check_interval_skips_version_reads():
+    """check_interval 안에서는 버전도 확인하지 않음"""
+    store = FakeConfigStore({'key': 'a'})
+    cache = make_cache(store, check_interval=3600)
+    assert cache.get('key') == 'a'
+
+    store.write_many({'key': ('b', '')})
+    assert cache.get('key') == 'a'
+    assert cache.stats['version_checks'] == 0
+
+    cache.invalidate()
+    assert cache.get('key') == 'b'
+
+def test_set_many_updates_cache_in_place():
+    """자신의 쓰기만 있었으면 다시 읽지 않고 캐시를 갱신"""
+    store = FakeConfigStore({'key': 'a'})
+    cache = make_cache(store)
+    cache.get('key')
+
+    cache.set_many({'key': ('b', '설명'), 'new_key': (3, '설명')})
+    assert cache.get_all() == {'key': 'b', 'new_key': '3'}
+    assert store.load_calls == 1
+
+def test_set_many_reloads_after_concurrent_write():
+    """그 사이 다른 쓰기가 끼어들어 버전이 두 칸 이상 오르면 캐시를 버림"""
+    store = FakeConfigStore({'key': 'a', 'other': 'x'})
+    cache = make_cache(store, check_interval=3600)
+    cache.get('key')
+
+    store.write_many({'other': ('y', '')})
+    cache.set_many({'key': ('b', '')})
+    assert cache.get_all() == {'key': 'b', 'other': 'y'}
+    assert store.load_calls == 2
@@ -1,194 +1,930 @@
 """
 데이터베이스 관리 모듈
-Database management module for tracking applications
+SQLite database management module for tracking applications
+
+PostgreSQL 저장소(postgres_database.py)와 같은 메서드와 스키마를 제공하는 임베디드 구현.
+스레드마다 WAL 모드 연결 하나를 유지하고, 고정된 SQL 문을 재사용하여
+sqlite3의 prepared statement 캐시를 활용한다. 요청/스레드 종료 시
+close_thread_connections()로 연결을 닫고, 닫지 않고 끝난 스레드의 연결은
+새 연결을 만들 때 정리하여 열린 연결 수가 살아 있는 스레드 수를 넘지 않게 한다.
 """
 
 import sqlite3
 import os
-from datetime import datetime, date
+import json
+import threading
+from datetime import datetime, date, timedelta
 from contextlib import contextmanager
+from config_cache import CONFIG_VERSION_KEY
+from storage import ApplicationStore, HISTORY_PAGE_SIZE, SEARCH_CURSOR_KEY, encode_cursor, decode_cursor, clamp_page_size
+from job_candidate import canonical_job_id_updates
+
+SCHEMA_VERSION = 9
+
+SCHEMA_STATEMENTS = [
+    '''
+    CREATE TABLE IF NOT EXISTS job_applications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        job_id TEXT UNIQUE NOT NULL,
+        job_url TEXT NOT NULL,
+        company_name TEXT NOT NULL,
+        job_title TEXT NOT NULL,
+        keyword TEXT,
+        application_date TIMESTAMP NOT NULL,
+        status TEXT NOT NULL DEFAULT 'applied',
+        created_at TIMESTAMP NOT NULL,
+        updated_at TIMESTAMP NOT NULL
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS ix_job_applications_company_date ON job_applications(company_name, application_date)',
+    'CREATE INDEX IF NOT EXISTS ix_job_applications_date_id ON job_applications(application_date, id)',
+    'DROP INDEX IF EXISTS ix_job_applications_application_date',
+    '''
+    CREATE TABLE IF NOT EXISTS daily_application_rollup (
+        rollup_date TEXT NOT NULL,
+        keyword TEXT NOT NULL DEFAULT '',
+        application_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (rollup_date, keyword)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS execution_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        execution_date TEXT UNIQUE NOT NULL,
+        applications_count INTEGER NOT NULL DEFAULT 0,
+        keywords_searched TEXT,
+        keyword_stats TEXT,
+        start_time TIMESTAMP,
+        end_time TIMESTAMP,
+        status TEXT NOT NULL DEFAULT 'completed',
+        error_message TEXT,
+        created_at TIMESTAMP NOT NULL,
+        updated_at TIMESTAMP NOT NULL
+    )
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS ix_execution_logs_created_at_keywords
+        ON execution_logs(created_at) WHERE keywords_searched IS NOT NULL
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS user_configurations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        config_key TEXT UNIQUE NOT NULL,
+        config_value TEXT,
+        description TEXT,
+        created_at TIMESTAMP NOT NULL,
+        updated_at TIMESTAMP NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS system_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        log_level TEXT NOT NULL,
+        message TEXT NOT NULL,
+        module TEXT,
+        function_name TEXT,
+        execution_id INTEGER,
+        created_at TIMESTAMP NOT NULL
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS ix_system_logs_log_level ON system_logs(log_level)',
+    'CREATE INDEX IF NOT EXISTS ix_system_logs_created_at ON system_logs(created_at)',
+    '''
+    CREATE TABLE IF NOT EXISTS selector_stats (
+        page_type TEXT NOT NULL,
+        selector TEXT NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        hits INTEGER NOT NULL DEFAULT 0,
+        last_hit_at TIMESTAMP,
+        PRIMARY KEY (page_type, selector)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS search_watermarks (
+        keyword TEXT NOT NULL,
+        location TEXT NOT NULL,
+        newest_rec_idx INTEGER NOT NULL,
+        newest_registered_at TIMESTAMP,
+        updated_at TIMESTAMP NOT NULL,
+        PRIMARY KEY (keyword, location)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS search_cursors (
+        name TEXT PRIMARY KEY,
+        cursor_value TEXT NOT NULL,
+        updated_at TIMESTAMP NOT NULL
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS job_postings (
+        job_id TEXT PRIMARY KEY,
+        job_url TEXT NOT NULL,
+        title TEXT,
+        company_name TEXT,
+        deadline TEXT,
+        apply_mode TEXT,
+        has_apply_button INTEGER NOT NULL DEFAULT 0,
+        has_apply_text INTEGER NOT NULL DEFAULT 0,
+        content_hash TEXT NOT NULL,
+        last_seen_at TIMESTAMP NOT NULL,
+        last_fetched_at TIMESTAMP NOT NULL
+    ) WITHOUT ROWID
+    ''',
+]
+
+INSERT_APPLICATION_SQL = '''
+    INSERT INTO job_applications
+        (job_id, job_url, company_name, job_title, keyword, application_date, status, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, 'applied', ?, ?)
+'''
+
+UPSERT_ROLLUP_SQL = '''
+    INSERT INTO daily_application_rollup (rollup_date, keyword, application_count)
+    VALUES (?, ?, ?)
+    ON CONFLICT (rollup_date, keyword)
+    DO UPDATE SET application_count = application_count + excluded.application_count
+'''
+
+INSERT_SYSTEM_LOG_SQL = '''
+    INSERT INTO system_logs (log_level, message, module, function_name, execution_id, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+# 스레드별 영구 연결 {파일 경로: 연결} - 같은 파일을 쓰는 인스턴스끼리 공유
+_thread_connections = threading.local()
+_open_connections = {}  # 파일 경로 -> {스레드: 연결}
+_connections_lock = threading.Lock()
+_initialized_files = set()
+
+def _close_dead_thread_connections():
+    """연결을 닫지 않고 종료된 스레드의 연결 정리 (_connections_lock 보유 상태에서 호출)"""
+    for connections in _open_connections.values():
+        for thread in [thread for thread in connections if not thread.is_alive()]:
+            connections.pop(thread).close()
+
+def close_thread_connections():
+    """현재 스레드가 연 모든 파일의 연결 닫기 (요청/스레드 종료 시 호출)"""
+    connections = getattr(_thread_connections, 'by_path', None)
+    if not connections:
+        return
+    thread = threading.current_thread()
+    with _connections_lock:
+        for db_path, conn in connections.items():
+            _open_connections.get(db_path, {}).pop(thread, None)
+            conn.close()
+    connections.clear()
+
+def to_timestamp(value):
+    """datetime을 정렬 가능한 문자열로 변환"""
+    return value.isoformat(sep=' ', timespec='microseconds')
+
+def from_timestamp(value):
+    """저장된 문자열을 datetime으로 변환"""
+    return datetime.fromisoformat(value) if value else None
+
+class ApplicationDatabase(ApplicationStore):
+    """SQLite 기반 애플리케이션 데이터베이스"""
 
-class ApplicationDatabase:
     def __init__(self, db_file="applications.db"):
         self.db_file = db_file
+        self.db_path = os.path.abspath(db_file)
+        self.write_queue_key = f"sqlite:{self.db_path}"
         self.init_database()
-    
-    def init_database(self):
-        """데이터베이스 초기화"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # 지원 기록 테이블 생성
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS applications (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    job_id TEXT UNIQUE NOT NULL,
-                    job_url TEXT NOT NULL,
-                    company_name TEXT,
-                    job_title TEXT,
-                    applied_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # 실행 기록 테이블 생성
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS execution_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    execution_date DATE UNIQUE NOT NULL,
-                    applications_count INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # 인덱스 생성
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_job_id ON applications(job_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_execution_date ON execution_log(execution_date)')
-            
-            conn.commit()
-    
+
+    def _connect(self):
+        """현재 스레드의 영구 연결 (최초 사용 시 생성)"""
+        connections = getattr(_thread_connections, 'by_path', None)
+        if connections is None:
+            connections = _thread_connections.by_path = {}
+
+        conn = connections.get(self.db_path)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, cached_statements=256, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=5000')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            connections[self.db_path] = conn
+            with _connections_lock:
+                _close_dead_thread_connections()
+                _open_connections.setdefault(self.db_path, {})[threading.current_thread()] = conn
+        return conn
+
     @contextmanager
     def get_connection(self):
-        """데이터베이스 연결 컨텍스트 매니저"""
-        conn = sqlite3.connect(self.db_file)
-        conn.row_factory = sqlite3.Row
+        """데이터베이스 연결 컨텍스트 매니저 (예외 시 롤백)"""
+        conn = self._connect()
         try:
             yield conn
-        finally:
+        except Exception:
+            conn.rollback()
+            raise
+
+    def close(self):
+        """현재 스레드의 연결 닫기"""
+        connections = getattr(_thread_connections, 'by_path', {})
+        conn = connections.pop(self.db_path, None)
+        if conn is not None:
+            with _connections_lock:
+                _open_connections.get(self.db_path, {}).pop(threading.current_thread(), None)
             conn.close()
-    
+
+    def init_database(self):
+        """데이터베이스 초기화 (프로세스당 1회, user_version으로 스키마 버전 관리)"""
+        if self.db_path in _initialized_files:
+            return
+
+        with self.get_connection() as conn:
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if version < SCHEMA_VERSION:
+                with conn:
+                    for statement in SCHEMA_STATEMENTS:
+                        conn.execute(statement)
+                    if version < 1:
+                        self._migrate_legacy_tables(conn)
+                    self._add_missing_columns(conn)
+                    if version < 7:
+                        self._canonicalize_job_ids(conn)
+                    if version < 8:
+                        # 설정 테이블에 저장하던 검색 위치는 search_cursors로 분리
+                        conn.execute('DELETE FROM user_configurations WHERE config_key = ?', (SEARCH_CURSOR_KEY,))
+                    if version < 9:
+                        # 일치한 모든 선택자를 적중으로 집계하던 통계는 순서 학습을 왜곡하므로 초기화
+                        conn.execute('DELETE FROM selector_stats')
+                    conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+        _initialized_files.add(self.db_path)
+
+    def _add_missing_columns(self, conn):
+        """이전 버전에서 만든 테이블에 새 컬럼 추가"""
+        columns = {row['name'] for row in conn.execute('PRAGMA table_info(execution_logs)')}
+        if 'keyword_stats' not in columns:
+            conn.execute('ALTER TABLE execution_logs ADD COLUMN keyword_stats TEXT')
+
+    def _canonicalize_job_ids(self, conn):
+        """기존 지원 기록의 job_id를 URL 해시에서 사람인 공고 번호(rec_idx)로 변경"""
+        rows = conn.execute('SELECT id, job_id, job_url FROM job_applications').fetchall()
+        updates = canonical_job_id_updates([tuple(row) for row in rows], (row[1] for row in rows))
+        conn.executemany('UPDATE job_applications SET job_id = ? WHERE id = ?',
+                         [(job_id, row_id) for row_id, job_id in updates])
+
+    def _migrate_legacy_tables(self, conn):
+        """이전 스키마(applications, execution_log)의 기록 옮기기"""
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+        if 'applications' in tables:
+            conn.execute('''
+                INSERT OR IGNORE INTO job_applications
+                    (job_id, job_url, company_name, job_title, application_date, status, created_at, updated_at)
+                SELECT job_id, job_url, COALESCE(company_name, ''), COALESCE(job_title, ''),
+                       applied_date, 'applied', created_at, created_at
+                FROM applications
+            ''')
+            conn.execute('DELETE FROM daily_application_rollup')
+            conn.execute('''
+                INSERT INTO daily_application_rollup (rollup_date, keyword, application_count)
+                SELECT date(application_date), COALESCE(keyword, ''), COUNT(*)
+                FROM job_applications
+                GROUP BY date(application_date), COALESCE(keyword, '')
+            ''')
+
+        if 'execution_log' in tables:
+            conn.execute('''
+                INSERT OR IGNORE INTO execution_logs
+                    (execution_date, applications_count, status, created_at, updated_at)
+                SELECT execution_date, applications_count, 'completed', created_at, created_at
+                FROM execution_log
+            ''')
+
+    def get_pool_status(self):
+        """연결 상태 조회"""
+        with _connections_lock:
+            open_connections = len(_open_connections.get(self.db_path, ()))
+        return {
+            'initialized': open_connections > 0,
+            'backend': 'sqlite',
+            'db_file': self.db_file,
+            'pool_size': open_connections,
+            'checked_in': 0,
+            'checked_out': open_connections,
+            'overflow': 0
+        }
+
     def is_already_applied(self, job_id):
         """중복 지원 확인"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT COUNT(*) FROM applications WHERE job_id = ?",
-                (job_id,)
-            )
-            return cursor.fetchone()[0] > 0
-    
-    def record_application(self, job_id, job_url, company_name, job_title):
-        """지원 기록 저장"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            try:
-                cursor.execute('''
-                    INSERT INTO applications (job_id, job_url, company_name, job_title)
-                    VALUES (?, ?, ?, ?)
-                ''', (job_id, job_url, company_name, job_title))
-                conn.commit()
-                return True
-            except sqlite3.IntegrityError:
-                # 이미 지원한 경우
-                return False
-    
+            row = conn.execute('SELECT 1 FROM job_applications WHERE job_id = ? LIMIT 1', (job_id,)).fetchone()
+            return row is not None
+
+    def is_company_already_applied(self, company_name, days=30):
+        """회사명 기반 중복 지원 확인 (최근 30일 내)"""
+        cutoff_date = to_timestamp(datetime.now() - timedelta(days=days))
+        with self.get_connection() as conn:
+            row = conn.execute(
+                'SELECT 1 FROM job_applications WHERE company_name = ? AND application_date >= ? LIMIT 1',
+                (company_name, cutoff_date)
+            ).fetchone()
+            return row is not None
+
+    def find_applied(self, job_ids, company_names, days=30):
+        """후보 공고 중 이미 지원한 job_id와 최근 days일 내 지원한 회사를 한 번의 쿼리로 조회"""
+        job_ids = list(set(job_ids))
+        company_names = list(set(company_names))
+        if not job_ids and not company_names:
+            return {'job_ids': set(), 'companies': set()}
+
+        cutoff_date = to_timestamp(datetime.now() - timedelta(days=days))
+        job_placeholders = ', '.join('?' * len(job_ids)) or 'NULL'
+        company_placeholders = ', '.join('?' * len(company_names)) or 'NULL'
+        with self.get_connection() as conn:
+            rows = conn.execute(f'''
+                SELECT job_id, company_name, application_date FROM job_applications
+                WHERE job_id IN ({job_placeholders})
+                   OR (company_name IN ({company_placeholders}) AND application_date >= ?)
+            ''', (*job_ids, *company_names, cutoff_date)).fetchall()
+
+        requested_job_ids = set(job_ids)
+        requested_companies = set(company_names)
+        return {
+            'job_ids': {row['job_id'] for row in rows if row['job_id'] in requested_job_ids},
+            'companies': {row['company_name'] for row in rows
+                          if row['company_name'] in requested_companies and row['application_date'] >= cutoff_date}
+        }
+
+    def get_dedup_snapshot(self, days=30, since_id=0):
+        """중복 확인 인덱스용 지원 이력 일괄 조회"""
+        cutoff = datetime.now() - timedelta(days=days)
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                '''
+                SELECT id, job_id, company_name, application_date FROM job_applications
+                WHERE id > ? OR application_date >= ?
+                ''',
+                (since_id, to_timestamp(cutoff))
+            ).fetchall()
+
+        job_ids = []
+        companies = {}
+        max_id = since_id
+        for row_id, job_id, company_name, application_date in rows:
+            if row_id > since_id:
+                job_ids.append(job_id)
+                max_id = max(max_id, row_id)
+            application_date = from_timestamp(application_date)
+            if application_date >= cutoff:
+                last_applied = companies.get(company_name)
+                if last_applied is None or application_date > last_applied:
+                    companies[company_name] = application_date
+
+        return {'job_ids': job_ids, 'companies': companies, 'max_id': max_id}
+
+    def record_application(self, job_id, job_url, company_name, job_title, keyword=None, defer=False):
+        """지원 기록 저장 (중복은 job_id 유니크 제약으로 판정)
+
+        defer=True이면 지연 쓰기 큐에 넣고 바로 반환한다 (이미 지원한 job_id이거나 직접 저장에 실패하면 False).
+        """
+        if defer:
+            return self._defer_application({
+                'job_id': job_id,
+                'job_url': job_url,
+                'company_name': company_name,
+                'job_title': job_title,
+                'keyword': keyword,
+                'application_date': datetime.now()
+            })
+
+        try:
+            return self.record_applications_batch([{
+                'job_id': job_id,
+                'job_url': job_url,
+                'company_name': company_name,
+                'job_title': job_title,
+                'keyword': keyword,
+                'application_date': datetime.now()
+            }]) == 1
+        except Exception as e:
+            print(f"지원 기록 저장 오류: {str(e)}")
+            return False
+
+    def record_applications_batch(self, applications):
+        """지원 기록 일괄 저장 (중복 job_id는 건너뜀)"""
+        now = to_timestamp(datetime.now())
+        inserted = 0
+        rollup_counts = {}
+
+        with self.get_connection() as conn:
+            with conn:
+                for application in applications:
+                    application_date = application['application_date']
+                    try:
+                        conn.execute(INSERT_APPLICATION_SQL, (
+                            application['job_id'],
+                            application['job_url'],
+                            application['company_name'],
+                            application['job_title'],
+                            application.get('keyword'),
+                            to_timestamp(application_date),
+                            now,
+                            now
+                        ))
+                    except sqlite3.IntegrityError:
+                        continue
+
+                    inserted += 1
+                    key = (application_date.date().isoformat(), application.get('keyword') or '')
+                    rollup_counts[key] = rollup_counts.get(key, 0) + 1
+
+                conn.executemany(UPSERT_ROLLUP_SQL, [
+                    (rollup_date, keyword, count) for (rollup_date, keyword), count in rollup_counts.items()
+                ])
+
+        return inserted
+
     def is_executed_today(self, execution_date):
         """당일 실행 여부 확인"""
-        if isinstance(execution_date, datetime):
-            execution_date = execution_date.date()
-        
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT COUNT(*) FROM execution_log WHERE execution_date = ?",
-                (execution_date,)
-            )
-            return cursor.fetchone()[0] > 0
-    
-    def record_execution(self, execution_date, applications_count):
+        if isinstance(execution_date, date):
+            execution_date = execution_date.strftime('%Y-%m-%d')
+
+        with self.get_connection() as conn:
+            row = conn.execute('SELECT 1 FROM execution_logs WHERE execution_date = ? LIMIT 1', (execution_date,)).fetchone()
+            return row is not None
+
+    def record_execution(self, execution_date, applications_count, keywords=None, status='completed', error_message=None,
+                         keyword_stats=None):
         """실행 기록 저장"""
-        if isinstance(execution_date, datetime):
-            execution_date = execution_date.date()
-        
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO execution_log (execution_date, applications_count)
-                VALUES (?, ?)
-            ''', (execution_date, applications_count))
-            conn.commit()
-    
+        if isinstance(execution_date, date):
+            execution_date = execution_date.strftime('%Y-%m-%d')
+
+        now = to_timestamp(datetime.now())
+        keywords_json = json.dumps(keywords) if keywords else None
+        keyword_stats_json = json.dumps(keyword_stats, ensure_ascii=False) if keyword_stats else None
+
+        try:
+            with self.get_connection() as conn:
+                with conn:
+                    conn.execute('''
+                        INSERT INTO execution_logs
+                            (execution_date, applications_count, keywords_searched, keyword_stats, start_time,
+                             end_time, status, error_message, created_at, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (execution_date) DO UPDATE SET
+                            applications_count = excluded.applications_count,
+                            keywords_searched = excluded.keywords_searched,
+                            keyword_stats = excluded.keyword_stats,
+                            end_time = excluded.end_time,
+                            status = excluded.status,
+                            error_message = excluded.error_message,
+                            updated_at = excluded.updated_at
+                    ''', (execution_date, applications_count, keywords_json, keyword_stats_json, now,
+                          now, status, error_message, now, now))
+            return True
+        except Exception as e:
+            print(f"실행 기록 저장 오류: {str(e)}")
+            return False
+
+    def _application_row_to_dict(self, row):
+        """지원 이력 행을 dict로 변환"""
+        return {
+            'id': row['id'],
+            'job_id': row['job_id'],
+            'company_name': row['company_name'],
+            'job_title': row['job_title'],
+            'keyword': row['keyword'],
+            'application_date': from_timestamp(row['application_date']).isoformat(),
+            'status': row['status']
+        }
+
+    def _execution_row_to_dict(self, row):
+        """실행 이력 행을 dict로 변환"""
+        start_time = from_timestamp(row['start_time'])
+        end_time = from_timestamp(row['end_time'])
+        return {
+            'id': row['id'],
+            'execution_date': row['execution_date'],
+            'applications_count': row['applications_count'],
+            'keywords': json.loads(row['keywords_searched']) if row['keywords_searched'] else [],
+            'keyword_stats': json.loads(row['keyword_stats']) if row['keyword_stats'] else {},
+            'status': row['status'],
+            'start_time': start_time.isoformat() if start_time else None,
+            'end_time': end_time.isoformat() if end_time else None
+        }
+
     def get_application_history(self, days=30):
         """지원 이력 조회"""
+        cutoff_date = to_timestamp(datetime.now() - timedelta(days=days))
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT job_id, job_url, company_name, job_title, applied_date
-                FROM applications
-                WHERE applied_date >= datetime('now', '-{} days')
-                ORDER BY applied_date DESC
-            '''.format(days))
-            return cursor.fetchall()
-    
+            rows = conn.execute('''
+                SELECT id, job_id, company_name, job_title, keyword, application_date, status
+                FROM job_applications
+                WHERE application_date >= ?
+                ORDER BY application_date DESC, id DESC
+            ''', (cutoff_date,)).fetchall()
+
+        return [self._application_row_to_dict(row) for row in rows]
+
+    def get_application_history_page(self, page_size=HISTORY_PAGE_SIZE, cursor=None):
+        """지원 이력 페이지 조회 ((application_date, id) 기준 키셋 페이지네이션)"""
+        page_size = clamp_page_size(page_size)
+        with self.get_connection() as conn:
+            if cursor:
+                cursor_date, cursor_id = decode_cursor(cursor)
+                rows = conn.execute('''
+                    SELECT id, job_id, company_name, job_title, keyword, application_date, status
+                    FROM job_applications
+                    WHERE (application_date, id) < (?, ?)
+                    ORDER BY application_date DESC, id DESC
+                    LIMIT ?
+                ''', (to_timestamp(datetime.fromisoformat(cursor_date)), cursor_id, page_size + 1)).fetchall()
+            else:
+                rows = conn.execute('''
+                    SELECT id, job_id, company_name, job_title, keyword, application_date, status
+                    FROM job_applications
+                    ORDER BY application_date DESC, id DESC
+                    LIMIT ?
+                ''', (page_size + 1,)).fetchall()
+
+        items = [self._application_row_to_dict(row) for row in rows[:page_size]]
+        next_cursor = None
+        if len(rows) > page_size:
+            last = items[-1]
+            next_cursor = encode_cursor(last['application_date'], last['id'])
+        return {'items': items, 'next_cursor': next_cursor}
+
     def get_execution_history(self, days=30):
         """실행 이력 조회"""
+        cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT execution_date, applications_count, created_at
-                FROM execution_log
-                WHERE execution_date >= date('now', '-{} days')
+            rows = conn.execute('''
+                SELECT id, execution_date, applications_count, keywords_searched, keyword_stats, status, start_time, end_time
+                FROM execution_logs
+                WHERE execution_date >= ?
                 ORDER BY execution_date DESC
-            '''.format(days))
-            return cursor.fetchall()
-    
+            ''', (cutoff_date,)).fetchall()
+
+        return [self._execution_row_to_dict(row) for row in rows]
+
+    def get_execution_history_page(self, page_size=HISTORY_PAGE_SIZE, cursor=None):
+        """실행 이력 페이지 조회 ((execution_date, id) 기준 키셋 페이지네이션)"""
+        page_size = clamp_page_size(page_size)
+        with self.get_connection() as conn:
+            if cursor:
+                cursor_date, cursor_id = decode_cursor(cursor)
+                rows = conn.execute('''
+                    SELECT id, execution_date, applications_count, keywords_searched, keyword_stats, status, start_time, end_time
+                    FROM execution_logs
+                    WHERE (execution_date, id) < (?, ?)
+                    ORDER BY execution_date DESC, id DESC
+                    LIMIT ?
+                ''', (cursor_date, cursor_id, page_size + 1)).fetchall()
+            else:
+                rows = conn.execute('''
+                    SELECT id, execution_date, applications_count, keywords_searched, keyword_stats, status, start_time, end_time
+                    FROM execution_logs
+                    ORDER BY execution_date DESC, id DESC
+                    LIMIT ?
+                ''', (page_size + 1,)).fetchall()
+
+        items = [self._execution_row_to_dict(row) for row in rows[:page_size]]
+        next_cursor = None
+        if len(rows) > page_size:
+            last = items[-1]
+            next_cursor = encode_cursor(last['execution_date'], last['id'])
+        return {'items': items, 'next_cursor': next_cursor}
+
     def get_statistics(self):
-        """통계 정보 조회"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # 총 지원 수
-            cursor.execute("SELECT COUNT(*) FROM applications")
-            total_applications = cursor.fetchone()[0]
-            
-            # 이번 주 지원 수
-            cursor.execute('''
-                SELECT COUNT(*) FROM applications
-                WHERE applied_date >= datetime('now', 'weekday 0', '-7 days')
-            ''')
-            week_applications = cursor.fetchone()[0]
-            
-            # 이번 달 지원 수
-            cursor.execute('''
-                SELECT COUNT(*) FROM applications
-                WHERE applied_date >= datetime('now', 'start of month')
-            ''')
-            month_applications = cursor.fetchone()[0]
-            
-            # 가장 많이 지원한 회사
-            cursor.execute('''
-                SELECT company_name, COUNT(*) as count
-                FROM applications
-                GROUP BY company_name
-                ORDER BY count DESC
-                LIMIT 5
-            ''')
-            top_companies = cursor.fetchall()
-            
+        """통계 정보 조회 (일별 집계 테이블 기준)"""
+        today = datetime.now().date()
+        week_start = (today - timedelta(days=6)).isoformat()  # 오늘 포함 최근 7일
+        month_start = today.replace(day=1).isoformat()
+
+        try:
+            with self.get_connection() as conn:
+                rows = conn.execute('''
+                    SELECT keyword,
+                           SUM(application_count),
+                           SUM(CASE WHEN rollup_date = ? THEN application_count ELSE 0 END),
+                           SUM(CASE WHEN rollup_date >= ? THEN application_count ELSE 0 END),
+                           SUM(CASE WHEN rollup_date >= ? THEN application_count ELSE 0 END)
+                    FROM daily_application_rollup
+                    GROUP BY keyword
+                ''', (today.isoformat(), week_start, month_start)).fetchall()
+
+                total_executions = conn.execute(
+                    "SELECT COUNT(*) FROM execution_logs WHERE status = 'completed'"
+                ).fetchone()[0]
+
+                top_companies = conn.execute('''
+                    SELECT company_name, COUNT(*) AS count
+                    FROM job_applications
+                    GROUP BY company_name
+                    ORDER BY count DESC
+                    LIMIT 5
+                ''').fetchall()
+
+            total_applications = today_applications = week_applications = month_applications = 0
+            keyword_counts = {}
+            for keyword, total, today_count, week_count, month_count in rows:
+                total_applications += total or 0
+                today_applications += today_count or 0
+                week_applications += week_count or 0
+                month_applications += month_count or 0
+                if keyword:
+                    keyword_counts[keyword] = total or 0
+
             return {
                 'total_applications': total_applications,
+                'today_applications': today_applications,
                 'week_applications': week_applications,
+                'total_executions': total_executions,
+                'keyword_statistics': keyword_counts,
                 'month_applications': month_applications,
-                'top_companies': top_companies
+                'top_companies': [(row[0], row[1]) for row in top_companies]
+            }
+        except Exception as e:
+            print(f"통계 조회 오류: {str(e)}")
+            return {
+                'total_applications': 0,
+                'today_applications': 0,
+                'week_applications': 0,
+                'total_executions': 0,
+                'keyword_statistics': {},
+                'month_applications': 0,
+                'top_companies': []
+            }
+
+    def _chunked_delete(self, table, column, cutoff, batch_size, progress):
+        """보존 기간이 지난 행을 batch_size개씩 삭제"""
+        total_deleted = 0
+        with self.get_connection() as conn:
+            while True:
+                with conn:
+                    deleted = conn.execute(
+                        f'DELETE FROM {table} WHERE id IN '
+                        f'(SELECT id FROM {table} WHERE {column} < ? ORDER BY id LIMIT ?)',
+                        (cutoff, batch_size)
+                    ).rowcount
+                total_deleted += deleted
+                if deleted:
+                    progress(f"  {table}: {total_deleted}개 삭제")
+                if deleted < batch_size:
+                    return total_deleted
+
+    def cleanup_old_records(self, days=90, batch_size=5000, progress=print):
+        """오래된 기록 정리 (배치 단위 삭제)"""
+        try:
+            cutoff_date = datetime.now() - timedelta(days=days)
+            cutoff_timestamp = to_timestamp(cutoff_date)
+            cutoff_day = cutoff_date.strftime('%Y-%m-%d')
+
+            deleted_apps = self._chunked_delete('job_applications', 'application_date', cutoff_timestamp, batch_size, progress)
+            deleted_logs = self._chunked_delete('execution_logs', 'execution_date', cutoff_day, batch_size, progress)
+            deleted_sys_logs = self._chunked_delete('system_logs', 'created_at', cutoff_timestamp, batch_size, progress)
+
+            with self.get_connection() as conn:
+                with conn:
+                    conn.execute('DELETE FROM daily_application_rollup WHERE rollup_date < ?', (cutoff_day,))
+
+            print(f"정리 완료: 지원기록 {deleted_apps}개, 실행로그 {deleted_logs}개, 시스템로그 {deleted_sys_logs}개")
+            return True
+        except Exception as e:
+            print(f"기록 정리 오류: {str(e)}")
+            return False
+
+    def log_system_message(self, level, message, module=None, function_name=None, execution_id=None, defer=False):
+        """시스템 로그 기록 (defer=True이면 지연 쓰기 큐 사용)"""
+        record = {
+            'log_level': level.upper(),
+            'message': message,
+            'module': module,
+            'function_name': function_name,
+            'execution_id': execution_id,
+            'created_at': datetime.now()
+        }
+        if defer:
+            self._get_write_queue().put('system_log', record)
+            return True
+
+        try:
+            self.log_system_messages_batch([record])
+            return True
+        except Exception as e:
+            print(f"시스템 로그 기록 오류: {str(e)}")
+            return False
+
+    def log_system_messages_batch(self, messages):
+        """시스템 로그 일괄 기록"""
+        with self.get_connection() as conn:
+            with conn:
+                conn.executemany(INSERT_SYSTEM_LOG_SQL, [(
+                    message['log_level'],
+                    message['message'],
+                    message.get('module'),
+                    message.get('function_name'),
+                    message.get('execution_id'),
+                    to_timestamp(message['created_at'])
+                ) for message in messages])
+        return len(messages)
+
+    def load_configurations(self):
+        """설정 전체를 한 번의 쿼리로 조회"""
+        with self.get_connection() as conn:
+            rows = conn.execute('SELECT config_key, config_value FROM user_configurations').fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def get_configuration_version(self):
+        """설정 버전 카운터 조회"""
+        with self.get_connection() as conn:
+            row = conn.execute(
+                'SELECT config_value FROM user_configurations WHERE config_key = ?', (CONFIG_VERSION_KEY,)
+            ).fetchone()
+        return int(row[0] or 0) if row else 0
+
+    def save_configurations(self, items):
+        """{키: (값, 설명)}을 한 트랜잭션으로 저장하고 증가한 설정 버전 반환"""
+        now = to_timestamp(datetime.now())
+        with self.get_connection() as conn:
+            with conn:
+                conn.executemany('''
+                    INSERT INTO user_configurations (config_key, config_value, description, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (config_key) DO UPDATE SET
+                        config_value = excluded.config_value,
+                        description = excluded.description,
+                        updated_at = excluded.updated_at
+                ''', [(key, str(value), description, now, now) for key, (value, description) in items.items()])
+
+                # 버전 카운터 증가 (다른 프로세스의 캐시 무효화)
+                conn.execute('''
+                    INSERT INTO user_configurations (config_key, config_value, description, created_at, updated_at)
+                    VALUES (?, '1', '설정 캐시 버전', ?, ?)
+                    ON CONFLICT (config_key) DO UPDATE SET
+                        config_value = CAST(CAST(config_value AS INTEGER) + 1 AS TEXT),
+                        updated_at = excluded.updated_at
+                ''', (CONFIG_VERSION_KEY, now, now))
+                row = conn.execute(
+                    'SELECT config_value FROM user_configurations WHERE config_key = ?', (CONFIG_VERSION_KEY,)
+                ).fetchone()
+        return int(row[0])
+
+    def load_selector_stats(self):
+        """선택자 적중 통계 전체 조회 {(페이지 유형, 선택자): (시도 수, 적중 수)}"""
+        with self.get_connection() as conn:
+            rows = conn.execute('SELECT page_type, selector, attempts, hits FROM selector_stats').fetchall()
+        return {(row[0], row[1]): (row[2], row[3]) for row in rows}
+
+    def record_selector_stats(self, updates):
+        """선택자 시도/적중 증가분 일괄 반영"""
+        if not updates:
+            return 0
+        with self.get_connection() as conn:
+            with conn:
+                conn.executemany('''
+                    INSERT INTO selector_stats (page_type, selector, attempts, hits, last_hit_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (page_type, selector) DO UPDATE SET
+                        attempts = attempts + excluded.attempts,
+                        hits = hits + excluded.hits,
+                        last_hit_at = COALESCE(excluded.last_hit_at, last_hit_at)
+                ''', [
+                    (update['page_type'], update['selector'], update['attempts'], update['hits'],
+                     to_timestamp(update['last_hit_at']) if update.get('last_hit_at') else None)
+                    for update in updates
+                ])
+        return len(updates)
+
+    def get_search_watermark(self, keyword, location):
+        """키워드/지역의 증분 수집 기준점 조회 (없으면 None)"""
+        with self.get_connection() as conn:
+            row = conn.execute('''
+                SELECT newest_rec_idx, newest_registered_at FROM search_watermarks
+                WHERE keyword = ? AND location = ?
+            ''', (keyword, location)).fetchone()
+        if row is None:
+            return None
+        return {'rec_idx': row[0], 'registered_at': from_timestamp(row[1])}
+
+    def save_search_watermark(self, keyword, location, rec_idx, registered_at=None):
+        """증분 수집 기준점 저장 (기존 값보다 최신일 때만 앞으로 이동)"""
+        now = to_timestamp(datetime.now())
+        with self.get_connection() as conn:
+            with conn:
+                conn.execute('''
+                    INSERT INTO search_watermarks (keyword, location, newest_rec_idx, newest_registered_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (keyword, location) DO UPDATE SET
+                        newest_rec_idx = MAX(newest_rec_idx, excluded.newest_rec_idx),
+                        newest_registered_at = CASE
+                            WHEN excluded.newest_rec_idx >= newest_rec_idx
+                            THEN COALESCE(excluded.newest_registered_at, newest_registered_at)
+                            ELSE newest_registered_at
+                        END,
+                        updated_at = excluded.updated_at
+                ''', (keyword, location, rec_idx, to_timestamp(registered_at) if registered_at else None, now))
+
+    def load_search_cursor_value(self, name):
+        """저장된 검색 위치 문자열 조회 (없으면 None)"""
+        with self.get_connection() as conn:
+            row = conn.execute('SELECT cursor_value FROM search_cursors WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else None
+
+    def store_search_cursor_value(self, name, value):
+        """검색 위치 문자열 저장 (설정 버전을 올리지 않음, value가 None이면 삭제)"""
+        with self.get_connection() as conn:
+            with conn:
+                if value is None:
+                    conn.execute('DELETE FROM search_cursors WHERE name = ?', (name,))
+                    return
+                conn.execute('''
+                    INSERT INTO search_cursors (name, cursor_value, updated_at) VALUES (?, ?, ?)
+                    ON CONFLICT (name) DO UPDATE SET
+                        cursor_value = excluded.cursor_value,
+                        updated_at = excluded.updated_at
+                ''', (name, value, to_timestamp(datetime.now())))
+
+    def get_job_postings(self, job_ids):
+        """공고 번호별 캐시된 상세 파싱 결과를 한 번의 쿼리로 조회 ({job_id: dict})"""
+        job_ids = list(set(job_ids))
+        if not job_ids:
+            return {}
+        placeholders = ', '.join('?' * len(job_ids))
+        with self.get_connection() as conn:
+            rows = conn.execute(f'''
+                SELECT job_id, title, company_name, deadline, apply_mode, has_apply_button, has_apply_text,
+                       content_hash, last_seen_at, last_fetched_at
+                FROM job_postings
+                WHERE job_id IN ({placeholders})
+            ''', job_ids).fetchall()
+        return {
+            row['job_id']: {
+                'title': row['title'],
+                'company': row['company_name'],
+                'deadline': row['deadline'],
+                'apply_mode': row['apply_mode'],
+                'has_apply_button': bool(row['has_apply_button']),
+                'has_apply_text': bool(row['has_apply_text']),
+                'content_hash': row['content_hash'],
+                'last_seen_at': from_timestamp(row['last_seen_at']),
+                'last_fetched_at': from_timestamp(row['last_fetched_at'])
             }
-    
-    def cleanup_old_records(self, days=90):
-        """오래된 기록 정리"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # 오래된 지원 기록 삭제
-            cursor.execute('''
-                DELETE FROM applications
-                WHERE applied_date < datetime('now', '-{} days')
-            '''.format(days))
-            
-            # 오래된 실행 기록 삭제
-            cursor.execute('''
-                DELETE FROM execution_log
-                WHERE execution_date < date('now', '-{} days')
-            '''.format(days))
-            
-            conn.commit()
-            
-            return cursor.rowcount
+            for row in rows
+        }
+
+    def save_job_posting(self, job_id, job_url, detail, content_hash):
+        """상세 파싱 결과 저장 (마지막으로 본/가져온 시각 갱신)"""
+        now = to_timestamp(datetime.now())
+        with self.get_connection() as conn:
+            with conn:
+                conn.execute('''
+                    INSERT INTO job_postings
+                        (job_id, job_url, title, company_name, deadline, apply_mode, has_apply_button,
+                         has_apply_text, content_hash, last_seen_at, last_fetched_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (job_id) DO UPDATE SET
+                        job_url = excluded.job_url,
+                        title = excluded.title,
+                        company_name = excluded.company_name,
+                        deadline = excluded.deadline,
+                        apply_mode = excluded.apply_mode,
+                        has_apply_button = excluded.has_apply_button,
+                        has_apply_text = excluded.has_apply_text,
+                        content_hash = excluded.content_hash,
+                        last_seen_at = excluded.last_seen_at,
+                        last_fetched_at = excluded.last_fetched_at
+                ''', (job_id, job_url, detail.title, detail.company, detail.deadline, detail.apply_mode,
+                      int(detail.has_apply_button), int(detail.has_apply_text), content_hash, now, now))
+
+    def touch_job_postings(self, job_ids):
+        """검색 결과에서 다시 본 캐시 공고의 마지막으로 본 시각 갱신"""
+        job_ids = list(set(job_ids))
+        if not job_ids:
+            return
+        placeholders = ', '.join('?' * len(job_ids))
+        with self.get_connection() as conn:
+            with conn:
+                conn.execute(f'UPDATE job_postings SET last_seen_at = ? WHERE job_id IN ({placeholders})',
+                             (to_timestamp(datetime.now()), *job_ids))
+
+    def get_last_used_keywords(self):
+        """마지막으로 사용한 검색 키워드 조회"""
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute('''
+                    SELECT keywords_searched FROM execution_logs
+                    WHERE keywords_searched IS NOT NULL
+                    ORDER BY created_at DESC
+                    LIMIT 1
+                ''').fetchone()
+
+            if row and row[0]:
+                try:
+                    keywords = json.loads(row[0])
+                    return ",".join(keywords) if isinstance(keywords, list) else row[0]
+                except ValueError:
+                    return row[0]
+
+            # 실행 기록이 없으면 설정값에서 조회
+            return self.get_configuration('last_keywords', 'bio')
+        except Exception as e:
+            return 'bio'  # 기본값
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+상세 페이지 파싱 벤치마크 스크립트
+Benchmark: single-pass lxml parsing vs. per-selector WebDriver probing
+
+저장된 상세 페이지(DETAIL_PAGE_SAVE_DIR)를 대상으로 두 방식을 비교한다.
+
+- 기본 모드: parse_job_detail 처리 시간을 측정하고, 기존 방식이 같은 페이지에서
+  필요로 했을 WebDriver 호출 수(선택자별 find_element + text)를 계산한다.
+- --live 모드: 헤드리스 Chrome으로 file:// 페이지를 열어 기존 선택자 순회와
+  page_source + parse_job_detail을 실제로 측정한다.
+
+사용법: python detail_parse_benchmark.py [--live] [--rtt-ms=3] [파일 또는 폴더 ...]
+"""
+
+import os
+import sys
+import glob
+import time
+from lxml import html as lxml_html
+import job_detail
+from job_detail import parse_job_detail
+
+DEFAULT_PAGE_DIR = os.getenv("DETAIL_PAGE_SAVE_DIR", "") or "saved_pages"
+REPEAT = 20
+
+# 기존 apply_to_job의 선택자 순서
+LEGACY_TITLE_SELECTORS = [
+    ".job_tit", ".job-tit", "h1.job_title", "h1", ".title", "[class*='title']",
+    ".job_sector .job_title", ".content_job .job_tit", ".job_summary .job_tit",
+    "h2.job_tit", ".wrap_jv_cont .job_tit"
+]
+LEGACY_COMPANY_SELECTORS = [
+    ".company_nm a", ".company_nm", ".company-name", ".corp_name a", ".corp_name",
+    "[class*='company'] a", "[class*='corp'] a", ".job_sector .corp_name a",
+    ".content_job .company_nm a", ".job_summary .company_nm a", ".wrap_jv_cont .company_nm a",
+    "a[class*='company']", ".area_job .company_nm a"
+]
+LEGACY_APPLY_SELECTORS = [
+    "button.btn_apply", "a.btn_apply", ".btn-apply", "button[onclick*='apply']",
+    "a[href*='apply']", ".apply-btn", ".job_apply button", ".apply_area button"
+]
+
+def collect_pages(args):
+    """벤치마크 대상 HTML 파일 목록"""
+    targets = args or [DEFAULT_PAGE_DIR]
+    pages = []
+    for target in targets:
+        if os.path.isdir(target):
+            pages.extend(sorted(glob.glob(os.path.join(target, "*.html"))))
+        elif os.path.isfile(target):
+            pages.append(target)
+    return pages
+
+def count_legacy_calls(page_source):
+    """기존 방식이 필요로 했을 WebDriver 호출 수 추정
+
+    선택자마다 find_element 1회, 찾으면 text/is_displayed/is_enabled 확인이 더해지고,
+    마지막에 page_source를 한 번 가져온다.
+    """
+    index = job_detail._PageIndex(lxml_html.fromstring(page_source))
+
+    def probe(candidates, calls_per_hit):
+        calls = 0
+        for candidate in candidates:
+            calls += 1
+            elements = candidate()
+            if elements and elements[0].text_content().strip():
+                return calls + calls_per_hit
+        return calls
+
+    # 제목/회사명: find_element + text, 지원 버튼: find_element + is_displayed + is_enabled
+    return (probe(job_detail._title_candidates(index), 1)
+            + probe(job_detail._company_candidates(index), 1)
+            + probe(job_detail._apply_button_candidates(index), 2) + 1)
+
+def benchmark_offline(pages, rtt_ms):
+    """저장된 페이지로 파싱 시간 측정 및 기존 방식 호출 수 비교"""
+    total_parse_ms = 0.0
+    total_legacy_calls = 0
+
+    for path in pages:
+        with open(path, encoding="utf-8") as f:
+            page_source = f.read()
+
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            detail = parse_job_detail(page_source)
+        parse_ms = (time.perf_counter() - started) * 1000 / REPEAT
+
+        legacy_calls = count_legacy_calls(page_source)
+        total_parse_ms += parse_ms
+        total_legacy_calls += legacy_calls
+
+        print(f"  {os.path.basename(path)}: 파싱 {parse_ms:.2f}ms (WebDriver 1회) / "
+              f"기존 방식 WebDriver {legacy_calls}회 ≈ {legacy_calls * rtt_ms:.0f}ms "
+              f"[{detail.company} - {detail.title}, {detail.apply_mode}]")
+
+    count = len(pages)
+    print(f"\n평균: 파싱 {total_parse_ms / count:.2f}ms + 왕복 {rtt_ms:.0f}ms, "
+          f"기존 방식 WebDriver {total_legacy_calls / count:.1f}회 ≈ {total_legacy_calls / count * rtt_ms:.0f}ms "
+          f"(왕복 {rtt_ms:.0f}ms 가정)")
+
+def benchmark_live(pages):
+    """헤드리스 Chrome으로 두 방식을 실제 측정"""
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+
+    def first_text(selectors):
+        for selector in selectors:
+            try:
+                element = driver.find_element(By.CSS_SELECTOR, selector)
+                if element and element.text.strip():
+                    return element.text.strip()
+            except Exception:
+                continue
+        return None
+
+    def apply_button_present():
+        for selector in LEGACY_APPLY_SELECTORS:
+            try:
+                element = driver.find_element(By.CSS_SELECTOR, selector)
+                if element.is_displayed() and element.is_enabled():
+                    return True
+            except Exception:
+                continue
+        return False
+
+    try:
+        legacy_total = 0.0
+        parsed_total = 0.0
+        for path in pages:
+            driver.get("file://" + os.path.abspath(path))
+
+            started = time.perf_counter()
+            first_text(LEGACY_TITLE_SELECTORS)
+            first_text(LEGACY_COMPANY_SELECTORS)
+            if not apply_button_present():
+                driver.page_source.lower()
+            legacy_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            parse_job_detail(driver.page_source)
+            parsed_ms = (time.perf_counter() - started) * 1000
+
+            legacy_total += legacy_ms
+            parsed_total += parsed_ms
+            print(f"  {os.path.basename(path)}: 기존 {legacy_ms:.1f}ms / 단일 파싱 {parsed_ms:.1f}ms")
+
+        count = len(pages)
+        print(f"\n평균: 기존 {legacy_total / count:.1f}ms / 단일 파싱 {parsed_total / count:.1f}ms")
+    finally:
+        driver.quit()
+
+def main():
+    """벤치마크 실행"""
+    live = "--live" in sys.argv
+    rtt_ms = 3.0
+    paths = []
+    for arg in sys.argv[1:]:
+        if arg.startswith("--rtt-ms="):
+            rtt_ms = float(arg.split("=", 1)[1])
+        elif not arg.startswith("--"):
+            paths.append(arg)
+
+    pages = collect_pages(paths)
+    if not pages:
+        print("벤치마크할 HTML 파일이 없습니다. DETAIL_PAGE_SAVE_DIR을 지정하고 봇을 실행하거나 파일 경로를 전달하세요.")
+        return 1
+
+    print(f"상세 페이지 {len(pages)}개 벤치마크 ({'실측' if live else '오프라인'})")
+    if live:
+        benchmark_live(pages)
+    else:
+        benchmark_offline(pages, rtt_ms)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+chromedriver 바이너리 캐시 모듈
+Patched chromedriver binary cache keyed by Chrome major version
+
+undetected-chromedriver가 실행마다 chromedriver를 내려받고 패치하지 않도록,
+Chrome 주 버전별로 패치된 바이너리를 캐시 폴더에 보관하고 여러 프로세스가 함께 쓴다.
+캐시가 없을 때만 파일 잠금 안에서 한 프로세스가 내려받아 패치한다.
+
+사용법: python main.py --prewarm-driver (배포 후 또는 Chrome 업데이트 후 미리 준비)
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import subprocess
+
+try:
+    import fcntl
+except ImportError:  # Windows: 잠금 없이 사용
+    fcntl = None
+
+# 기본 캐시 폴더 (DRIVER_CACHE_DIR 환경변수가 비어 있으면 캐시를 쓰지 않음)
+DEFAULT_DRIVER_CACHE_DIR = "driver_cache"
+
+LOCK_FILE = ".driver_cache.lock"
+VERSION_FILE = "chrome_version.json"  # Chrome 실행 파일 수정 시각별 주 버전 기록
+
+VERSION_PATTERN = re.compile(r"(\d+)\.\d+\.\d+")
+
+class DriverBinaryCache:
+    """Chrome 주 버전별 패치된 chromedriver 캐시"""
+
+    def __init__(self, cache_dir, logger=None):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.logger = logger
+
+    def path_for(self, major):
+        """주 버전의 캐시 바이너리 경로"""
+        suffix = ".exe" if sys.platform.startswith("win") else ""
+        return os.path.join(self.cache_dir, f"chromedriver-{major}{suffix}")
+
+    def chrome_major_version(self, chrome_path):
+        """Chrome 주 버전 (실행 파일이 바뀌지 않았으면 기록된 값 사용, 알 수 없으면 None)"""
+        try:
+            mtime = os.path.getmtime(chrome_path)
+        except OSError:
+            return None
+
+        version_file = os.path.join(self.cache_dir, VERSION_FILE)
+        try:
+            with open(version_file, encoding="utf-8") as f:
+                recorded = json.load(f)
+            if recorded.get("chrome_path") == chrome_path and recorded.get("mtime") == mtime:
+                return recorded["major"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        try:
+            output = subprocess.run([chrome_path, "--version"], capture_output=True, text=True, timeout=15).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        match = VERSION_PATTERN.search(output or "")
+        if not match:
+            return None
+
+        major = int(match.group(1))
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_file = version_file + f".{os.getpid()}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump({"chrome_path": chrome_path, "mtime": mtime, "major": major}, f)
+            os.replace(temp_file, version_file)
+        except OSError:
+            pass
+        return major
+
+    def get(self, major):
+        """캐시된 바이너리 경로와 적중 여부 반환 (없으면 잠금 안에서 내려받아 패치)"""
+        path = self.path_for(major)
+        if os.path.exists(path):
+            return path, True
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(os.path.join(self.cache_dir, LOCK_FILE), "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                # 잠금을 기다리는 동안 다른 프로세스가 준비했을 수 있음
+                if os.path.exists(path):
+                    return path, True
+                self._download(major, path)
+                return path, False
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _download(self, major, path):
+        """undetected-chromedriver로 내려받고 패치한 바이너리를 캐시에 복사"""
+        import undetected_chromedriver as uc
+
+        if self.logger:
+            self.logger.info(f"chromedriver {major} 내려받기 및 패치 중...")
+        patcher = uc.Patcher(version_main=major)
+        patcher.auto()
+        temp_path = path + f".{os.getpid()}.tmp"
+        shutil.copy2(patcher.executable_path, temp_path)
+        os.chmod(temp_path, 0o755)
+        os.replace(temp_path, path)
+
+    def resolve(self, chrome_path):
+        """Chrome에 맞는 (바이너리 경로, 주 버전, 캐시 적중 여부) 반환 (버전을 모르면 경로는 None)"""
+        major = self.chrome_major_version(chrome_path)
+        if major is None:
+            return None, None, False
+        path, hit = self.get(major)
+        return path, major, hit
+
+def get_driver_cache(logger=None):
+    """설정된 캐시 폴더의 바이너리 캐시 (DRIVER_CACHE_DIR이 비어 있으면 None)"""
+    cache_dir = os.getenv("DRIVER_CACHE_DIR", DEFAULT_DRIVER_CACHE_DIR)
+    if not cache_dir:
+        return None
+    return DriverBinaryCache(cache_dir, logger)
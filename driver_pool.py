@@ -0,0 +1,274 @@
+"""
+Chrome 드라이버 풀 모듈
+Warm pool of pre-launched Chrome drivers for the web app
+
+웹 앱 프로세스 안에서 미리 실행해 둔 Chrome을 실행 요청에 빌려주고 반환받는다.
+빌려줄 때 상태를 확인하고, 반환 시 페이지 이동 수나 메모리 사용량이 기준을 넘으면
+종료 후 백그라운드에서 새로 실행하여 다음 요청이 Chrome 시작 시간을 기다리지 않게 한다.
+"""
+
+import time
+import threading
+
+try:
+    import psutil
+except ImportError:  # psutil이 없으면 페이지 JS 힙 크기로 대신 판단
+    psutil = None
+
+# 상태 확인 겸 JS 힙 사용량 조회 (응답이 없거나 창이 닫혔으면 예외)
+HEALTH_SCRIPT = "return (performance.memory && performance.memory.usedJSHeapSize) || 0;"
+
+# 실행 후에는 바꿀 수 없는 브라우저 설정 (값이 다르면 대기 브라우저를 재사용하지 않음)
+LAUNCH_CONFIG_FIELDS = (
+    'username',
+    'headless',
+    'page_load_strategy',
+    'resource_blocking',
+    'resource_block_patterns',
+    'resource_allow_patterns',
+    'browser_profile_dir'
+)
+
+def launch_key(config):
+    """계정과 실행 관련 설정으로 만든 대기 브라우저 구분 키"""
+    values = []
+    for field in LAUNCH_CONFIG_FIELDS:
+        value = getattr(config, field, None)
+        values.append(tuple(value) if isinstance(value, list) else value)
+    return tuple(values)
+
+class PooledDriver:
+    """풀에서 관리하는 브라우저 한 개 (빌린 쪽은 release()로 반환)"""
+
+    def __init__(self, pool, driver, profile, account, config, launch_seconds):
+        self.pool = pool
+        self.driver = driver
+        self.profile = profile
+        self.account = account
+        self.config = config
+        self.key = launch_key(config)
+        self.launch_seconds = launch_seconds
+        self.navigations = 0
+        self.leases = 0
+        self.leased_at = None
+
+    def release(self, navigations=0):
+        """사용한 브라우저를 풀에 반환"""
+        self.pool.release(self, navigations)
+
+class DriverPool:
+    """예열된 Chrome 드라이버 풀
+
+    factory(config)는 (드라이버, 프로필)을 반환한다. 계정과 실행 관련 설정
+    (LAUNCH_CONFIG_FIELDS)이 같은 요청에만 대기 브라우저를 빌려주며, 전체 브라우저 수
+    (대기 + 사용 중 + 실행 중)를 size 이하로 유지한다.
+    """
+
+    def __init__(self, factory, size=1, max_navigations=300, max_memory_mb=1024, logger=None):
+        self.factory = factory
+        self.size = size
+        self.max_navigations = max_navigations
+        self.max_memory_mb = max_memory_mb
+        self.logger = logger
+        self._condition = threading.Condition()
+        self._idle = []
+        self._in_use = set()
+        self._launching = 0
+        self._warming = []  # 백그라운드에서 실행 중인 브라우저의 구분 키
+        self._started_at = time.monotonic()
+        self._busy_seconds = 0.0
+        self.stats = {
+            'launched': 0,
+            'launch_failures': 0,
+            'recycled': 0,
+            'unhealthy': 0,
+            'warm_hits': 0,
+            'cold_starts': 0,
+            'launch_seconds': 0.0
+        }
+
+    def _launch(self, config):
+        """브라우저 실행 (풀 잠금 밖에서 호출)"""
+        started = time.perf_counter()
+        driver, profile = self.factory(config)
+        launch_seconds = time.perf_counter() - started
+        with self._condition:
+            self.stats['launched'] += 1
+            self.stats['launch_seconds'] += launch_seconds
+        return PooledDriver(self, driver, profile, config.username, config, launch_seconds)
+
+    def _total(self):
+        """대기 + 사용 중 + 실행 중인 브라우저 수"""
+        return len(self._idle) + len(self._in_use) + self._launching
+
+    def warm(self, config):
+        """빈 자리만큼 백그라운드에서 브라우저 미리 실행"""
+        with self._condition:
+            missing = max(self.size - self._total(), 0)
+            self._launching += missing
+            self._warming.extend([launch_key(config)] * missing)
+        for _ in range(missing):
+            threading.Thread(target=self._warm_one, args=(config,), daemon=True).start()
+
+    def _warm_one(self, config):
+        """브라우저 한 개를 실행하여 대기 목록에 추가"""
+        try:
+            pooled = self._launch(config)
+        except Exception as e:
+            with self._condition:
+                self._launching -= 1
+                self._warming.remove(launch_key(config))
+                self.stats['launch_failures'] += 1
+                self._condition.notify_all()
+            if self.logger:
+                self.logger.warning(f"드라이버 풀 예열 실패: {str(e)}")
+            return
+        with self._condition:
+            self._launching -= 1
+            self._warming.remove(pooled.key)
+            self._idle.append(pooled)
+            self._condition.notify_all()
+        if self.logger:
+            self.logger.info(f"드라이버 풀 예열 완료 ({pooled.launch_seconds:.1f}초)")
+
+    def _healthy(self, pooled):
+        """브라우저 응답 확인 및 메모리 기준 초과 여부"""
+        try:
+            heap_bytes = pooled.driver.execute_script(HEALTH_SCRIPT) or 0
+            if not pooled.driver.window_handles:
+                return False
+        except Exception:
+            return False
+        return self._memory_mb(pooled, heap_bytes) <= self.max_memory_mb
+
+    def _memory_mb(self, pooled, heap_bytes):
+        """브라우저 메모리 사용량 (psutil이 있으면 프로세스 RSS 합계, 없으면 JS 힙)"""
+        browser_pid = getattr(pooled.driver, 'browser_pid', None)
+        if psutil is not None and browser_pid:
+            try:
+                process = psutil.Process(browser_pid)
+                rss = process.memory_info().rss + sum(
+                    child.memory_info().rss for child in process.children(recursive=True)
+                )
+                return rss / (1024 * 1024)
+            except psutil.Error:
+                pass
+        return heap_bytes / (1024 * 1024)
+
+    def _discard(self, pooled):
+        """브라우저 종료 및 프로필 잠금 해제"""
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+        if pooled.profile is not None:
+            pooled.profile.release()
+
+    def acquire(self, config, timeout=0):
+        """설정에 맞는 예열된 브라우저를 빌려줌 (없으면 빈 자리에 바로 실행)
+
+        같은 설정의 브라우저가 예열 중이거나 풀이 가득 찼으면 timeout초까지 기다리고,
+        그래도 자리가 나지 않으면 TimeoutError를 발생시킨다.
+        """
+        key = launch_key(config)
+        deadline = time.monotonic() + timeout
+        while True:
+            stale = None
+            with self._condition:
+                pooled = next((candidate for candidate in self._idle if candidate.key == key), None)
+                remaining = deadline - time.monotonic()
+                if pooled is not None:
+                    self._idle.remove(pooled)
+                elif key in self._warming and remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                elif self._total() < self.size or self._idle:
+                    if self._total() >= self.size:
+                        # 설정이 다른 대기 브라우저를 종료하여 자리 확보
+                        stale = self._idle.pop(0)
+                    self._launching += 1
+                elif remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                else:
+                    raise TimeoutError(f"드라이버 풀에 빈 자리가 없습니다 ({self.size}개 사용 중, {timeout}초 대기)")
+
+            if stale is not None:
+                self._discard(stale)
+            if pooled is None:
+                break
+            if self._healthy(pooled):
+                return self._lease(pooled, warm=True)
+            with self._condition:
+                self.stats['unhealthy'] += 1
+                self._condition.notify_all()
+            self._discard(pooled)
+
+        try:
+            pooled = self._launch(config)
+        except Exception:
+            with self._condition:
+                self._launching -= 1
+                self.stats['launch_failures'] += 1
+                self._condition.notify_all()
+            raise
+        return self._lease(pooled, warm=False)
+
+    def _lease(self, pooled, warm):
+        """임대 기록 (직접 실행한 브라우저는 실행 중 자리를 사용 중으로 옮김)"""
+        with self._condition:
+            if not warm:
+                self._launching -= 1
+            self.stats['warm_hits' if warm else 'cold_starts'] += 1
+            pooled.leases += 1
+            pooled.leased_at = time.monotonic()
+            self._in_use.add(pooled)
+        return pooled
+
+    def release(self, pooled, navigations=0):
+        """반환된 브라우저를 재사용하거나 기준 초과 시 교체"""
+        pooled.navigations += navigations
+        recycle = pooled.navigations >= self.max_navigations or not self._healthy(pooled)
+        with self._condition:
+            self._in_use.discard(pooled)
+            if pooled.leased_at is not None:
+                self._busy_seconds += time.monotonic() - pooled.leased_at
+                pooled.leased_at = None
+            if not recycle:
+                self._idle.append(pooled)
+                self._condition.notify_all()
+                return
+            self.stats['recycled'] += 1
+            self._condition.notify_all()
+
+        if self.logger:
+            self.logger.info(f"드라이버 풀 브라우저 교체 (페이지 이동 {pooled.navigations}회)")
+        self._discard(pooled)
+        self.warm(pooled.config)
+
+    def status(self):
+        """풀 사용 현황 (가동률은 전체 슬롯 시간 대비 임대 시간 비율)"""
+        with self._condition:
+            now = time.monotonic()
+            busy = self._busy_seconds + sum(now - pooled.leased_at for pooled in self._in_use
+                                            if pooled.leased_at is not None)
+            uptime = max(now - self._started_at, 1e-9)
+            leases = self.stats['warm_hits'] + self.stats['cold_starts']
+            return {
+                'size': self.size,
+                'idle': len(self._idle),
+                'in_use': len(self._in_use),
+                'launching': self._launching,
+                'utilization': round(busy / (uptime * self.size), 4) if self.size else 0.0,
+                'warm_hit_rate': round(self.stats['warm_hits'] / leases, 4) if leases else 0.0,
+                'avg_launch_seconds': round(self.stats['launch_seconds'] / self.stats['launched'], 2)
+                                      if self.stats['launched'] else 0.0,
+                **self.stats
+            }
+
+    def shutdown(self):
+        """대기 중인 브라우저 모두 종료"""
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._discard(pooled)
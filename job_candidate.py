@@ -0,0 +1,121 @@
+"""
+검색 결과 후보 공고 모듈
+Single-round-trip extraction of search result rows into typed candidates
+"""
+
+import re
+import urllib.parse
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+# 검색 결과의 모든 공고 행을 한 번의 execute_script 호출로 수집
+# 웹사이트 구조 변경 시 수동 점검 필요
+SEARCH_RESULTS_SCRIPT = """
+const text = (root, selector) => {
+    const element = root.querySelector(selector);
+    return element ? element.textContent.replace(/\\s+/g, ' ').trim() : null;
+};
+return Array.from(document.querySelectorAll('.item_recruit')).map(item => {
+    const link = item.querySelector('.job_tit a');
+    if (!link) {
+        return null;
+    }
+    return {
+        href: link.href,
+        title: (link.getAttribute('title') || link.textContent || '').replace(/\\s+/g, ' ').trim(),
+        company: text(item, '.corp_name a') || text(item, '.corp_name'),
+        rec_idx: item.getAttribute('value'),
+        deadline: text(item, '.job_date .date'),
+        apply_type: text(item, '.job_date .btn_apply') || text(item, '.job_date button') || text(item, '.job_date a'),
+        registered: text(item, '.job_day')
+    };
+}).filter(record => record !== null);
+"""
+
+JOB_RELAY_PATH = "/zf_user/jobs/relay/"
+
+# 목록의 등록일 표시 (예: "등록일 24/10/17", "수정일 24/10/17")
+REGISTERED_DATE_PATTERN = re.compile(r"(\d{2})/(\d{2})/(\d{2})")
+
+@dataclass(frozen=True, slots=True)
+class JobCandidate:
+    """검색 결과에서 수집한 지원 후보 공고"""
+    url: str
+    title: str
+    company: str
+    rec_idx: Optional[str] = None
+    deadline: Optional[str] = None
+    apply_type: Optional[str] = None
+    registered: Optional[str] = None
+
+    @property
+    def rec_idx_number(self) -> Optional[int]:
+        """정수 공고 번호 (등록 순으로 증가, 없으면 None)"""
+        return int(self.rec_idx) if self.rec_idx and self.rec_idx.isdigit() else None
+
+    @property
+    def registered_at(self) -> Optional[datetime]:
+        """목록에 표시된 등록일 (형식을 알 수 없으면 None)"""
+        match = REGISTERED_DATE_PATTERN.search(self.registered or "")
+        if not match:
+            return None
+        year, month, day = (int(group) for group in match.groups())
+        try:
+            return datetime(2000 + year, month, day)
+        except ValueError:
+            return None
+
+    @classmethod
+    def from_record(cls, record):
+        """execute_script 결과 레코드를 후보 공고로 변환 (공고 링크가 아니면 None)"""
+        url = record.get('href')
+        if not url or JOB_RELAY_PATH not in url:
+            return None
+
+        rec_idx = record.get('rec_idx') or canonical_job_id(url)
+
+        return cls(
+            url=url,
+            title=record.get('title') or "제목 없음",
+            company=record.get('company') or "회사명 없음",
+            rec_idx=rec_idx,
+            deadline=record.get('deadline'),
+            apply_type=record.get('apply_type'),
+            registered=record.get('registered')
+        )
+
+def canonical_job_id(url):
+    """공고 URL의 사람인 공고 번호 (rec_idx 쿼리 파라미터, 없으면 None)
+
+    검색 결과 링크에는 검색마다 달라지는 search_uuid, relayNonce 등이 붙으므로
+    URL 대신 공고 번호를 공고 식별값으로 사용한다.
+    """
+    rec_idx = urllib.parse.parse_qs(urllib.parse.urlparse(url or "").query).get('rec_idx', [None])[0]
+    return rec_idx or None
+
+def canonical_job_id_updates(rows, taken):
+    """기존 지원 기록 중 job_id를 공고 번호로 바꿀 (id, 새 job_id) 목록
+
+    rows는 (id, job_id, job_url), taken은 이미 사용 중인 job_id 집합이다.
+    같은 공고 번호로 바뀔 기록이 이미 있으면 (중복 지원 기록) 바꾸지 않는다.
+    """
+    taken = set(taken)
+    updates = []
+    for row_id, job_id, job_url in rows:
+        rec_idx = canonical_job_id(job_url)
+        if rec_idx and rec_idx != job_id and rec_idx not in taken:
+            taken.add(rec_idx)
+            updates.append((row_id, rec_idx))
+    return updates
+
+def extract_search_results(driver) -> List[JobCandidate]:
+    """현재 검색 결과 페이지의 공고를 한 번의 WebDriver 호출로 수집"""
+    candidates = []
+    seen_urls = set()
+    for record in driver.execute_script(SEARCH_RESULTS_SCRIPT) or []:
+        candidate = JobCandidate.from_record(record)
+        if candidate is not None and candidate.url not in seen_urls:
+            seen_urls.add(candidate.url)
+            candidates.append(candidate)
+    return candidates
@@ -0,0 +1,43 @@
+"""
+후보 공고 모듈 테스트
+Unit tests for JobCandidate parsing and canonical job ids
+"""
+
+from datetime import datetime
+
+from job_candidate import JobCandidate, canonical_job_id, canonical_job_id_updates
+
+RELAY_URL = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx={}&search_uuid=abc&relayNonce=1"
+
+def test_canonical_job_id():
+    """검색마다 달라지는 파라미터와 관계없이 rec_idx를 공고 식별값으로 사용"""
+    assert canonical_job_id(RELAY_URL.format(123)) == "123"
+    assert canonical_job_id("https://www.saramin.co.kr/zf_user/jobs/relay/view") is None
+    assert canonical_job_id(None) is None
+
+def test_from_record():
+    """공고 링크가 아닌 레코드는 버리고, rec_idx가 없으면 URL에서 추출"""
+    candidate = JobCandidate.from_record({'href': RELAY_URL.format(456), 'registered': '등록일 26/10/17'})
+    assert candidate.rec_idx == "456"
+    assert candidate.rec_idx_number == 456
+    assert candidate.title == "제목 없음"
+    assert candidate.registered_at == datetime(2026, 10, 17)
+
+    assert JobCandidate.from_record({'href': "https://www.saramin.co.kr/zf_user/company-info"}) is None
+    assert JobCandidate.from_record({}) is None
+
+def test_registered_at_unknown_format():
+    """등록일 형식을 알 수 없으면 None"""
+    assert JobCandidate(url="u", title="t", company="c", registered="3일 전 등록").registered_at is None
+    assert JobCandidate(url="u", title="t", company="c", registered="등록일 26/13/40").registered_at is None
+
+def test_canonical_job_id_updates():
+    """URL 해시 job_id를 공고 번호로 바꾸되, 이미 있는 공고 번호와 겹치면 그대로 둠"""
+    rows = [
+        (1, "hash-a", RELAY_URL.format(100)),
+        (2, "hash-b", RELAY_URL.format(200)),
+        (3, "hash-c", RELAY_URL.format(100)),
+        (4, "300", RELAY_URL.format(300)),
+        (5, "hash-d", "https://example.com/no-rec-idx")
+    ]
+    assert canonical_job_id_updates(rows, ["200"]) == [(1, "100")]
@@ -0,0 +1,207 @@
+"""
+채용 공고 상세 페이지 파서
+Single-pass extraction of job detail fields from page_source using lxml
+
+상세 페이지 HTML을 한 번만 가져와 lxml로 파싱하고, 트리를 한 번 순회하여 만든
+class/태그 색인에서 제목, 회사명, 마감일, 지원 버튼 유무와 지원 방식을 함께 추출한다.
+후보 순서는 기존 라이브 DOM 선택자 순서와 같다. 웹사이트 구조 변경 시 수동 점검 필요.
+"""
+
+import re
+import hashlib
+from dataclasses import dataclass, astuple
+from typing import Optional
+from lxml import html as lxml_html
+
+# 지원 완료 페이지 표시 문구 (대소문자 무시)
+SUCCESS_PATTERN = re.compile(r"지원이 완료|지원완료|apply_complete|success", re.IGNORECASE)
+
+APPLY_MODE_IMMEDIATE = "immediate"  # 사람인 즉시지원/입사지원
+APPLY_MODE_HOMEPAGE = "homepage"    # 회사 홈페이지 지원
+APPLY_MODE_CLOSED = "closed"        # 마감된 공고
+
+@dataclass(frozen=True, slots=True)
+class JobDetail:
+    """상세 페이지에서 추출한 공고 정보"""
+    title: Optional[str]
+    company: Optional[str]
+    deadline: Optional[str]
+    has_apply_button: bool
+    apply_mode: Optional[str]
+    has_apply_text: bool  # 버튼이 없어도 '지원하기'/'즉시지원' 문구가 있는지
+
+class _PageIndex:
+    """한 번의 트리 순회로 만든 class/태그별 요소 색인 (문서 순서 유지)"""
+
+    def __init__(self, document):
+        self.by_class = {}
+        self.by_tag = {}
+        self.classed = []  # [(class 속성, 요소)] - [class*='...'] 부분 일치용
+        for element in document.iter():
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue  # 주석/처리 명령 제외
+            self.by_tag.setdefault(tag, []).append(element)
+            class_attr = element.get("class")
+            if class_attr:
+                self.classed.append((class_attr, element))
+                for name in class_attr.split():
+                    self.by_class.setdefault(name, []).append(element)
+
+    def with_class(self, name, tag=None):
+        """class가 name인 요소 (.name, tag.name)"""
+        elements = self.by_class.get(name, [])
+        return [element for element in elements if element.tag == tag] if tag else elements
+
+    def class_contains(self, fragment):
+        """class 속성에 fragment가 포함된 요소 ([class*='fragment'])"""
+        return [element for class_attr, element in self.classed if fragment in class_attr]
+
+    def tag(self, tag):
+        """태그 이름으로 조회"""
+        return self.by_tag.get(tag, [])
+
+def _descendants(elements, tag):
+    """요소들의 하위 tag 요소 (.parent tag)"""
+    return [child for element in elements for child in element.iter(tag) if child is not element]
+
+def _element_text(element):
+    """요소의 공백 정리된 텍스트"""
+    return " ".join(element.text_content().split())
+
+def _first_text(candidates):
+    """후보 목록을 순서대로 평가하여 처음으로 텍스트가 있는 요소의 텍스트 반환"""
+    for candidate in candidates:
+        for element in candidate():
+            text = _element_text(element)
+            if text:
+                return text
+    return None
+
+def _first_element(candidates):
+    """후보 목록을 순서대로 평가하여 처음 찾은 요소 반환"""
+    for candidate in candidates:
+        elements = candidate()
+        if elements:
+            return elements[0]
+    return None
+
+def _title_candidates(index):
+    """제목 후보 (.job_tit, .job-tit, h1.job_title, h1, .title, [class*='title'])"""
+    return [
+        lambda: index.with_class("job_tit"),
+        lambda: index.with_class("job-tit"),
+        lambda: index.with_class("job_title", tag="h1"),
+        lambda: index.tag("h1"),
+        lambda: index.with_class("title"),
+        lambda: index.class_contains("title"),
+    ]
+
+def _company_candidates(index):
+    """회사명 후보 (.company_nm a, .company_nm, .company-name, .corp_name a, .corp_name, ...)"""
+    return [
+        lambda: _descendants(index.with_class("company_nm"), "a"),
+        lambda: index.with_class("company_nm"),
+        lambda: index.with_class("company-name"),
+        lambda: _descendants(index.with_class("corp_name"), "a"),
+        lambda: index.with_class("corp_name"),
+        lambda: _descendants(index.class_contains("company"), "a"),
+        lambda: _descendants(index.class_contains("corp"), "a"),
+        lambda: [element for element in index.tag("a") if "company" in element.get("class", "")],
+    ]
+
+def _deadline_candidates(index):
+    """마감일 후보 (접수기간 영역의 '마감일' 항목, .job_date .date, .date)"""
+    def period_deadline():
+        for term in _descendants(index.with_class("info_period"), "dt"):
+            if "마감일" in term.text_content():
+                value = term.getnext()
+                return [value] if value is not None and value.tag == "dd" else []
+        return _descendants(index.with_class("info_period"), "dd")[-1:]
+
+    return [
+        period_deadline,
+        lambda: [element for element in _descendants(index.with_class("job_date"), "*")
+                 if "date" in element.get("class", "").split()],
+        lambda: index.with_class("date"),
+    ]
+
+def _deadline_status_candidates(index):
+    """접수 상태 표시 후보 (남은 기간 타이머, 접수기간 영역) - 페이지 전체 문구는 사용하지 않음"""
+    return [
+        lambda: index.with_class("info_timer"),
+        lambda: index.with_class("info_period"),
+    ]
+
+def _apply_button_candidates(index):
+    """지원 버튼 후보 (라이브 DOM의 지원하기 버튼 선택자와 같은 순서)"""
+    def with_text(tag, text):
+        return lambda: [element for element in index.tag(tag) if text in (element.text or "")]
+
+    return [
+        lambda: index.with_class("btn_apply", tag="button"),
+        lambda: index.with_class("btn_apply", tag="a"),
+        lambda: index.with_class("btn-apply"),
+        lambda: [element for element in index.tag("button") if "apply" in element.get("onclick", "")],
+        lambda: [element for element in index.tag("a") if "apply" in element.get("href", "")],
+        lambda: index.with_class("apply-btn"),
+        lambda: _descendants(index.with_class("job_apply"), "button"),
+        lambda: _descendants(index.with_class("apply_area"), "button"),
+        with_text("button", "지원하기"),
+        with_text("a", "지원하기"),
+        with_text("button", "즉시지원"),
+        with_text("a", "즉시지원"),
+        lambda: [element for element in index.tag("button") if "apply" in element.get("class", "")],
+        lambda: [element for element in index.tag("a") if "apply" in element.get("class", "")],
+    ]
+
+def _detect_apply_mode(button, status_text):
+    """지원 버튼 문구와 접수 상태 표시로 지원 방식 판별
+
+    마감 여부는 지원 버튼이나 접수 상태 요소로만 판단한다. 버튼을 찾지 못한 경우는
+    스크립트로 늦게 그려지는 버튼일 수 있으므로 마감으로 기록하지 않는다.
+    """
+    if button is None:
+        return None
+    button_text = _element_text(button)
+    if "마감" in button_text or "접수마감" in status_text or "채용마감" in status_text:
+        return APPLY_MODE_CLOSED
+    if "홈페이지" in button_text:
+        return APPLY_MODE_HOMEPAGE
+    if "지원" in button_text:
+        return APPLY_MODE_IMMEDIATE
+    return None
+
+def parse_job_detail(page_source) -> JobDetail:
+    """상세 페이지 HTML을 한 번 파싱하여 공고 정보 추출"""
+    document = lxml_html.fromstring(page_source)
+    index = _PageIndex(document)
+
+    title = _first_text(_title_candidates(index))
+    if not title:
+        # 제목을 못 찾은 경우 <title> 태그 확인 ("제목 | 사람인")
+        page_title = document.findtext(".//title") or ""
+        if "사람인" in page_title and "|" in page_title:
+            title = page_title.split("|")[0].strip()
+
+    button = _first_element(_apply_button_candidates(index))
+    status_text = _first_text(_deadline_status_candidates(index)) or ""
+    page_text = document.text_content()
+
+    return JobDetail(
+        title=title,
+        company=_first_text(_company_candidates(index)),
+        deadline=_first_text(_deadline_candidates(index)),
+        has_apply_button=button is not None,
+        apply_mode=_detect_apply_mode(button, status_text),
+        has_apply_text="지원하기" in page_text or "즉시지원" in page_text
+    )
+
+def detail_content_hash(detail: JobDetail) -> str:
+    """파싱 결과 내용 해시 (다시 가져온 공고의 내용 변경 확인용)"""
+    payload = "\x1f".join("" if value is None else str(value) for value in astuple(detail))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+def page_indicates_success(page_source, url=""):
+    """지원 완료 페이지인지 확인 (page_source 전체를 소문자로 복사하지 않음)"""
+    return SUCCESS_PATTERN.search(page_source) is not None or SUCCESS_PATTERN.search(url) is not None
@@ -0,0 +1,86 @@
+"""
+상세 페이지 파서 테스트
+Unit tests for parse_job_detail on static HTML
+"""
+
+from job_detail import (
+    APPLY_MODE_CLOSED, APPLY_MODE_HOMEPAGE, APPLY_MODE_IMMEDIATE,
+    detail_content_hash, page_indicates_success, parse_job_detail
+)
+
+def page(body, title="채용공고"):
+    return f"<html><head><title>{title}</title></head><body>{body}</body></html>"
+
+DETAIL_PAGE = page('''
+    <div class="wrap_jv_header">
+        <a class="company" href="/company"><span class="company_nm"><a href="/c">테스트 회사</a></span></a>
+        <h1 class="tit_job">백엔드 개발자</h1>
+        <div class="job_tit">백엔드  개발자 (Python)</div>
+    </div>
+    <dl class="info_period">
+        <dt>시작일</dt><dd>2026.10.01 00:00</dd>
+        <dt>마감일</dt><dd>2026.10.31 23:59</dd>
+    </dl>
+    <div class="job_apply"><button class="btn_apply">즉시지원</button></div>
+''')
+
+def test_parse_detail_fields():
+    """제목, 회사명, 마감일, 지원 버튼을 후보 순서대로 추출"""
+    detail = parse_job_detail(DETAIL_PAGE)
+    assert detail.title == "백엔드 개발자 (Python)"
+    assert detail.company == "테스트 회사"
+    assert detail.deadline == "2026.10.31 23:59"
+    assert detail.has_apply_button
+    assert detail.apply_mode == APPLY_MODE_IMMEDIATE
+    assert detail.has_apply_text
+
+def test_title_falls_back_to_page_title():
+    """제목 요소가 없으면 '제목 | 사람인' 형식의 <title>에서 추출"""
+    detail = parse_job_detail(page('<p>본문</p>', title="데이터 엔지니어 | 사람인"))
+    assert detail.title == "데이터 엔지니어"
+    assert detail.company is None
+    assert detail.deadline is None
+
+def test_homepage_apply_mode():
+    """홈페이지 지원 버튼"""
+    detail = parse_job_detail(page('<a class="btn_apply" href="#">홈페이지 지원</a>'))
+    assert detail.apply_mode == APPLY_MODE_HOMEPAGE
+
+def test_closed_by_button_or_status():
+    """버튼 문구나 접수 상태 요소가 마감이면 마감"""
+    detail = parse_job_detail(page('<button class="btn_apply">접수마감</button>'))
+    assert detail.apply_mode == APPLY_MODE_CLOSED
+
+    detail = parse_job_detail(page('''
+        <div class="info_timer">접수마감</div>
+        <button class="btn_apply">즉시지원</button>
+    '''))
+    assert detail.apply_mode == APPLY_MODE_CLOSED
+
+def test_unrelated_closed_text_is_not_closed():
+    """추천 공고 등 다른 영역의 '접수마감' 문구로는 마감 처리하지 않음"""
+    detail = parse_job_detail(page('''
+        <button class="btn_apply">즉시지원</button>
+        <ul class="recommend"><li>다른 공고 <span>접수마감</span></li></ul>
+    '''))
+    assert detail.apply_mode == APPLY_MODE_IMMEDIATE
+
+def test_missing_button_is_not_closed():
+    """버튼이 없으면 마감 문구가 있어도 지원 방식을 판단하지 않음"""
+    detail = parse_job_detail(page('<div class="info_timer">접수마감</div><p>즉시지원 안내</p>'))
+    assert not detail.has_apply_button
+    assert detail.apply_mode is None
+    assert detail.has_apply_text
+
+def test_content_hash_tracks_changes():
+    """같은 내용이면 같은 해시, 필드가 바뀌면 다른 해시"""
+    first = parse_job_detail(DETAIL_PAGE)
+    assert detail_content_hash(first) == detail_content_hash(parse_job_detail(DETAIL_PAGE))
+    changed = parse_job_detail(DETAIL_PAGE.replace("2026.10.31", "2026.11.30"))
+    assert detail_content_hash(first) != detail_content_hash(changed)
+
+def test_page_indicates_success():
+    """완료 문구나 URL로 지원 완료 판정"""
+    assert page_indicates_success(page("<p>지원이 완료되었습니다</p>"))
+    assert page_indicates_success("<html></html>", "https://www.saramin.co.kr/apply/SUCCESS")
+    assert not page_indicates_success(DETAIL_PAGE)
@@ -11,12 +11,35 @@ from datetime import datetime
 from saramin_bot import SaraminBot
 from config import Config
 from logger_config import setup_logger
-from postgres_database import PostgresApplicationDatabase
+from storage import create_database
 
 def main():
     """메인 실행 함수"""
     logger = setup_logger()
     
+    # chromedriver 바이너리 캐시만 준비하고 종료
+    if "--prewarm-driver" in sys.argv:
+        from dotenv import load_dotenv
+        from saramin_bot import resolve_driver_binary
+        load_dotenv()
+        driver_path, major = resolve_driver_binary(logger)
+        if driver_path is None:
+            logger.error("chromedriver 캐시 준비 실패 (DRIVER_CACHE_DIR 또는 Chrome 설치 확인)")
+            sys.exit(1)
+        logger.info(f"chromedriver {major} 캐시 준비 완료: {driver_path}")
+        return
+    
+    # 스키마 마이그레이션만 적용하고 종료
+    if "--migrate" in sys.argv:
+        from migrations import migrate
+        try:
+            applied = migrate()
+            logger.info(f"스키마 마이그레이션 완료: {len(applied)}개 적용")
+        except Exception as e:
+            logger.error(f"스키마 마이그레이션 실패: {str(e)}")
+            sys.exit(1)
+        return
+    
     try:
         # 환경 변수 확인
         if not os.path.exists('.env'):
@@ -27,7 +50,7 @@ def main():
         config = Config()
         
         # 데이터베이스 초기화
-        db = PostgresApplicationDatabase()
+        db = create_database()
         
         # 당일 실행 여부 확인
         today = datetime.now().strftime('%Y-%m-%d')
@@ -50,7 +73,7 @@ def main():
             applied_count = bot.search_and_apply_jobs()
             
             # 실행 기록 저장
-            db.record_execution(today, applied_count)
+            db.record_execution(today, applied_count, keyword_stats=bot.keyword_overlap_stats())
             
             logger.info(f"스크립트 실행 완료. 총 {applied_count}개 채용공고에 지원했습니다.")
             
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+데이터베이스 보존 기간 관리 모듈
+Retention maintenance: monthly partition drops and chunked deletes
+
+- 월별 파티션 테이블이면 보존 기간이 지난 파티션을 통째로 삭제한다.
+- 일반 테이블이면 제한된 크기의 배치로 나누어 삭제하고 진행 상황을 보고한다.
+
+job_applications는 job_id 유니크 제약(중복 지원 방지)이 파티션 키를 포함할 수 없어
+파티션 대신 배치 삭제를 사용한다. system_logs는 --partition-system-logs로 변환할 수 있다.
+"""
+
+import re
+import sys
+import time
+from datetime import datetime, timedelta, date
+from sqlalchemy import select, text
+from models import JobApplication, ExecutionLog, SystemLog, DailyApplicationRollup, get_engine
+
+DEFAULT_RETENTION_DAYS = 90
+DEFAULT_BATCH_SIZE = 5000
+PARTITION_MONTHS_AHEAD = 2
+
+def month_start(value):
+    """해당 월의 1일"""
+    return date(value.year, value.month, 1)
+
+def add_months(value, months):
+    """월 단위 더하기 (1일 기준)"""
+    month_index = value.year * 12 + value.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+def partition_name(table_name, month):
+    """월별 파티션 이름 (예: system_logs_p202401)"""
+    return f"{table_name}_p{month.strftime('%Y%m')}"
+
+def is_partitioned(connection, table_name):
+    """파티션 테이블 여부"""
+    if connection.dialect.name != 'postgresql':
+        return False
+    return connection.execute(text("""
+        SELECT EXISTS (
+            SELECT 1 FROM pg_partitioned_table p
+            JOIN pg_class c ON c.oid = p.partrelid
+            WHERE c.relname = :table_name AND pg_table_is_visible(c.oid)
+        )
+    """), {'table_name': table_name}).scalar()
+
+def list_partitions(connection, table_name):
+    """월별 파티션 목록 [(이름, 시작월)]"""
+    rows = connection.execute(text("""
+        SELECT child.relname FROM pg_inherits i
+        JOIN pg_class parent ON parent.oid = i.inhparent
+        JOIN pg_class child ON child.oid = i.inhrelid
+        WHERE parent.relname = :table_name AND pg_table_is_visible(parent.oid)
+    """), {'table_name': table_name}).scalars().all()
+
+    pattern = re.compile(rf"^{re.escape(table_name)}_p(\d{{4}})(\d{{2}})$")
+    partitions = []
+    for name in rows:
+        match = pattern.match(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda item: item[1])
+
+def ensure_monthly_partitions(connection, table_name, start_month=None, months_ahead=PARTITION_MONTHS_AHEAD):
+    """start_month부터 months_ahead개월 뒤까지 월별 파티션 생성"""
+    current = month_start(datetime.now())
+    month = start_month or current
+    last_month = add_months(current, months_ahead)
+    created = []
+
+    while month <= last_month:
+        name = partition_name(table_name, month)
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table_name} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+        ))
+        created.append(name)
+        month = add_months(month, 1)
+    return created
+
+def drop_expired_partitions(connection, table_name, cutoff_date, progress=print):
+    """cutoff_date 이전 데이터만 담은 파티션 삭제"""
+    dropped = []
+    for name, month in list_partitions(connection, table_name):
+        if add_months(month, 1) <= cutoff_date.date():
+            connection.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            dropped.append(name)
+            progress(f"  {table_name}: 파티션 {name} 삭제")
+    return dropped
+
+def chunked_delete(engine, table, column, cutoff, batch_size=DEFAULT_BATCH_SIZE, progress=print):
+    """보존 기간이 지난 행을 batch_size개씩 나누어 삭제 (배치마다 커밋)"""
+    total_deleted = 0
+    started = time.perf_counter()
+
+    while True:
+        ids = select(table.c.id).where(column < cutoff).order_by(table.c.id).limit(batch_size)
+        with engine.begin() as connection:
+            deleted = connection.execute(table.delete().where(table.c.id.in_(ids.scalar_subquery()))).rowcount
+
+        total_deleted += deleted
+        if deleted:
+            progress(f"  {table.name}: {total_deleted}개 삭제 ({time.perf_counter() - started:.1f}초)")
+        if deleted < batch_size:
+            break
+
+    return total_deleted
+
+def run_retention(days=DEFAULT_RETENTION_DAYS, batch_size=DEFAULT_BATCH_SIZE, progress=print, engine=None):
+    """보존 기간 정리 실행 후 테이블별 삭제 결과 반환"""
+    engine = engine or get_engine()
+    cutoff_date = datetime.now() - timedelta(days=days)
+    result = {}
+
+    # 시간 기준 테이블: 파티션이면 파티션 삭제, 아니면 배치 삭제
+    for model, column in ((JobApplication, JobApplication.application_date),
+                          (SystemLog, SystemLog.created_at)):
+        table = model.__table__
+        with engine.begin() as connection:
+            partitioned = is_partitioned(connection, table.name)
+            if partitioned:
+                ensure_monthly_partitions(connection, table.name)
+                dropped = drop_expired_partitions(connection, table.name, cutoff_date, progress)
+
+        if partitioned:
+            # 경계 월에 남은 행은 배치 삭제로 정리
+            deleted = chunked_delete(engine, table, column, cutoff_date, batch_size, progress)
+            result[table.name] = {'mode': 'partition', 'dropped_partitions': dropped, 'deleted_rows': deleted}
+        else:
+            deleted = chunked_delete(engine, table, column, cutoff_date, batch_size, progress)
+            result[table.name] = {'mode': 'chunked', 'deleted_rows': deleted}
+
+    # 실행 로그 (execution_date는 YYYY-MM-DD 문자열)
+    execution_table = ExecutionLog.__table__
+    deleted = chunked_delete(engine, execution_table, ExecutionLog.execution_date,
+                             cutoff_date.strftime('%Y-%m-%d'), batch_size, progress)
+    result[execution_table.name] = {'mode': 'chunked', 'deleted_rows': deleted}
+
+    # 일별 집계는 하루 한 행 단위라 한 번에 삭제
+    with engine.begin() as connection:
+        rollup_table = DailyApplicationRollup.__table__
+        deleted = connection.execute(
+            rollup_table.delete().where(DailyApplicationRollup.rollup_date < cutoff_date.date())
+        ).rowcount
+    result[DailyApplicationRollup.__tablename__] = {'mode': 'chunked', 'deleted_rows': deleted}
+
+    return result
+
+def partition_system_logs(engine=None, progress=print):
+    """system_logs를 월별 파티션 테이블로 변환 (기존 데이터 복사)"""
+    engine = engine or get_engine()
+    table_name = SystemLog.__tablename__
+
+    with engine.begin() as connection:
+        if connection.dialect.name != 'postgresql':
+            raise RuntimeError("월별 파티션은 PostgreSQL에서만 지원됩니다")
+        if is_partitioned(connection, table_name):
+            progress(f"{table_name}은(는) 이미 파티션 테이블입니다")
+            return False
+
+        oldest = connection.execute(text(f"SELECT MIN(created_at) FROM {table_name}")).scalar()
+        start_month = month_start(oldest) if oldest else month_start(datetime.now())
+
+        connection.execute(text(f"ALTER TABLE {table_name} RENAME TO {table_name}_legacy"))
+        connection.execute(text(f"ALTER INDEX IF EXISTS {table_name}_pkey RENAME TO {table_name}_legacy_pkey"))
+        for index in SystemLog.__table__.indexes:
+            connection.execute(text(f"ALTER INDEX IF EXISTS {index.name} RENAME TO {index.name}_legacy"))
+
+        # 파티션 키(created_at)를 기본 키에 포함해야 함
+        connection.execute(text(f"""
+            CREATE TABLE {table_name} (
+                id SERIAL,
+                log_level VARCHAR(20) NOT NULL,
+                message TEXT NOT NULL,
+                module VARCHAR(100),
+                function_name VARCHAR(100),
+                execution_id INTEGER,
+                created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+                PRIMARY KEY (id, created_at)
+            ) PARTITION BY RANGE (created_at)
+        """))
+        for index in SystemLog.__table__.indexes:
+            index.create(bind=connection)
+
+        created = ensure_monthly_partitions(connection, table_name, start_month=start_month)
+        connection.execute(text(f"CREATE TABLE IF NOT EXISTS {table_name}_default PARTITION OF {table_name} DEFAULT"))
+
+        copied = connection.execute(text(f"""
+            INSERT INTO {table_name} (id, log_level, message, module, function_name, execution_id, created_at)
+            SELECT id, log_level, message, module, function_name, execution_id, created_at
+            FROM {table_name}_legacy
+        """)).rowcount
+        connection.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table_name}', 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {table_name}), 0) + 1, false)"
+        ))
+        connection.execute(text(f"DROP TABLE {table_name}_legacy"))
+
+    progress(f"{table_name} 파티션 변환 완료: 파티션 {len(created)}개, {copied}개 행 복사")
+    return True
+
+def main():
+    """정기 유지보수 진입점 (스케줄러에서 실행)"""
+    days = DEFAULT_RETENTION_DAYS
+    batch_size = DEFAULT_BATCH_SIZE
+    for arg in sys.argv[1:]:
+        if arg.startswith("--days="):
+            days = int(arg.split("=", 1)[1])
+        elif arg.startswith("--batch-size="):
+            batch_size = int(arg.split("=", 1)[1])
+
+    if "--partition-system-logs" in sys.argv:
+        partition_system_logs()
+
+    print(f"보존 기간 정리 시작 (보존 {days}일, 배치 {batch_size}개)")
+    result = run_retention(days=days, batch_size=batch_size)
+    for table_name, info in result.items():
+        dropped = info.get('dropped_partitions')
+        dropped_text = f", 파티션 {len(dropped)}개 삭제" if dropped else ""
+        print(f"정리 완료: {table_name} ({info['mode']}) {info['deleted_rows']}개 삭제{dropped_text}")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"유지보수 실행 실패: {str(e)}")
+        sys.exit(1)
@@ -0,0 +1,189 @@
+"""
+데이터베이스 스키마 마이그레이션 모듈
+Versioned schema migrations for the PostgreSQL database
+"""
+
+import os
+import sys
+import threading
+from datetime import datetime
+from sqlalchemy import inspect, text, select, func, cast, Date
+from job_candidate import canonical_job_id_updates
+from models import (
+    JobApplication, ExecutionLog, UserConfiguration, SystemLog, SchemaMigration,
+    DailyApplicationRollup, SelectorStat, SearchWatermark, JobPosting, SearchCursor, get_engine
+)
+from storage import SEARCH_CURSOR_KEY
+
+# 마이그레이션 실행 시 다른 프로세스와의 충돌 방지용 advisory lock 키
+MIGRATION_LOCK_KEY = 7301
+
+_schema_checked = False
+_schema_lock = threading.Lock()
+
+def _create_base_tables(connection):
+    """기본 테이블 생성"""
+    for model in (JobApplication, ExecutionLog, UserConfiguration, SystemLog):
+        model.__table__.create(bind=connection, checkfirst=True)
+
+def _create_lookup_indexes(connection):
+    """회사/날짜 범위 조회용 인덱스 생성"""
+    for model in (JobApplication, ExecutionLog):
+        for index in model.__table__.indexes:
+            index.create(bind=connection, checkfirst=True)
+
+def _create_daily_rollup(connection):
+    """일별 지원 집계 테이블 생성 및 기존 지원 기록으로 채우기"""
+    rollup = DailyApplicationRollup.__table__
+    rollup.create(bind=connection, checkfirst=True)
+    
+    application_day = cast(JobApplication.application_date, Date)
+    keyword = func.coalesce(JobApplication.keyword, '')
+    connection.execute(rollup.delete())
+    connection.execute(
+        rollup.insert().from_select(
+            ['rollup_date', 'keyword', 'application_count'],
+            select(application_day, keyword, func.count(JobApplication.id))
+                .group_by(application_day, keyword)
+        )
+    )
+
+def _create_history_keyset_index(connection):
+    """지원 이력 키셋 페이지네이션용 (application_date, id) 인덱스로 교체"""
+    for index in JobApplication.__table__.indexes:
+        index.create(bind=connection, checkfirst=True)
+    connection.execute(text("DROP INDEX IF EXISTS ix_job_applications_application_date"))
+
+def _create_selector_stats(connection):
+    """선택자 적중 통계 테이블 생성"""
+    SelectorStat.__table__.create(bind=connection, checkfirst=True)
+
+def _create_search_watermarks(connection):
+    """키워드/지역별 증분 수집 기준점 테이블 생성"""
+    SearchWatermark.__table__.create(bind=connection, checkfirst=True)
+
+def _add_execution_keyword_stats(connection):
+    """실행 기록에 키워드별 중복 통계 컬럼 추가"""
+    columns = {column['name'] for column in inspect(connection).get_columns(ExecutionLog.__tablename__)}
+    if 'keyword_stats' not in columns:
+        connection.execute(text("ALTER TABLE execution_logs ADD COLUMN keyword_stats TEXT"))
+
+def _create_job_postings(connection):
+    """상세 페이지 파싱 결과 캐시 테이블 생성"""
+    JobPosting.__table__.create(bind=connection, checkfirst=True)
+
+def _canonicalize_job_ids(connection):
+    """기존 지원 기록의 job_id를 URL 해시에서 사람인 공고 번호(rec_idx)로 변경"""
+    table = JobApplication.__table__
+    rows = connection.execute(select(table.c.id, table.c.job_id, table.c.job_url)).all()
+    updates = canonical_job_id_updates(rows, (row.job_id for row in rows))
+    for row_id, job_id in updates:
+        connection.execute(table.update().where(table.c.id == row_id).values(job_id=job_id))
+
+def _create_search_cursors(connection):
+    """검색 위치 테이블 생성 (설정 테이블에 저장하던 이전 값은 삭제)"""
+    SearchCursor.__table__.create(bind=connection, checkfirst=True)
+    table = UserConfiguration.__table__
+    connection.execute(table.delete().where(table.c.config_key == SEARCH_CURSOR_KEY))
+
+def _reset_selector_stats(connection):
+    """일치한 모든 선택자를 적중으로 집계하던 선택자 통계 초기화"""
+    connection.execute(SelectorStat.__table__.delete())
+
+# (버전, 설명, 적용 함수) - 버전은 항상 증가하는 순서로 추가
+MIGRATIONS = [
+    (1, "기본 테이블 생성", _create_base_tables),
+    (2, "회사/날짜 범위 조회 인덱스 추가", _create_lookup_indexes),
+    (3, "일별 지원 집계 테이블 추가", _create_daily_rollup),
+    (4, "지원 이력 키셋 페이지네이션 인덱스", _create_history_keyset_index),
+    (5, "선택자 적중 통계 테이블 추가", _create_selector_stats),
+    (6, "키워드별 증분 수집 기준점 테이블 추가", _create_search_watermarks),
+    (7, "실행 기록 키워드별 중복 통계 컬럼 추가", _add_execution_keyword_stats),
+    (8, "공고 상세 파싱 캐시 테이블 추가", _create_job_postings),
+    (9, "지원 기록 job_id를 공고 번호로 변경", _canonicalize_job_ids),
+    (10, "검색 위치 테이블 분리", _create_search_cursors),
+    (11, "선택자 적중 통계 초기화 (사용한 선택자만 적중으로 집계)", _reset_selector_stats),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+def get_current_version(connection):
+    """현재 적용된 스키마 버전 조회 (기록이 없으면 0)"""
+    if not inspect(connection).has_table(SchemaMigration.__tablename__):
+        return 0
+    version = connection.execute(
+        text(f"SELECT MAX(version) FROM {SchemaMigration.__tablename__}")
+    ).scalar()
+    return version or 0
+
+def get_pending_migrations(current_version):
+    """적용되지 않은 마이그레이션 목록"""
+    return [migration for migration in MIGRATIONS if migration[0] > current_version]
+
+def migrate(engine=None):
+    """대기 중인 마이그레이션 적용 후 적용된 버전 목록 반환"""
+    global _schema_checked
+    
+    engine = engine or get_engine()
+    applied = []
+    
+    with engine.begin() as connection:
+        if connection.dialect.name == 'postgresql':
+            connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {'key': MIGRATION_LOCK_KEY})
+        
+        SchemaMigration.__table__.create(bind=connection, checkfirst=True)
+        current_version = get_current_version(connection)
+        
+        for version, description, apply in get_pending_migrations(current_version):
+            apply(connection)
+            connection.execute(
+                SchemaMigration.__table__.insert().values(
+                    version=version,
+                    description=description,
+                    applied_at=datetime.now()
+                )
+            )
+            applied.append(version)
+            print(f"마이그레이션 적용: v{version} - {description}")
+    
+    _schema_checked = True
+    return applied
+
+def ensure_schema():
+    """프로세스당 한 번만 스키마 버전 확인 (이후 호출은 비용 없음)"""
+    global _schema_checked
+    if _schema_checked:
+        return
+    
+    with _schema_lock:
+        if _schema_checked:
+            return
+        
+        engine = get_engine()
+        with engine.connect() as connection:
+            current_version = get_current_version(connection)
+        
+        if current_version < LATEST_VERSION:
+            if os.getenv("AUTO_MIGRATE", "true").lower() != "true":
+                raise RuntimeError(
+                    f"데이터베이스 스키마가 최신이 아닙니다 (v{current_version} < v{LATEST_VERSION}). "
+                    "'python main.py --migrate'를 실행해주세요."
+                )
+            migrate(engine)
+        
+        _schema_checked = True
+
+def main():
+    """--migrate 진입점"""
+    applied = migrate()
+    if applied:
+        print(f"마이그레이션 완료: {len(applied)}개 적용 (현재 v{LATEST_VERSION})")
+    else:
+        print(f"적용할 마이그레이션이 없습니다 (현재 v{LATEST_VERSION})")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"마이그레이션 실패: {str(e)}")
+        sys.exit(1)
@@ -3,10 +3,11 @@ PostgreSQL 데이터베이스 모델
 Database models for PostgreSQL
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, BigInteger, String, Date, DateTime, Boolean, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
 from datetime import datetime
+import threading
 import os
 
 Base = declarative_base()
@@ -25,6 +26,22 @@ class JobApplication(Base):
     status = Column(String(50), default='applied', nullable=False)  # applied, interview, rejected, hired
     created_at = Column(DateTime, default=datetime.now, nullable=False)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+    
+    __table_args__ = (
+        # 회사별 최근 지원 확인 (company_name = ? AND application_date >= ?)
+        Index('ix_job_applications_company_date', 'company_name', 'application_date',
+              postgresql_include=['id']),
+        # 날짜 범위 조회 및 (application_date, id) 키셋 페이지네이션
+        Index('ix_job_applications_date_id', 'application_date', 'id'),
+    )
+
+class DailyApplicationRollup(Base):
+    """일별/키워드별 지원 수 집계 (record_application에서 증분 갱신)"""
+    __tablename__ = 'daily_application_rollup'
+    
+    rollup_date = Column(Date, primary_key=True)
+    keyword = Column(String(100), primary_key=True, default='')  # 키워드 없음은 빈 문자열
+    application_count = Column(Integer, default=0, nullable=False)
 
 class ExecutionLog(Base):
     """실행 기록"""
@@ -34,12 +51,19 @@ class ExecutionLog(Base):
     execution_date = Column(String(10), unique=True, nullable=False, index=True)  # YYYY-MM-DD
     applications_count = Column(Integer, default=0, nullable=False)
     keywords_searched = Column(Text, nullable=True)  # JSON string of keywords
+    keyword_stats = Column(Text, nullable=True)  # JSON: 키워드별 결과/신규/중복 공고 수
     start_time = Column(DateTime, nullable=True)
     end_time = Column(DateTime, nullable=True)
     status = Column(String(50), default='completed', nullable=False)  # running, completed, failed
     error_message = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.now, nullable=False)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+    
+    __table_args__ = (
+        # 마지막 사용 키워드 조회 (keywords_searched IS NOT NULL ORDER BY created_at DESC)
+        Index('ix_execution_logs_created_at_keywords', 'created_at',
+              postgresql_where=keywords_searched.isnot(None)),
+    )
 
 class UserConfiguration(Base):
     """사용자 설정"""
@@ -64,6 +88,58 @@ class SystemLog(Base):
     execution_id = Column(Integer, nullable=True)  # Reference to execution_logs.id
     created_at = Column(DateTime, default=datetime.now, nullable=False, index=True)
 
+class SelectorStat(Base):
+    """페이지 유형별 선택자 적중 통계 (선택자 탐색 순서 학습용)"""
+    __tablename__ = 'selector_stats'
+    
+    page_type = Column(String(50), primary_key=True)  # job_detail, apply_form 등
+    selector = Column(String(500), primary_key=True)  # "css:..." 또는 "xpath:..."
+    attempts = Column(Integer, default=0, nullable=False)
+    hits = Column(Integer, default=0, nullable=False)
+    last_hit_at = Column(DateTime, nullable=True)
+
+class SearchWatermark(Base):
+    """키워드/지역별 증분 수집 기준점 (이미 확인한 가장 최신 공고)"""
+    __tablename__ = 'search_watermarks'
+    
+    keyword = Column(String(255), primary_key=True)
+    location = Column(String(100), primary_key=True)
+    newest_rec_idx = Column(BigInteger, nullable=False)  # 사람인 공고 번호 (등록 순으로 증가)
+    newest_registered_at = Column(DateTime, nullable=True)  # 목록에 표시된 등록일
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+
+class SearchCursor(Base):
+    """중단된 검색 위치 (페이지마다 갱신되므로 설정 테이블과 분리)"""
+    __tablename__ = 'search_cursors'
+    
+    name = Column(String(100), primary_key=True)
+    cursor_value = Column(Text, nullable=False)  # {'date', 'signature', 'keyword', 'page'} JSON
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+
+class JobPosting(Base):
+    """상세 페이지 파싱 결과 캐시 (지원하지 않은 공고의 재방문 방지)"""
+    __tablename__ = 'job_postings'
+    
+    job_id = Column(String(255), primary_key=True)  # 사람인 공고 번호 (rec_idx)
+    job_url = Column(Text, nullable=False)
+    title = Column(String(500), nullable=True)
+    company_name = Column(String(255), nullable=True)
+    deadline = Column(String(100), nullable=True)
+    apply_mode = Column(String(20), nullable=True)  # immediate, homepage, closed
+    has_apply_button = Column(Boolean, default=False, nullable=False)
+    has_apply_text = Column(Boolean, default=False, nullable=False)
+    content_hash = Column(String(32), nullable=False)  # 파싱 결과 해시
+    last_seen_at = Column(DateTime, default=datetime.now, nullable=False)  # 검색 결과에서 마지막으로 본 시각
+    last_fetched_at = Column(DateTime, default=datetime.now, nullable=False)  # 상세 페이지를 마지막으로 가져온 시각
+
+class SchemaMigration(Base):
+    """적용된 스키마 버전 기록"""
+    __tablename__ = 'schema_migrations'
+    
+    version = Column(Integer, primary_key=True, autoincrement=False)
+    description = Column(String(255), nullable=False)
+    applied_at = Column(DateTime, default=datetime.now, nullable=False)
+
 def get_database_url():
     """DATABASE_URL 환경변수에서 PostgreSQL 연결 URL 가져오기"""
     return os.environ.get('DATABASE_URL')
@@ -86,16 +162,77 @@ def create_engine():
     )
     return engine
 
+# 프로세스 전역 엔진 / 세션 레지스트리 (최초 사용 시 생성)
+_engine = None
+_session_registry = None
+_engine_lock = threading.Lock()
+
+def get_engine():
+    """프로세스 전역 SQLAlchemy 엔진 조회 (지연 생성)"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine()
+    return _engine
+
+def get_session_registry():
+    """스레드별 세션을 관리하는 scoped_session 레지스트리 조회"""
+    global _session_registry
+    if _session_registry is None:
+        engine = get_engine()
+        with _engine_lock:
+            if _session_registry is None:
+                _session_registry = scoped_session(
+                    sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                )
+    return _session_registry
+
 def create_session():
-    """데이터베이스 세션 생성"""
-    engine = create_engine()
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    return SessionLocal()
+    """데이터베이스 세션 생성 (현재 스레드의 세션 반환)"""
+    return get_session_registry()()
+
+def remove_session():
+    """현재 스레드의 세션 정리 (요청/스레드 종료 시 호출)"""
+    if _session_registry is not None:
+        _session_registry.remove()
+
+def dispose_engine():
+    """엔진과 커넥션 풀 폐기 (프로세스 fork 후 또는 종료 시)"""
+    global _engine, _session_registry
+    with _engine_lock:
+        if _session_registry is not None:
+            _session_registry.remove()
+            _session_registry = None
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
+
+def get_pool_status():
+    """커넥션 풀 상태 조회"""
+    if _engine is None:
+        return {
+            'initialized': False,
+            'pool_size': 0,
+            'checked_in': 0,
+            'checked_out': 0,
+            'overflow': 0
+        }
+    
+    pool = _engine.pool
+    return {
+        'initialized': True,
+        'pool_size': pool.size(),
+        'checked_in': pool.checkedin(),
+        'checked_out': pool.checkedout(),
+        'overflow': max(pool.overflow(), 0),
+        'status': pool.status()
+    }
 
 def init_database():
-    """데이터베이스 테이블 초기화"""
-    engine = create_engine()
-    Base.metadata.create_all(bind=engine)
+    """데이터베이스 테이블 초기화 (대기 중인 마이그레이션 적용)"""
+    from migrations import migrate
+    migrate()
     print("PostgreSQL 데이터베이스 테이블이 초기화되었습니다")
 
 if __name__ == "__main__":
@@ -0,0 +1,159 @@
+"""
+페이지 대기 및 지원 간격 관리 모듈
+Condition-based navigation waits, per-step timing metrics and application pacing
+
+탐색 후 고정 시간 대기 대신 readyState, 대상 요소, URL 변경 등의 조건이
+충족되는 즉시 진행하고(시간 제한 있음), 단계별 실제 대기 시간과 기존 고정 대기
+예상 시간을 함께 기록한다. 지원 간 간격(min/max_delay_between_applications)은
+ApplicationPacer가 별도로 관리한다.
+"""
+
+import time
+import random
+from selenium.common.exceptions import (
+    TimeoutException, StaleElementReferenceException, JavascriptException, UnexpectedAlertPresentException
+)
+from selenium.webdriver.support.ui import WebDriverWait
+
+DEFAULT_TIMEOUT = 10
+POLL_INTERVAL = 0.1
+
+# 페이지 이동 중 조건 확인 시 일시적으로 발생하는 예외 (발생하면 다음 확인까지 대기)
+TRANSIENT_EXCEPTIONS = (StaleElementReferenceException, JavascriptException)
+
+# 페이지 로드 전략별 준비 완료로 보는 readyState
+READY_STATES_NORMAL = ("complete",)
+READY_STATES_EAGER = ("interactive", "complete")  # eager: DOMContentLoaded 이후
+
+# readyState가 준비 완료 상태이고 후보 선택자 중 하나라도 존재하는지 확인
+READY_WITH_ELEMENT_SCRIPT = """
+if (!arguments[1].includes(document.readyState)) {
+    return false;
+}
+return arguments[0].some(selector => {
+    try {
+        return document.querySelector(selector) !== null;
+    } catch (e) {
+        return false;
+    }
+});
+"""
+
+class WaitMetrics:
+    """단계별 대기 시간 통계 (기존 고정 대기 대비 절감 시간 포함)"""
+
+    def __init__(self):
+        self.steps = {}
+
+    def record(self, step, elapsed, legacy_seconds, timed_out=False):
+        """대기 결과 기록 (legacy_seconds는 기존 고정 대기의 평균 시간)"""
+        stats = self.steps.setdefault(step, {
+            'count': 0,
+            'timeouts': 0,
+            'total_seconds': 0.0,
+            'max_seconds': 0.0,
+            'legacy_seconds': 0.0
+        })
+        stats['count'] += 1
+        stats['timeouts'] += 1 if timed_out else 0
+        stats['total_seconds'] += elapsed
+        stats['max_seconds'] = max(stats['max_seconds'], elapsed)
+        stats['legacy_seconds'] += legacy_seconds
+
+    def saved_seconds(self):
+        """기존 고정 대기 대비 절감된 전체 시간"""
+        return sum(stats['legacy_seconds'] - stats['total_seconds'] for stats in self.steps.values())
+
+    def summary_lines(self):
+        """단계별 요약 문자열 목록"""
+        lines = []
+        for step, stats in self.steps.items():
+            average = stats['total_seconds'] / stats['count']
+            lines.append(
+                f"{step}: {stats['count']}회, 평균 {average:.2f}초 (최대 {stats['max_seconds']:.2f}초, "
+                f"시간 초과 {stats['timeouts']}회), 기존 고정 대기 {stats['legacy_seconds']:.1f}초 → "
+                f"{stats['total_seconds']:.1f}초"
+            )
+        return lines
+
+class PageWaiter:
+    """조건 기반 탐색 대기 (조건 충족 즉시 반환, 시간 초과 시 False)"""
+
+    def __init__(self, driver, metrics=None, timeout=DEFAULT_TIMEOUT, ready_states=READY_STATES_NORMAL):
+        self.driver = driver
+        self.metrics = metrics or WaitMetrics()
+        self.timeout = timeout
+        self.ready_states = list(ready_states)
+
+    def _is_ready(self, driver):
+        """document.readyState가 준비 완료 상태인지 확인"""
+        return driver.execute_script("return document.readyState") in self.ready_states
+
+    def until(self, step, condition, legacy_range=(0, 0), timeout=None):
+        """condition(driver)이 참이 될 때까지 대기하고 단계별 시간 기록"""
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            WebDriverWait(self.driver, timeout or self.timeout, poll_frequency=POLL_INTERVAL,
+                          ignored_exceptions=TRANSIENT_EXCEPTIONS).until(condition)
+        except TimeoutException:
+            timed_out = True
+        self.metrics.record(step, time.perf_counter() - started, sum(legacy_range) / 2, timed_out)
+        return not timed_out
+
+    def ready(self, step, legacy_range=(0, 0), timeout=None):
+        """document.readyState가 준비 완료 상태가 될 때까지 대기"""
+        return self.until(step, self._is_ready, legacy_range, timeout)
+
+    def element(self, step, selectors, legacy_range=(0, 0), timeout=None):
+        """페이지 로드 완료 후 후보 선택자 중 하나가 나타날 때까지 대기"""
+        return self.until(
+            step,
+            lambda driver: driver.execute_script(READY_WITH_ELEMENT_SCRIPT, list(selectors), self.ready_states),
+            legacy_range,
+            timeout
+        )
+
+    def url_change(self, step, previous_url, previous_handles=None, legacy_range=(0, 0), timeout=None, selectors=()):
+        """URL이 바뀌거나(새 창 포함) 후보 선택자가 나타날 때까지 대기
+
+        previous_url과 previous_handles(창 개수)는 클릭 전에 읽어 전달한다.
+        클릭 후에 읽으면 이미 열린 새 창이 포함되어 변화를 감지하지 못한다.
+        """
+        if previous_handles is None:
+            previous_handles = len(self.driver.window_handles)
+
+        def changed(driver):
+            try:
+                if driver.current_url != previous_url or len(driver.window_handles) != previous_handles:
+                    return True
+            except UnexpectedAlertPresentException:
+                return True  # 알림창이 뜬 경우도 응답으로 간주
+            return bool(selectors) and driver.execute_script(READY_WITH_ELEMENT_SCRIPT, list(selectors), self.ready_states)
+
+        return self.until(step, changed, legacy_range, timeout)
+
+class ApplicationPacer:
+    """지원 간 최소 간격 관리
+
+    직전 지원 시작 시각부터 무작위 간격(min~max초)이 지날 때까지 기다린다.
+    페이지 로드에 쓴 시간은 간격에 포함되므로 고정 대기가 이중으로 더해지지 않는다.
+    """
+
+    def __init__(self, min_delay, max_delay):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._next_allowed = 0.0
+        self.stats = {'applications': 0, 'paced_seconds': 0.0}
+
+    def wait_turn(self):
+        """다음 지원 시작 전까지 남은 간격만큼 대기"""
+        remaining = self._next_allowed - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+            self.stats['paced_seconds'] += remaining
+
+    def started(self):
+        """지원 시작 시각 기록 및 다음 지원 가능 시각 계산"""
+        self.stats['applications'] += 1
+        self._next_allowed = time.monotonic() + random.uniform(self.min_delay, self.max_delay)
@@ -3,33 +3,45 @@ PostgreSQL 데이터베이스 관리 모듈
 PostgreSQL database management module for tracking applications
 """
 
-from models import JobApplication, ExecutionLog, UserConfiguration, SystemLog, create_session, init_database
+from models import (
+    JobApplication, ExecutionLog, UserConfiguration, SystemLog, DailyApplicationRollup, SelectorStat, SearchWatermark,
+    JobPosting, SearchCursor, create_session, get_pool_status
+)
+from migrations import ensure_schema
+from config_cache import CONFIG_VERSION_KEY
+from storage import ApplicationStore, HISTORY_PAGE_SIZE, encode_cursor, decode_cursor, clamp_page_size
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, or_, select, tuple_, cast, case, Integer, Text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import datetime, timedelta
 import json
 import logging
 
-class PostgresApplicationDatabase:
+class PostgresApplicationDatabase(ApplicationStore):
     """PostgreSQL 기반 애플리케이션 데이터베이스"""
     
+    write_queue_key = 'postgresql'
+    
     def __init__(self):
         self.init_database()
     
     def init_database(self):
-        """데이터베이스 초기화"""
+        """데이터베이스 초기화 (스키마 버전 확인은 프로세스당 1회)"""
         try:
-            init_database()
-            print("PostgreSQL 데이터베이스 초기화 완료")
+            ensure_schema()
         except Exception as e:
             print(f"데이터베이스 초기화 실패: {str(e)}")
             raise
     
+    def get_pool_status(self):
+        """커넥션 풀 상태 조회 (사용 중/오버플로 연결 수)"""
+        return get_pool_status()
+    
     def is_already_applied(self, job_id):
         """중복 지원 확인"""
         session = create_session()
         try:
-            application = session.query(JobApplication).filter_by(job_id=job_id).first()
+            application = session.query(JobApplication.id).filter_by(job_id=job_id).first()
             return application is not None
         except Exception as e:
             print(f"중복 지원 확인 오류: {str(e)}")
@@ -41,9 +53,8 @@ class PostgresApplicationDatabase:
         """회사명 기반 중복 지원 확인 (최근 30일 내)"""
         session = create_session()
         try:
-            from datetime import timedelta
             cutoff_date = datetime.now() - timedelta(days=days)
-            application = session.query(JobApplication)\
+            application = session.query(JobApplication.id)\
                 .filter(JobApplication.company_name == company_name)\
                 .filter(JobApplication.application_date >= cutoff_date)\
                 .first()
@@ -54,14 +65,89 @@ class PostgresApplicationDatabase:
         finally:
             session.close()
     
-    def record_application(self, job_id, job_url, company_name, job_title, keyword=None):
-        """지원 기록 저장"""
+    def find_applied(self, job_ids, company_names, days=30):
+        """후보 공고 중 이미 지원한 job_id와 최근 days일 내 지원한 회사를 한 번의 쿼리로 조회"""
+        job_ids = list(set(job_ids))
+        company_names = list(set(company_names))
+        if not job_ids and not company_names:
+            return {'job_ids': set(), 'companies': set()}
+        
+        session = create_session()
+        try:
+            cutoff_date = datetime.now() - timedelta(days=days)
+            rows = session.query(
+                    JobApplication.job_id,
+                    JobApplication.company_name,
+                    JobApplication.application_date
+                )\
+                .filter(or_(
+                    JobApplication.job_id.in_(job_ids),
+                    (JobApplication.company_name.in_(company_names)) & (JobApplication.application_date >= cutoff_date)
+                ))\
+                .all()
+            
+            requested_job_ids = set(job_ids)
+            requested_companies = set(company_names)
+            return {
+                'job_ids': {row.job_id for row in rows if row.job_id in requested_job_ids},
+                'companies': {row.company_name for row in rows
+                              if row.company_name in requested_companies and row.application_date >= cutoff_date}
+            }
+        finally:
+            session.close()
+    
+    def get_dedup_snapshot(self, days=30, since_id=0):
+        """중복 확인 인덱스용 지원 이력 일괄 조회
+        
+        since_id 이후의 job_id 목록과 최근 days일 내 회사별 마지막 지원일을
+        한 번의 쿼리로 가져온다.
+        """
         session = create_session()
         try:
-            # 중복 확인
-            if self.is_already_applied(job_id):
-                return False
+            cutoff_date = datetime.now() - timedelta(days=days)
+            
+            rows = session.query(
+                    JobApplication.id,
+                    JobApplication.job_id,
+                    JobApplication.company_name,
+                    JobApplication.application_date
+                )\
+                .filter(or_(JobApplication.id > since_id, JobApplication.application_date >= cutoff_date))\
+                .all()
             
+            job_ids = []
+            companies = {}
+            max_id = since_id
+            for row_id, job_id, company_name, application_date in rows:
+                if row_id > since_id:
+                    job_ids.append(job_id)
+                    max_id = max(max_id, row_id)
+                if application_date >= cutoff_date:
+                    last_applied = companies.get(company_name)
+                    if last_applied is None or application_date > last_applied:
+                        companies[company_name] = application_date
+            
+            return {'job_ids': job_ids, 'companies': companies, 'max_id': max_id}
+        finally:
+            session.close()
+    
+    def record_application(self, job_id, job_url, company_name, job_title, keyword=None, defer=False):
+        """지원 기록 저장 (중복은 job_id 유니크 제약으로 판정)
+        
+        defer=True이면 지연 쓰기 큐에 넣고 바로 반환한다 (이미 지원한 job_id이거나 직접 저장에 실패하면 False).
+        """
+        if defer:
+            return self._defer_application({
+                'job_id': job_id,
+                'job_url': job_url,
+                'company_name': company_name,
+                'job_title': job_title,
+                'keyword': keyword,
+                'application_date': datetime.now()
+            })
+        
+        session = create_session()
+        try:
             application = JobApplication(
                 job_id=job_id,
                 job_url=job_url,
@@ -72,6 +158,11 @@ class PostgresApplicationDatabase:
             )
             
             session.add(application)
+            session.flush()
+            
+            # 같은 트랜잭션에서 일별 집계 증분 갱신
+            self._increment_daily_rollup(session, application.application_date.date(), keyword)
+            
             session.commit()
             print(f"지원 기록 저장: {company_name} - {job_title}")
             return True
@@ -87,6 +178,55 @@ class PostgresApplicationDatabase:
         finally:
             session.close()
     
+    def record_applications_batch(self, applications):
+        """지원 기록 일괄 저장 (INSERT ... ON CONFLICT DO NOTHING)"""
+        session = create_session()
+        try:
+            now = datetime.now()
+            rows = [dict(application, created_at=now, updated_at=now) for application in applications]
+            inserted = session.execute(
+                pg_insert(JobApplication)
+                    .values(rows)
+                    .on_conflict_do_nothing()
+                    .returning(JobApplication.application_date, JobApplication.keyword)
+            ).all()
+            
+            # 실제로 저장된 행만 일별 집계에 반영
+            rollup_counts = {}
+            for application_date, keyword in inserted:
+                key = (application_date.date(), keyword or '')
+                rollup_counts[key] = rollup_counts.get(key, 0) + 1
+            if rollup_counts:
+                self._upsert_daily_rollup(session, [
+                    {'rollup_date': rollup_date, 'keyword': keyword, 'application_count': count}
+                    for (rollup_date, keyword), count in rollup_counts.items()
+                ])
+            
+            session.commit()
+            return len(inserted)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    def _increment_daily_rollup(self, session, rollup_date, keyword, count=1):
+        """일별/키워드별 집계 증가 (upsert)"""
+        self._upsert_daily_rollup(session, [{
+            'rollup_date': rollup_date,
+            'keyword': keyword or '',
+            'application_count': count
+        }])
+    
+    def _upsert_daily_rollup(self, session, rows):
+        """일별 집계 행들을 더하기 upsert"""
+        statement = pg_insert(DailyApplicationRollup).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=[DailyApplicationRollup.rollup_date, DailyApplicationRollup.keyword],
+            set_={'application_count': DailyApplicationRollup.application_count + statement.excluded.application_count}
+        )
+        session.execute(statement)
+    
     def is_executed_today(self, execution_date):
         """당일 실행 여부 확인"""
         session = create_session()
@@ -99,7 +239,8 @@ class PostgresApplicationDatabase:
         finally:
             session.close()
     
-    def record_execution(self, execution_date, applications_count, keywords=None, status='completed', error_message=None):
+    def record_execution(self, execution_date, applications_count, keywords=None, status='completed', error_message=None,
+                         keyword_stats=None):
         """실행 기록 저장"""
         session = create_session()
         try:
@@ -110,6 +251,7 @@ class PostgresApplicationDatabase:
                 # 기존 기록 업데이트
                 existing_log.applications_count = applications_count
                 existing_log.keywords_searched = json.dumps(keywords) if keywords else None
+                existing_log.keyword_stats = json.dumps(keyword_stats, ensure_ascii=False) if keyword_stats else None
                 existing_log.end_time = datetime.now()
                 existing_log.status = status
                 existing_log.error_message = error_message
@@ -120,6 +262,7 @@ class PostgresApplicationDatabase:
                     execution_date=execution_date,
                     applications_count=applications_count,
                     keywords_searched=json.dumps(keywords) if keywords else None,
+                    keyword_stats=json.dumps(keyword_stats, ensure_ascii=False) if keyword_stats else None,
                     start_time=datetime.now(),
                     end_time=datetime.now(),
                     status=status,
@@ -137,30 +280,68 @@ class PostgresApplicationDatabase:
         finally:
             session.close()
     
+    def _application_history_columns(self):
+        """지원 이력 화면에 필요한 컬럼만 선택"""
+        return (
+            JobApplication.id,
+            JobApplication.job_id,
+            JobApplication.company_name,
+            JobApplication.job_title,
+            JobApplication.keyword,
+            JobApplication.application_date,
+            JobApplication.status
+        )
+    
+    def _application_row_to_dict(self, row):
+        """지원 이력 행을 dict로 변환"""
+        return {
+            'id': row.id,
+            'job_id': row.job_id,
+            'company_name': row.company_name,
+            'job_title': row.job_title,
+            'keyword': row.keyword,
+            'application_date': row.application_date.isoformat(),
+            'status': row.status
+        }
+    
+    def _execution_row_to_dict(self, row):
+        """실행 이력 행을 dict로 변환"""
+        return {
+            'id': row.id,
+            'execution_date': row.execution_date,
+            'applications_count': row.applications_count,
+            'keywords': json.loads(row.keywords_searched) if row.keywords_searched else [],
+            'keyword_stats': json.loads(row.keyword_stats) if row.keyword_stats else {},
+            'status': row.status,
+            'start_time': row.start_time.isoformat() if row.start_time else None,
+            'end_time': row.end_time.isoformat() if row.end_time else None
+        }
+    
+    def _execution_history_columns(self):
+        """실행 이력 화면에 필요한 컬럼만 선택"""
+        return (
+            ExecutionLog.id,
+            ExecutionLog.execution_date,
+            ExecutionLog.applications_count,
+            ExecutionLog.keywords_searched,
+            ExecutionLog.keyword_stats,
+            ExecutionLog.status,
+            ExecutionLog.start_time,
+            ExecutionLog.end_time
+        )
+    
     def get_application_history(self, days=30):
         """지원 이력 조회"""
         session = create_session()
         try:
             cutoff_date = datetime.now() - timedelta(days=days)
             
-            applications = session.query(JobApplication)\
+            applications = session.query(*self._application_history_columns())\
                 .filter(JobApplication.application_date >= cutoff_date)\
-                .order_by(desc(JobApplication.application_date))\
+                .order_by(desc(JobApplication.application_date), desc(JobApplication.id))\
                 .all()
             
-            result = []
-            for app in applications:
-                result.append({
-                    'id': app.id,
-                    'job_id': app.job_id,
-                    'company_name': app.company_name,
-                    'job_title': app.job_title,
-                    'keyword': app.keyword,
-                    'application_date': app.application_date.isoformat(),
-                    'status': app.status
-                })
-            
-            return result
+            return [self._application_row_to_dict(app) for app in applications]
             
         except Exception as e:
             print(f"지원 이력 조회 오류: {str(e)}")
@@ -168,31 +349,47 @@ class PostgresApplicationDatabase:
         finally:
             session.close()
     
+    def get_application_history_page(self, page_size=HISTORY_PAGE_SIZE, cursor=None):
+        """지원 이력 페이지 조회 ((application_date, id) 기준 키셋 페이지네이션)"""
+        page_size = clamp_page_size(page_size)
+        session = create_session()
+        try:
+            query = session.query(*self._application_history_columns())
+            
+            if cursor:
+                cursor_date, cursor_id = decode_cursor(cursor)
+                query = query.filter(
+                    tuple_(JobApplication.application_date, JobApplication.id)
+                    < tuple_(datetime.fromisoformat(cursor_date), cursor_id)
+                )
+            
+            rows = query\
+                .order_by(desc(JobApplication.application_date), desc(JobApplication.id))\
+                .limit(page_size + 1)\
+                .all()
+            
+            items = [self._application_row_to_dict(row) for row in rows[:page_size]]
+            next_cursor = None
+            if len(rows) > page_size:
+                last = rows[page_size - 1]
+                next_cursor = encode_cursor(last.application_date.isoformat(), last.id)
+            
+            return {'items': items, 'next_cursor': next_cursor}
+        finally:
+            session.close()
+    
     def get_execution_history(self, days=30):
         """실행 이력 조회"""
         session = create_session()
         try:
             cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
             
-            executions = session.query(ExecutionLog)\
+            executions = session.query(*self._execution_history_columns())\
                 .filter(ExecutionLog.execution_date >= cutoff_date)\
                 .order_by(desc(ExecutionLog.execution_date))\
                 .all()
             
-            result = []
-            for exec_log in executions:
-                keywords = json.loads(exec_log.keywords_searched) if exec_log.keywords_searched else []
-                result.append({
-                    'id': exec_log.id,
-                    'execution_date': exec_log.execution_date,
-                    'applications_count': exec_log.applications_count,
-                    'keywords': keywords,
-                    'status': exec_log.status,
-                    'start_time': exec_log.start_time.isoformat() if exec_log.start_time else None,
-                    'end_time': exec_log.end_time.isoformat() if exec_log.end_time else None
-                })
-            
-            return result
+            return [self._execution_row_to_dict(exec_log) for exec_log in executions]
             
         except Exception as e:
             print(f"실행 이력 조회 오류: {str(e)}")
@@ -200,44 +397,92 @@ class PostgresApplicationDatabase:
         finally:
             session.close()
     
-    def get_statistics(self):
-        """통계 정보 조회"""
+    def get_execution_history_page(self, page_size=HISTORY_PAGE_SIZE, cursor=None):
+        """실행 이력 페이지 조회 ((execution_date, id) 기준 키셋 페이지네이션)"""
+        page_size = clamp_page_size(page_size)
         session = create_session()
         try:
-            # 총 지원 수
-            total_applications = session.query(func.count(JobApplication.id)).scalar()
+            query = session.query(*self._execution_history_columns())
             
-            # 오늘 지원 수
-            today = datetime.now().strftime('%Y-%m-%d')
-            today_applications = session.query(func.count(JobApplication.id))\
-                .filter(func.date(JobApplication.application_date) == today)\
-                .scalar()
+            if cursor:
+                cursor_date, cursor_id = decode_cursor(cursor)
+                query = query.filter(
+                    tuple_(ExecutionLog.execution_date, ExecutionLog.id) < tuple_(cursor_date, cursor_id)
+                )
             
-            # 이번 주 지원 수
-            week_ago = datetime.now() - timedelta(days=7)
-            week_applications = session.query(func.count(JobApplication.id))\
-                .filter(JobApplication.application_date >= week_ago)\
-                .scalar()
+            rows = query\
+                .order_by(desc(ExecutionLog.execution_date), desc(ExecutionLog.id))\
+                .limit(page_size + 1)\
+                .all()
             
-            # 최근 실행 수
-            recent_executions = session.query(func.count(ExecutionLog.id))\
-                .filter(ExecutionLog.status == 'completed')\
-                .scalar()
+            items = [self._execution_row_to_dict(row) for row in rows[:page_size]]
+            next_cursor = None
+            if len(rows) > page_size:
+                last = rows[page_size - 1]
+                next_cursor = encode_cursor(last.execution_date, last.id)
             
-            # 키워드별 통계
-            keyword_stats = session.query(JobApplication.keyword, func.count(JobApplication.id))\
-                .filter(JobApplication.keyword.isnot(None))\
-                .group_by(JobApplication.keyword)\
+            return {'items': items, 'next_cursor': next_cursor}
+        finally:
+            session.close()
+    
+    def get_statistics(self):
+        """통계 정보 조회 (일별 집계 테이블에서 한 번의 쿼리로 계산)"""
+        session = create_session()
+        try:
+            today = datetime.now().date()
+            week_start = today - timedelta(days=6)  # 오늘 포함 최근 7일
+            month_start = today.replace(day=1)
+            count = DailyApplicationRollup.application_count
+            
+            completed_executions = select(func.count(ExecutionLog.id))\
+                .where(ExecutionLog.status == 'completed')\
+                .scalar_subquery()
+            
+            # ROLLUP(keyword)으로 키워드별 행과 전체 합계 행을 함께 조회
+            # (집계 행이 없어도 전체 합계 행은 항상 반환됨)
+            rows = session.query(
+                    func.grouping(DailyApplicationRollup.keyword),
+                    DailyApplicationRollup.keyword,
+                    func.sum(count),
+                    func.sum(count).filter(DailyApplicationRollup.rollup_date == today),
+                    func.sum(count).filter(DailyApplicationRollup.rollup_date >= week_start),
+                    func.sum(count).filter(DailyApplicationRollup.rollup_date >= month_start),
+                    completed_executions
+                )\
+                .group_by(func.rollup(DailyApplicationRollup.keyword))\
                 .all()
             
-            keyword_counts = {keyword: count for keyword, count in keyword_stats}
+            total_applications = 0
+            today_applications = 0
+            week_applications = 0
+            month_applications = 0
+            recent_executions = 0
+            keyword_counts = {}
+            
+            for is_total, keyword, total, today_count, week_count, month_count, executions in rows:
+                if is_total:
+                    total_applications = total or 0
+                    today_applications = today_count or 0
+                    week_applications = week_count or 0
+                    month_applications = month_count or 0
+                    recent_executions = executions or 0
+                elif keyword:
+                    keyword_counts[keyword] = int(total or 0)
+            
+            top_companies = session.query(JobApplication.company_name, func.count(JobApplication.id))\
+                .group_by(JobApplication.company_name)\
+                .order_by(desc(func.count(JobApplication.id)))\
+                .limit(5)\
+                .all()
             
             return {
-                'total_applications': total_applications or 0,
-                'today_applications': today_applications or 0,
-                'week_applications': week_applications or 0,
-                'total_executions': recent_executions or 0,
-                'keyword_statistics': keyword_counts
+                'total_applications': int(total_applications),
+                'today_applications': int(today_applications),
+                'week_applications': int(week_applications),
+                'total_executions': int(recent_executions),
+                'keyword_statistics': keyword_counts,
+                'month_applications': int(month_applications),
+                'top_companies': [(company, int(company_count)) for company, company_count in top_companies]
             }
             
         except Exception as e:
@@ -247,47 +492,42 @@ class PostgresApplicationDatabase:
                 'today_applications': 0,
                 'week_applications': 0,
                 'total_executions': 0,
-                'keyword_statistics': {}
+                'keyword_statistics': {},
+                'month_applications': 0,
+                'top_companies': []
             }
         finally:
             session.close()
     
-    def cleanup_old_records(self, days=90):
-        """오래된 기록 정리"""
-        session = create_session()
+    def cleanup_old_records(self, days=90, batch_size=5000, progress=print):
+        """오래된 기록 정리 (파티션 삭제 또는 배치 단위 삭제)"""
         try:
-            cutoff_date = datetime.now() - timedelta(days=days)
-            
-            # 오래된 지원 기록 삭제
-            deleted_apps = session.query(JobApplication)\
-                .filter(JobApplication.application_date < cutoff_date)\
-                .delete()
-            
-            # 오래된 실행 로그 삭제
-            cutoff_date_str = cutoff_date.strftime('%Y-%m-%d')
-            deleted_logs = session.query(ExecutionLog)\
-                .filter(ExecutionLog.execution_date < cutoff_date_str)\
-                .delete()
-            
-            # 오래된 시스템 로그 삭제
-            deleted_sys_logs = session.query(SystemLog)\
-                .filter(SystemLog.created_at < cutoff_date)\
-                .delete()
-            
-            session.commit()
+            from maintenance import run_retention
+            result = run_retention(days=days, batch_size=batch_size, progress=progress)
             
+            deleted_apps = result['job_applications']['deleted_rows']
+            deleted_logs = result['execution_logs']['deleted_rows']
+            deleted_sys_logs = result['system_logs']['deleted_rows']
             print(f"정리 완료: 지원기록 {deleted_apps}개, 실행로그 {deleted_logs}개, 시스템로그 {deleted_sys_logs}개")
             return True
             
         except Exception as e:
-            session.rollback()
             print(f"기록 정리 오류: {str(e)}")
             return False
-        finally:
-            session.close()
     
-    def log_system_message(self, level, message, module=None, function_name=None, execution_id=None):
-        """시스템 로그 기록"""
+    def log_system_message(self, level, message, module=None, function_name=None, execution_id=None, defer=False):
+        """시스템 로그 기록 (defer=True이면 지연 쓰기 큐 사용)"""
+        if defer:
+            self._get_write_queue().put('system_log', {
+                'log_level': level.upper(),
+                'message': message,
+                'module': module,
+                'function_name': function_name,
+                'execution_id': execution_id,
+                'created_at': datetime.now()
+            })
+            return True
+        
         session = create_session()
         try:
             system_log = SystemLog(
@@ -309,40 +549,264 @@ class PostgresApplicationDatabase:
         finally:
             session.close()
     
-    def get_configuration(self, key, default_value=None):
-        """설정값 조회"""
+    def log_system_messages_batch(self, messages):
+        """시스템 로그 일괄 기록"""
         session = create_session()
         try:
-            config = session.query(UserConfiguration).filter_by(config_key=key).first()
-            return config.config_value if config else default_value
-        except Exception as e:
-            print(f"설정 조회 오류: {str(e)}")
-            return default_value
+            session.execute(pg_insert(SystemLog).values(messages).on_conflict_do_nothing())
+            session.commit()
+            return len(messages)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    def load_configurations(self):
+        """설정 전체를 한 번의 쿼리로 조회"""
+        session = create_session()
+        try:
+            rows = session.query(UserConfiguration.config_key, UserConfiguration.config_value).all()
+            return {row.config_key: row.config_value for row in rows}
+        finally:
+            session.close()
+    
+    def get_configuration_version(self):
+        """설정 버전 카운터 조회"""
+        session = create_session()
+        try:
+            version = session.query(UserConfiguration.config_value)\
+                .filter(UserConfiguration.config_key == CONFIG_VERSION_KEY)\
+                .scalar()
+            return int(version or 0)
         finally:
             session.close()
     
-    def set_configuration(self, key, value, description=None):
-        """설정값 저장"""
+    def save_configurations(self, items):
+        """{키: (값, 설명)}을 한 트랜잭션으로 저장하고 증가한 설정 버전 반환"""
+        now = datetime.now()
         session = create_session()
         try:
-            config = session.query(UserConfiguration).filter_by(config_key=key).first()
+            insert_stmt = pg_insert(UserConfiguration).values([
+                {
+                    'config_key': key,
+                    'config_value': str(value),
+                    'description': description,
+                    'created_at': now,
+                    'updated_at': now
+                }
+                for key, (value, description) in items.items()
+            ])
+            session.execute(insert_stmt.on_conflict_do_update(
+                index_elements=['config_key'],
+                set_={
+                    'config_value': insert_stmt.excluded.config_value,
+                    'description': insert_stmt.excluded.description,
+                    'updated_at': insert_stmt.excluded.updated_at
+                }
+            ))
+            
+            # 버전 카운터 증가 (다른 프로세스의 캐시 무효화)
+            version_stmt = pg_insert(UserConfiguration).values(
+                config_key=CONFIG_VERSION_KEY,
+                config_value='1',
+                description='설정 캐시 버전',
+                created_at=now,
+                updated_at=now
+            )
+            version = session.execute(version_stmt.on_conflict_do_update(
+                index_elements=['config_key'],
+                set_={
+                    'config_value': cast(cast(UserConfiguration.config_value, Integer) + 1, Text),
+                    'updated_at': version_stmt.excluded.updated_at
+                }
+            ).returning(UserConfiguration.config_value)).scalar()
             
-            if config:
-                config.config_value = str(value)
-                config.description = description
-                config.updated_at = datetime.now()
+            session.commit()
+            return int(version)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    def load_selector_stats(self):
+        """선택자 적중 통계 전체 조회 {(페이지 유형, 선택자): (시도 수, 적중 수)}"""
+        session = create_session()
+        try:
+            rows = session.query(
+                SelectorStat.page_type, SelectorStat.selector, SelectorStat.attempts, SelectorStat.hits
+            ).all()
+            return {(row.page_type, row.selector): (row.attempts, row.hits) for row in rows}
+        finally:
+            session.close()
+    
+    def record_selector_stats(self, updates):
+        """선택자 시도/적중 증가분 일괄 반영"""
+        if not updates:
+            return 0
+        
+        session = create_session()
+        try:
+            insert_stmt = pg_insert(SelectorStat).values(updates)
+            session.execute(insert_stmt.on_conflict_do_update(
+                index_elements=['page_type', 'selector'],
+                set_={
+                    'attempts': SelectorStat.attempts + insert_stmt.excluded.attempts,
+                    'hits': SelectorStat.hits + insert_stmt.excluded.hits,
+                    'last_hit_at': func.coalesce(insert_stmt.excluded.last_hit_at, SelectorStat.last_hit_at)
+                }
+            ))
+            session.commit()
+            return len(updates)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    def get_search_watermark(self, keyword, location):
+        """키워드/지역의 증분 수집 기준점 조회 (없으면 None)"""
+        session = create_session()
+        try:
+            row = session.query(SearchWatermark.newest_rec_idx, SearchWatermark.newest_registered_at)\
+                .filter(SearchWatermark.keyword == keyword, SearchWatermark.location == location)\
+                .first()
+            if row is None:
+                return None
+            return {'rec_idx': row.newest_rec_idx, 'registered_at': row.newest_registered_at}
+        finally:
+            session.close()
+    
+    def save_search_watermark(self, keyword, location, rec_idx, registered_at=None):
+        """증분 수집 기준점 저장 (기존 값보다 최신일 때만 앞으로 이동)"""
+        session = create_session()
+        try:
+            now = datetime.now()
+            insert_stmt = pg_insert(SearchWatermark).values(
+                keyword=keyword, location=location, newest_rec_idx=rec_idx,
+                newest_registered_at=registered_at, updated_at=now
+            )
+            advanced = insert_stmt.excluded.newest_rec_idx >= SearchWatermark.newest_rec_idx
+            session.execute(insert_stmt.on_conflict_do_update(
+                index_elements=['keyword', 'location'],
+                set_={
+                    'newest_rec_idx': func.greatest(SearchWatermark.newest_rec_idx, insert_stmt.excluded.newest_rec_idx),
+                    'newest_registered_at': case(
+                        (advanced, func.coalesce(insert_stmt.excluded.newest_registered_at,
+                                                 SearchWatermark.newest_registered_at)),
+                        else_=SearchWatermark.newest_registered_at
+                    ),
+                    'updated_at': now
+                }
+            ))
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    def load_search_cursor_value(self, name):
+        """저장된 검색 위치 문자열 조회 (없으면 None)"""
+        session = create_session()
+        try:
+            row = session.query(SearchCursor.cursor_value).filter(SearchCursor.name == name).first()
+            return row.cursor_value if row else None
+        finally:
+            session.close()
+    
+    def store_search_cursor_value(self, name, value):
+        """검색 위치 문자열 저장 (설정 버전을 올리지 않음, value가 None이면 삭제)"""
+        session = create_session()
+        try:
+            if value is None:
+                session.query(SearchCursor).filter(SearchCursor.name == name).delete(synchronize_session=False)
             else:
-                config = UserConfiguration(
-                    config_key=key,
-                    config_value=str(value),
-                    description=description
-                )
-                session.add(config)
-            
+                now = datetime.now()
+                insert_stmt = pg_insert(SearchCursor).values(name=name, cursor_value=value, updated_at=now)
+                session.execute(insert_stmt.on_conflict_do_update(
+                    index_elements=['name'],
+                    set_={'cursor_value': insert_stmt.excluded.cursor_value, 'updated_at': now}
+                ))
             session.commit()
-        except Exception as e:
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    def get_job_postings(self, job_ids):
+        """공고 번호별 캐시된 상세 파싱 결과를 한 번의 쿼리로 조회 ({job_id: dict})"""
+        job_ids = list(set(job_ids))
+        if not job_ids:
+            return {}
+        session = create_session()
+        try:
+            rows = session.query(
+                    JobPosting.job_id, JobPosting.title, JobPosting.company_name, JobPosting.deadline,
+                    JobPosting.apply_mode, JobPosting.has_apply_button, JobPosting.has_apply_text,
+                    JobPosting.content_hash, JobPosting.last_seen_at, JobPosting.last_fetched_at
+                )\
+                .filter(JobPosting.job_id.in_(job_ids))\
+                .all()
+            return {
+                row.job_id: {
+                    'title': row.title,
+                    'company': row.company_name,
+                    'deadline': row.deadline,
+                    'apply_mode': row.apply_mode,
+                    'has_apply_button': row.has_apply_button,
+                    'has_apply_text': row.has_apply_text,
+                    'content_hash': row.content_hash,
+                    'last_seen_at': row.last_seen_at,
+                    'last_fetched_at': row.last_fetched_at
+                }
+                for row in rows
+            }
+        finally:
+            session.close()
+    
+    def save_job_posting(self, job_id, job_url, detail, content_hash):
+        """상세 파싱 결과 저장 (마지막으로 본/가져온 시각 갱신)"""
+        session = create_session()
+        try:
+            now = datetime.now()
+            values = {
+                'job_url': job_url,
+                'title': detail.title,
+                'company_name': detail.company,
+                'deadline': detail.deadline,
+                'apply_mode': detail.apply_mode,
+                'has_apply_button': detail.has_apply_button,
+                'has_apply_text': detail.has_apply_text,
+                'content_hash': content_hash,
+                'last_seen_at': now,
+                'last_fetched_at': now
+            }
+            insert_stmt = pg_insert(JobPosting).values(job_id=job_id, **values)
+            session.execute(insert_stmt.on_conflict_do_update(index_elements=['job_id'], set_=values))
+            session.commit()
+        except Exception:
             session.rollback()
-            raise e
+            raise
+        finally:
+            session.close()
+    
+    def touch_job_postings(self, job_ids):
+        """검색 결과에서 다시 본 캐시 공고의 마지막으로 본 시각 갱신"""
+        job_ids = list(set(job_ids))
+        if not job_ids:
+            return
+        session = create_session()
+        try:
+            session.query(JobPosting)\
+                .filter(JobPosting.job_id.in_(job_ids))\
+                .update({JobPosting.last_seen_at: datetime.now()}, synchronize_session=False)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
         finally:
             session.close()
     
@@ -370,42 +834,6 @@ class PostgresApplicationDatabase:
             return 'bio'  # 기본값
         finally:
             session.close()
-    
-    def save_last_used_keywords(self, keywords):
-        """마지막 사용 키워드 저장"""
-        try:
-            self.set_configuration('last_keywords', keywords, '마지막으로 사용한 검색 키워드')
-        except Exception as e:
-            pass  # 저장 실패해도 진행
-    
-    def get_last_used_location(self):
-        """마지막으로 사용한 지역 조회"""
-        try:
-            # 가장 최근 실행 기록이나 설정에서 지역 조회
-            return self.get_configuration('last_location', '서울')
-        except Exception as e:
-            return '서울'  # 기본값
-    
-    def save_last_used_location(self, location):
-        """마지막 사용 지역 저장"""
-        try:
-            self.set_configuration('last_location', location, '마지막으로 사용한 검색 지역')
-        except Exception as e:
-            pass  # 저장 실패해도 진행
-    
-    def get_last_used_max_applications(self):
-        """마지막으로 사용한 최대 지원수 조회"""
-        try:
-            return int(self.get_configuration('last_max_applications', '100'))
-        except Exception as e:
-            return 100  # 기본값
-    
-    def save_last_used_max_applications(self, max_apps):
-        """마지막 사용 최대 지원수 저장"""
-        try:
-            self.set_configuration('last_max_applications', str(max_apps), '마지막으로 사용한 최대 지원수')
-        except Exception as e:
-            pass  # 저장 실패해도 진행
 
 if __name__ == "__main__":
     # 데이터베이스 테스트
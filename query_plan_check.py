@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+주요 조회 쿼리 실행 계획 점검 스크립트
+EXPLAIN-based check that hot queries use indexes on a large synthetic table
+
+별도 스키마에 대용량 합성 데이터를 만든 뒤 주요 조회 쿼리의 실행 계획을 확인하고,
+순차 스캔(Seq Scan)으로 떨어지는 쿼리가 있으면 종료 코드 1을 반환한다.
+"""
+
+import sys
+import json
+from datetime import datetime, timedelta
+from sqlalchemy import select, desc, text, tuple_
+from models import Base, JobApplication, ExecutionLog, get_engine
+
+PLAN_SCHEMA = "plan_check"
+APPLICATION_ROWS = 200000
+EXECUTION_ROWS = 50000
+
+def build_hot_queries():
+    """점검 대상 쿼리 목록 (postgres_database의 조회 조건과 동일)"""
+    now = datetime.now()
+    
+    return {
+        'is_already_applied': select(JobApplication.id)
+            .where(JobApplication.job_id == 'job_123456')
+            .limit(1),
+        'is_company_already_applied': select(JobApplication.id)
+            .where(JobApplication.company_name == 'company_42')
+            .where(JobApplication.application_date >= now - timedelta(days=30))
+            .limit(1),
+        'application_history': select(JobApplication.id, JobApplication.application_date)
+            .where(JobApplication.application_date >= now - timedelta(days=3))
+            .order_by(desc(JobApplication.application_date), desc(JobApplication.id)),
+        'application_history_page': select(JobApplication.id, JobApplication.application_date)
+            .where(tuple_(JobApplication.application_date, JobApplication.id) < tuple_(now - timedelta(days=200), 100000))
+            .order_by(desc(JobApplication.application_date), desc(JobApplication.id))
+            .limit(51),
+        'execution_history': select(ExecutionLog.id, ExecutionLog.execution_date)
+            .where(ExecutionLog.execution_date >= (now - timedelta(days=30)).strftime('%Y-%m-%d'))
+            .order_by(desc(ExecutionLog.execution_date)),
+        'execution_history_page': select(ExecutionLog.id, ExecutionLog.execution_date)
+            .where(tuple_(ExecutionLog.execution_date, ExecutionLog.id) < tuple_('2050-01-01', 18000))
+            .order_by(desc(ExecutionLog.execution_date), desc(ExecutionLog.id))
+            .limit(51),
+        'last_used_keywords': select(ExecutionLog)
+            .where(ExecutionLog.keywords_searched.isnot(None))
+            .order_by(ExecutionLog.created_at.desc())
+            .limit(1),
+    }
+
+def populate(connection):
+    """합성 데이터 생성"""
+    connection.execute(text(f"""
+        INSERT INTO {PLAN_SCHEMA}.job_applications
+            (job_id, job_url, company_name, job_title, keyword, application_date, status, created_at, updated_at)
+        SELECT 'job_' || i,
+               'https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=' || i,
+               'company_' || (i % 20000),
+               'title_' || i,
+               (ARRAY['바이오', '생명공학', '제약', '의료기기'])[1 + i % 4],
+               now() - (i % 1095) * interval '1 day' - (i % 86400) * interval '1 second',
+               'applied', now(), now()
+        FROM generate_series(1, :rows) AS i
+    """), {'rows': APPLICATION_ROWS})
+    
+    connection.execute(text(f"""
+        INSERT INTO {PLAN_SCHEMA}.execution_logs
+            (execution_date, applications_count, keywords_searched, status, created_at, updated_at)
+        SELECT to_char(date '2000-01-01' + i, 'YYYY-MM-DD'),
+               i % 100,
+               CASE WHEN i % 3 = 0 THEN NULL ELSE '["바이오", "제약"]' END,
+               'completed',
+               timestamp '2000-01-01' + i * interval '1 day',
+               now()
+        FROM generate_series(1, :rows) AS i
+    """), {'rows': EXECUTION_ROWS})
+    
+    connection.execute(text(f"ANALYZE {PLAN_SCHEMA}.job_applications"))
+    connection.execute(text(f"ANALYZE {PLAN_SCHEMA}.execution_logs"))
+
+def find_seq_scans(plan):
+    """실행 계획 트리에서 순차 스캔 노드 찾기"""
+    found = []
+    if plan.get('Node Type') == 'Seq Scan':
+        found.append(plan.get('Relation Name'))
+    for child in plan.get('Plans', []):
+        found.extend(find_seq_scans(child))
+    return found
+
+def explain(connection, statement):
+    """EXPLAIN (FORMAT JSON) 결과의 최상위 계획 반환"""
+    compiled = statement.compile(dialect=connection.dialect)
+    result = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]['Plan']
+
+def run_check():
+    """실행 계획 점검"""
+    engine = get_engine()
+    if engine.dialect.name != 'postgresql':
+        print("PostgreSQL 데이터베이스에서만 실행 계획을 점검할 수 있습니다")
+        return False
+    
+    tables = [JobApplication.__table__, ExecutionLog.__table__]
+    failures = []
+    
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            connection.execute(text(f"CREATE SCHEMA {PLAN_SCHEMA}"))
+            connection.execute(text(f"SET LOCAL search_path TO {PLAN_SCHEMA}"))
+            Base.metadata.create_all(bind=connection, tables=tables)
+            
+            print(f"합성 데이터 생성 중... (지원 기록 {APPLICATION_ROWS}건, 실행 기록 {EXECUTION_ROWS}건)")
+            populate(connection)
+            
+            for name, statement in build_hot_queries().items():
+                plan = explain(connection, statement)
+                seq_scans = find_seq_scans(plan)
+                if seq_scans:
+                    failures.append(name)
+                    print(f"  ✗ {name}: 순차 스캔 발생 ({', '.join(seq_scans)})")
+                else:
+                    print(f"  ✓ {name}: {plan.get('Node Type')} (예상 비용 {plan.get('Total Cost')})")
+        finally:
+            # 점검용 스키마는 트랜잭션 롤백으로 제거
+            transaction.rollback()
+    
+    if failures:
+        print(f"실행 계획 점검 실패: {len(failures)}개 쿼리가 순차 스캔을 사용합니다")
+        return False
+    
+    print("실행 계획 점검 통과: 모든 주요 쿼리가 인덱스를 사용합니다")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if run_check() else 1)
@@ -0,0 +1,143 @@
+"""
+브라우저 리소스 정책 모듈
+Per-page-type resource blocking via CDP and per-navigation transfer metrics
+
+링크 수집과 지원 버튼 클릭에 필요 없는 이미지, 글꼴, 미디어, 광고/분석 스크립트를
+CDP Network.setBlockedURLs로 차단한다. 페이지 유형별로 차단(block) 그룹과
+예외(allow) 패턴을 지정하며, 탐색마다 전송 바이트와 로드 시간을 기록한다.
+"""
+
+# 차단 대상 URL 패턴 그룹 (CDP 와일드카드 '*' 사용)
+RESOURCE_GROUPS = {
+    'images': ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp"],
+    'fonts': ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    'media': ["*.mp4", "*.webm", "*.mp3", "*.m3u8"],
+    'tracking': [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*googlesyndication.com*", "*googleadservices.com*", "*facebook.net*",
+        "*connect.facebook.*", "*criteo.*", "*wcs.naver.net*", "*hotjar.com*",
+        "*analytics.tiktok.com*", "*ads-partners.coupang.com*"
+    ],
+}
+
+# 페이지 유형별 정책 (block: 차단 그룹, allow: 차단에서 제외할 URL 패턴)
+# 로그인 화면은 보안 문자/자동화 탐지에 영향을 주지 않도록 추적 스크립트만 차단
+PAGE_POLICIES = {
+    'login': {'block': ['tracking'], 'allow': ["*recaptcha*", "*captcha*"]},
+    'search': {'block': ['images', 'fonts', 'media', 'tracking'], 'allow': []},
+    'job_detail': {'block': ['images', 'fonts', 'media', 'tracking'], 'allow': []},
+    'apply_form': {'block': ['images', 'fonts', 'media', 'tracking'], 'allow': ["*captcha*"]},
+}
+
+# 현재 문서의 전송 바이트와 로드 시간 (Navigation/Resource Timing API)
+# 다른 출처 리소스는 Timing-Allow-Origin 헤더가 없으면 transferSize가 0으로 집계된다.
+NAVIGATION_METRICS_SCRIPT = """
+const navigation = performance.getEntriesByType('navigation')[0];
+if (!navigation) {
+    return null;
+}
+const resources = performance.getEntriesByType('resource');
+return {
+    document_bytes: navigation.transferSize || 0,
+    resource_bytes: resources.reduce((total, entry) => total + (entry.transferSize || 0), 0),
+    resource_count: resources.length,
+    dom_ready_ms: navigation.domContentLoadedEventEnd || 0,
+    load_ms: navigation.loadEventEnd || 0
+};
+"""
+
+class ResourcePolicy:
+    """페이지 유형별 리소스 차단 적용 및 탐색별 전송량/로드 시간 통계
+
+    차단 목록은 페이지 유형이 바뀔 때만 CDP로 다시 설정한다. 예외(allow) 패턴은
+    Chrome이 urlPatterns(BlockPattern)를 지원하면 차단 패턴보다 먼저 허용 규칙으로
+    전달하고, 지원하지 않으면 예외와 같은 차단 패턴만 빼고 urls로 전달한다.
+    """
+
+    def __init__(self, enabled=True, extra_block=(), extra_allow=(), logger=None):
+        self.enabled = enabled
+        self.extra_block = list(extra_block)
+        self.extra_allow = list(extra_allow)
+        self.logger = logger
+        self._driver = None
+        self._applied_page_type = None
+        self._block_patterns_supported = True
+        self.pages = {}
+
+    def patterns(self, page_type):
+        """페이지 유형의 (차단 패턴, 예외 패턴) 목록"""
+        policy = PAGE_POLICIES.get(page_type, {'block': [], 'allow': []})
+        block = [pattern for group in policy['block'] for pattern in RESOURCE_GROUPS[group]]
+        block.extend(self.extra_block)
+        allow = list(policy['allow']) + self.extra_allow
+        return block, allow
+
+    def apply(self, driver, page_type):
+        """페이지 이동 전 해당 유형의 차단 목록 설정 (유형이 같으면 생략)"""
+        if not self.enabled:
+            return
+        if driver is self._driver and page_type == self._applied_page_type:
+            return
+
+        block, allow = self.patterns(page_type)
+        try:
+            if driver is not self._driver:
+                driver.execute_cdp_cmd("Network.enable", {})
+                self._driver = driver
+            self._set_blocked_urls(driver, block, allow)
+            self._applied_page_type = page_type
+        except Exception as e:
+            self.enabled = False
+            if self.logger:
+                self.logger.warning(f"리소스 차단 설정 실패, 차단 없이 진행: {str(e)}")
+
+    def _set_blocked_urls(self, driver, block, allow):
+        """CDP 차단 목록 설정 (허용 규칙 미지원 Chrome은 urls로 대체)"""
+        if self._block_patterns_supported and allow:
+            url_patterns = ([{'urlPattern': pattern, 'block': False} for pattern in allow]
+                            + [{'urlPattern': pattern, 'block': True} for pattern in block])
+            try:
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {'urlPatterns': url_patterns})
+                return
+            except Exception:
+                self._block_patterns_supported = False
+                if self.logger:
+                    self.logger.info("이 Chrome 버전은 차단 예외 규칙을 지원하지 않아 예외와 같은 패턴만 제외합니다.")
+
+        allowed = set(allow)
+        driver.execute_cdp_cmd("Network.setBlockedURLs",
+                               {'urls': [pattern for pattern in block if pattern not in allowed]})
+
+    def measure(self, driver, page_type, elapsed):
+        """현재 문서의 전송 바이트와 로드 시간 기록 (elapsed: 이동 시작부터 준비 완료까지 초)"""
+        try:
+            timing = driver.execute_script(NAVIGATION_METRICS_SCRIPT)
+        except Exception:
+            timing = None
+        timing = timing or {}
+
+        stats = self.pages.setdefault(page_type, {
+            'navigations': 0,
+            'bytes': 0,
+            'resources': 0,
+            'wall_seconds': 0.0,
+            'dom_ready_ms': 0.0
+        })
+        stats['navigations'] += 1
+        stats['bytes'] += int(timing.get('document_bytes', 0)) + int(timing.get('resource_bytes', 0))
+        stats['resources'] += int(timing.get('resource_count', 0))
+        stats['wall_seconds'] += elapsed
+        stats['dom_ready_ms'] += float(timing.get('dom_ready_ms', 0))
+        return timing
+
+    def summary_lines(self):
+        """페이지 유형별 탐색당 평균 전송량/로드 시간 문자열 목록"""
+        lines = []
+        for page_type, stats in self.pages.items():
+            count = stats['navigations']
+            lines.append(
+                f"{page_type}: {count}회, 평균 {stats['bytes'] / count / 1024:.1f}KB "
+                f"(리소스 {stats['resources'] / count:.1f}개), DOMContentLoaded {stats['dom_ready_ms'] / count:.0f}ms, "
+                f"준비 완료 {stats['wall_seconds'] / count:.2f}초"
+            )
+        return lines
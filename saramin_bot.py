@@ -3,8 +3,10 @@
 Saramin website automation bot using Selenium
 """
 
+import os
 import time
 import random
+import threading
 from datetime import datetime, timedelta
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
@@ -13,8 +15,106 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.common.keys import Keys
-from typing import Optional
+from typing import List, Optional
 import urllib.parse
+from applied_index import AppliedJobIndex
+from job_candidate import JobCandidate, extract_search_results, canonical_job_id
+from selector_engine import SelectorEngine, css, xpath
+from job_detail import APPLY_MODE_CLOSED, parse_job_detail, page_indicates_success, detail_content_hash
+from page_waits import PageWaiter, WaitMetrics, ApplicationPacer, READY_STATES_EAGER, READY_STATES_NORMAL
+from resource_policy import ResourcePolicy
+from browser_profile import BrowserProfile, LOGIN_PROBE_URL, LOGGED_IN_SCRIPT
+from driver_cache import get_driver_cache
+from candidate_registry import CandidateRegistry
+from candidate_pipeline import CandidateQueue, StageMetrics
+from candidate_ranking import CandidateRanker, deadline_days_left
+from storage import release_thread_connections
+
+# 상세 페이지 준비 완료 판단 요소 (공고 본문 또는 지원 버튼)
+DETAIL_READY_SELECTORS = [".wrap_jv_cont", ".jv_header", ".btn_apply", ".job_tit"]
+
+# 검색 결과 페이지당 공고 수 (이보다 적으면 마지막 페이지)
+RESULTS_PER_PAGE = 50
+
+# 페이지 끝의 공고가 이 개수만큼 연속으로 기준점 이전이면 기준점을 지난 것으로 판단
+# (수정되어 위로 올라온 오래된 공고 한두 개로 수집이 일찍 멈추지 않도록)
+WATERMARK_CROSSING_RUN = 3
+
+# 지원서 화면 준비 완료 판단 요소
+APPLY_FORM_SELECTORS = ["input[type='radio'][name*='resume']", ".btn_submit", "input[type='submit']"]
+
+# macOS 기본 Chrome 경로
+CHROME_PATH = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+
+def build_chrome_options(config):
+    """봇용 Chrome 옵션 생성"""
+    options = uc.ChromeOptions()
+    if config.headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-web-security")
+    options.add_argument("--disable-features=VizDisplayCompositor")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-plugins")
+    options.add_argument("--disable-images")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    prefs = {
+        "profile.default_content_setting_values.notifications": 2,
+        "profile.default_content_settings.popups": 0,
+        "profile.managed_default_content_settings.images": 2
+    }
+    options.add_experimental_option("prefs", prefs)
+    # eager: DOMContentLoaded 시점에 driver.get 반환 (이미지/광고 로드 완료를 기다리지 않음)
+    options.page_load_strategy = config.page_load_strategy
+    return options
+
+def acquire_profile(config, logger):
+    """계정별 영구 프로필 잠금 (비활성화되었거나 다른 실행이 사용 중이면 None)"""
+    if not config.browser_profile_dir or not config.username:
+        return None
+    profile = BrowserProfile(config.browser_profile_dir, config.username, logger)
+    if not profile.acquire():
+        logger.warning("다른 실행이 브라우저 프로필을 사용 중입니다. 임시 프로필로 진행합니다.")
+        return None
+    return profile
+
+def resolve_driver_binary(logger):
+    """캐시된 패치 chromedriver 경로와 주 버전 (캐시 미사용/실패 시 (None, None))"""
+    cache = get_driver_cache(logger)
+    if cache is None:
+        return None, None
+    started = time.perf_counter()
+    try:
+        driver_path, major, hit = cache.resolve(CHROME_PATH)
+    except Exception as e:
+        logger.warning(f"chromedriver 캐시 사용 실패, 기본 방식으로 실행: {str(e)}")
+        return None, None
+    if driver_path is None:
+        logger.warning("Chrome 버전을 확인할 수 없어 chromedriver 캐시를 사용하지 않습니다.")
+    else:
+        logger.info(f"chromedriver {major} 캐시 {'적중' if hit else '생성'} ({time.perf_counter() - started:.2f}초)")
+    return driver_path, major
+
+def launch_chrome(config, logger):
+    """undetected-chromedriver로 Chrome 실행 후 (드라이버, 프로필) 반환"""
+    started = time.perf_counter()
+    driver_path, major = resolve_driver_binary(logger)
+    profile = acquire_profile(config, logger)
+    try:
+        driver = uc.Chrome(options=build_chrome_options(config), browser_executable_path=CHROME_PATH,
+                           user_data_dir=profile.path if profile is not None else None,
+                           driver_executable_path=driver_path, version_main=major)
+    except Exception:
+        if profile is not None:
+            profile.release()
+        raise
+    logger.info(f"Chrome 시작 시간: {time.perf_counter() - started:.1f}초 "
+                f"({'캐시된 드라이버' if driver_path else '드라이버 내려받기/패치 포함'})")
+    return driver, profile
 
 class SaraminBot:
     def save_login_page_html(self, filename="saramin_login_debug.html"):
@@ -26,55 +126,139 @@ class SaraminBot:
             self.logger.info(f"로그인 페이지 HTML 저장 완료: {filename}")
         except Exception as e:
             self.logger.error(f"로그인 페이지 HTML 저장 실패: {str(e)}")
+    
+    def save_detail_page_html(self, job_id, page_source):
+        """상세 페이지 HTML 저장 (DETAIL_PAGE_SAVE_DIR 지정 시, 파서 벤치마크용)"""
+        save_dir = getattr(self.config, 'detail_page_save_dir', '')
+        if not save_dir:
+            return
+        try:
+            os.makedirs(save_dir, exist_ok=True)
+            with open(os.path.join(save_dir, f"{job_id}.html"), "w", encoding="utf-8") as f:
+                f.write(page_source)
+        except OSError as e:
+            self.logger.warning(f"상세 페이지 HTML 저장 실패: {str(e)}")
+    
     def __init__(self, config, database, logger):
         self.config = config
         self.database = database
         self.logger = logger
         self.driver: Optional[object] = None  # uc.Chrome 객체
         self.wait: Optional[WebDriverWait] = None
+        self.profile: Optional[BrowserProfile] = None  # 계정별 영구 프로필 (사용 중이면 None)
+        self.lease = None  # 드라이버 풀에서 빌린 경우 반환용 임대 정보
+        self.navigations = 0  # 이 실행에서 수행한 페이지 이동 수 (드라이버 재활용 기준)
+        self.closed = False  # close() 완료 여부 (중복 호출 시 아무것도 하지 않음)
         self.base_url = "https://www.saramin.co.kr"
         self.application_callback = None  # 웹 앱에서 실시간 로그를 위한 콜백 함수
+        self.applied_index: Optional[AppliedJobIndex] = None  # 실행 단위 중복 확인 인덱스
+        self.candidate_registry = CandidateRegistry()  # 키워드 간 중복 공고 병합 (실행마다 새로 생성)
+        self.candidate_queue: Optional[CandidateQueue] = None  # 검색 단계 -> 지원 단계 후보 큐
+        self.ranker: Optional[CandidateRanker] = None  # 지원 순서 점수 (실행 시작 시 과거 통계로 생성)
+        self.stage_metrics = {'discovery': StageMetrics("검색 단계"), 'apply': StageMetrics("지원 단계")}
+        self.driver_lock = threading.Lock()  # 검색/지원 단계가 브라우저를 번갈아 사용
+        self.selectors = SelectorEngine(database, logger)  # 일괄 선택자 탐색 (적중률 순서 학습)
+        self.wait_metrics = WaitMetrics()  # 탐색 단계별 대기 시간 통계
+        self.waiter: Optional[PageWaiter] = None  # 조건 기반 탐색 대기 (드라이버 설정 시 생성)
+        # 지원 간 간격은 탐색 대기와 별도로 관리
+        self.pacer = ApplicationPacer(config.min_delay_between_applications, config.max_delay_between_applications)
+        # 페이지 유형별 리소스 차단 및 탐색별 전송량/로드 시간 통계
+        self.resource_policy = ResourcePolicy(
+            enabled=config.resource_blocking,
+            extra_block=config.resource_block_patterns,
+            extra_allow=config.resource_allow_patterns,
+            logger=logger
+        )
+        # 목록 단계 중복 제외 통계 (상세 페이지 방문을 생략한 횟수)
+        self.prefilter_stats = {
+            'candidates': 0,
+            'batch_queries': 0,
+            'skipped_job_id': 0,
+            'skipped_company': 0,
+            'skipped_company_in_run': 0,
+            'skipped_watermark': 0,
+            'skipped_seen_in_run': 0
+        }
+        # 상세 파싱 캐시 (이번 실행에서 조회한 공고) 및 적중 통계
+        self.posting_cache = {}
+        self.posting_cache_stats = {
+            'lookups': 0,
+            'hits': 0,
+            'stale': 0,
+            'misses': 0,
+            'skipped_visits': 0,
+            'fetched': 0,
+            'changed': 0
+        }
         
     def setup_driver(self):
         """undetected-chromedriver로 Chrome WebDriver 설정 (anti-bot 우회)"""
         try:
-            options = uc.ChromeOptions()
-            if self.config.headless:
-                options.add_argument("--headless=new")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--disable-web-security")
-            options.add_argument("--disable-features=VizDisplayCompositor")
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-plugins")
-            options.add_argument("--disable-images")
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            prefs = {
-                "profile.default_content_setting_values.notifications": 2,
-                "profile.default_content_settings.popups": 0,
-                "profile.managed_default_content_settings.images": 2
-            }
-            options.add_experimental_option("prefs", prefs)
-            # macOS 기본 Chrome 경로 지정
-            chrome_path = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
-            self.driver = uc.Chrome(options=options, browser_executable_path=chrome_path)
-            self.wait = WebDriverWait(self.driver, 10)
+            driver, profile = launch_chrome(self.config, self.logger)
+            self.attach_driver(driver, profile)
             self.logger.info("undetected-chromedriver로 Chrome WebDriver 설정 완료 (anti-bot 우회)")
             return True
         except Exception as e:
             self.logger.error(f"WebDriver 설정 실패: {str(e)}")
             return False
     
+    def attach_driver(self, driver, profile=None, lease=None):
+        """실행 중인 WebDriver 연결 (lease가 있으면 종료 시 드라이버 풀에 반환)"""
+        self.driver = driver
+        self.profile = profile
+        self.lease = lease
+        self.closed = False
+        self.wait = WebDriverWait(self.driver, 10)
+        ready_states = READY_STATES_EAGER if self.config.page_load_strategy == "eager" else READY_STATES_NORMAL
+        self.waiter = PageWaiter(self.driver, self.wait_metrics, timeout=self.config.page_wait_timeout,
+                                 ready_states=ready_states)
+    
+    def is_logged_in(self):
+        """현재 브라우저 세션이 로그인 상태인지 확인 (메인 페이지의 로그아웃 링크)"""
+        try:
+            self.open_page(LOGIN_PROBE_URL, "search")
+            self.waiter.ready("login_probe")
+            current_url = self.driver.current_url
+            if "login" in current_url or "auth" in current_url:
+                return False
+            return bool(self.driver.execute_script(LOGGED_IN_SCRIPT))
+        except Exception as e:
+            self.logger.warning(f"로그인 상태 확인 실패: {str(e)}")
+            return False
+    
+    def restore_session(self):
+        """영구 프로필 또는 저장된 쿠키로 로그인 상태 복원"""
+        if self.profile is None:
+            return False
+        if self.is_logged_in():
+            return True
+        # 프로필에 남지 않는 세션 쿠키는 쿠키 저장소에서 복원 후 다시 확인
+        if self.profile.load_cookies(self.driver):
+            return self.is_logged_in()
+        return False
+    
     def login(self):
-        """사람인 로그인 (하이브리드: 자동 실패 시 수동 로그인 안내)"""
-        if not self.setup_driver():
+        """사람인 로그인 (저장된 세션이 유효하면 생략)"""
+        if self.driver is None and not self.setup_driver():
             return False
-
+        
+        started = time.perf_counter()
+        if self.restore_session():
+            self.logger.info(f"저장된 로그인 세션 사용 - 로그인 생략 ({time.perf_counter() - started:.1f}초)")
+            return True
+        
+        if not self.login_with_credentials():
+            return False
+        if self.profile is not None:
+            self.profile.save_cookies(self.driver)
+        self.logger.info(f"로그인 소요 시간: {time.perf_counter() - started:.1f}초")
+        return True
+    
+    def login_with_credentials(self):
+        """사람인 로그인 (하이브리드: 자동 실패 시 수동 로그인 안내)"""
         self.logger.info("사람인 자동 로그인 시도")
         try:
+            self.resource_policy.apply(self.driver, "login")
             self.driver.get("https://www.saramin.co.kr/zf_user/auth/login")
             self.random_wait(5, 8)
             self.save_login_page_html()
@@ -143,79 +327,349 @@ class SaraminBot:
                 self.logger.error("수동 로그인 실패 또는 추가 인증 필요.")
                 return False
     
+    def load_applied_index(self):
+        """지원 이력 인덱스를 한 번의 쿼리로 불러오기"""
+        try:
+            self.applied_index = AppliedJobIndex.load(
+                self.database,
+                company_window_days=30,
+                bloom_file=self.config.applied_index_bloom_file
+            )
+            self.logger.info(f"지원 이력 인덱스 로드 완료: 공고 {len(self.applied_index)}개, "
+                             f"최근 30일 회사 {len(self.applied_index.company_last_applied)}개")
+        except Exception as e:
+            self.applied_index = None
+            self.logger.warning(f"지원 이력 인덱스 로드 실패, 데이터베이스 조회로 대체: {str(e)}")
+    
+    def is_already_applied(self, job_id):
+        """중복 지원 확인 (인덱스 우선)"""
+        if self.applied_index is not None:
+            return self.applied_index.is_already_applied(job_id)
+        return self.database.is_already_applied(job_id)
+    
+    def is_company_already_applied(self, company_name, days=30):
+        """회사명 기반 중복 지원 확인 (인덱스 우선)"""
+        if self.applied_index is not None:
+            return self.applied_index.is_company_already_applied(company_name, days=days)
+        return self.database.is_company_already_applied(company_name, days=days)
+    
     def search_and_apply_jobs(self):
-        """채용 공고 검색 및 지원"""
-        total_applied = 0
+        """채용 공고 검색 및 지원 (검색 단계와 지원 단계를 동시에 진행)"""
+        # 실행 시작 시 지원 이력 인덱스 일괄 로드
+        self.load_applied_index()
+        self.candidate_registry = CandidateRegistry()
         
-        # 각 키워드별로 검색 및 지원
-        for keyword in self.config.keyword_list:
-            if total_applied >= self.config.max_applications_per_day:
-                self.logger.info(f"일일 최대 지원 수({self.config.max_applications_per_day})에 도달했습니다.")
-                break
-                
-            self.logger.info(f"키워드 '{keyword}' 검색 시작")
-            
-            try:
-                # 키워드별 검색 페이지로 이동
-                search_url = self.build_search_url(keyword)
-                self.driver.get(search_url)
-                self.random_wait(3, 5)
-                
-                self.logger.info(f"검색 조건: {keyword}, {self.config.location}, {self.config.job_type}")
+        # 같은 날 중단된 실행이 있으면 저장된 키워드/페이지부터 이어서 검색
+        resume = self.load_search_cursor()
+        
+        # 키워드별 과거 지원 수로 후보 점수 계산 (일일 지원 수를 점수가 높은 후보부터 사용)
+        self.load_ranker()
+        
+        # 검색 단계는 별도 스레드에서 후보를 큐에 넣고, 지원 단계는 이 스레드에서 꺼내 지원
+        self.candidate_queue = CandidateQueue(self.config.candidate_queue_size)
+        self.stage_metrics = {'discovery': StageMetrics("검색 단계"), 'apply': StageMetrics("지원 단계")}
+        completed = {}  # 검색을 끝까지 마친 키워드 -> 이번에 본 가장 최신 공고
+        discovery = threading.Thread(target=self.discover_candidates, args=(resume, completed),
+                                     name="candidate-discovery", daemon=True)
+        discovery.start()
+        try:
+            keyword_applied = self.apply_queued_candidates()
+        finally:
+            self.candidate_queue.stop()
+            discovery.join()
+        
+        # 큐에 남은 후보가 없는 키워드만 기준점을 이번에 본 가장 최신 공고로 이동
+        pending = {keyword for keyword, _, _ in self.candidate_queue.drain()}
+        for keyword, newest in completed.items():
+            if keyword not in pending:
+                self.database.save_search_watermark(keyword, self.config.location,
+                                                    newest.rec_idx_number, newest.registered_at)
+        
+        for keyword, count in keyword_applied.items():
+            self.logger.info(f"키워드 '{keyword}' 지원 완료 - {count}개 지원")
+        total_applied = sum(keyword_applied.values())
+        self.logger.info(f"전체 검색 완료 - 총 {total_applied}개 지원")
+        self.database.save_search_cursor(None)
+        self.log_prefilter_stats()
+        self.log_keyword_overlap()
+        self.log_posting_cache_stats()
+        self.log_stage_metrics()
+        self.log_wait_metrics()
+        return total_applied
+    
+    def discover_candidates(self, resume, completed):
+        """검색 단계: 모든 키워드/페이지의 후보를 걸러 지원 큐에 추가"""
+        metrics = self.stage_metrics['discovery']
+        metrics.start()
+        try:
+            for keyword_index, keyword in enumerate(self.config.keyword_list):
+                if self.candidate_queue.stopped:
+                    break
                 
                 page = 1
-                max_pages = self.config.max_pages
-                keyword_applied = 0
+                if resume is not None:
+                    if keyword != resume['keyword']:
+                        self.logger.info(f"키워드 '{keyword}' - 이전 실행에서 완료되어 건너뜁니다.")
+                        continue
+                    page = resume['page']
+                    resume = None
+                    self.logger.info(f"키워드 '{keyword}' - 이전 실행 위치(페이지 {page})부터 이어서 검색합니다.")
                 
-                while page <= max_pages and total_applied < self.config.max_applications_per_day:
-                    self.logger.info(f"키워드 '{keyword}' - 페이지 {page} 처리 중...")
-                    
-                    # 채용 공고 목록 가져오기
-                    job_links = self.get_job_links()
-                    
-                    if not job_links:
-                        self.logger.info(f"키워드 '{keyword}' - 더 이상 채용 공고가 없습니다.")
-                        break
-                    
-                    # 각 채용 공고에 지원
-                    for job_link in job_links:
-                        if total_applied >= self.config.max_applications_per_day:
-                            self.logger.info(f"일일 최대 지원 수({self.config.max_applications_per_day})에 도달했습니다.")
-                            return total_applied
-                            
-                        if self.apply_to_job(job_link):
-                            total_applied += 1
-                            keyword_applied += 1
-                            
-                        # 요청 간격 대기
-                        self.random_wait(
-                            self.config.min_delay_between_applications,
-                            self.config.max_delay_between_applications
-                        )
-                    
-                    # 다음 페이지로 이동
-                    if not self.go_to_next_page():
+                self.logger.info(f"키워드 '{keyword}' 검색 시작")
+                
+                try:
+                    if not self.discover_keyword(keyword_index, keyword, page, completed):
                         break
-                        
-                    page += 1
+                except Exception as e:
+                    self.logger.error(f"키워드 '{keyword}' 검색 중 오류: {str(e)}")
+                    continue
+        finally:
+            metrics.finish()
+            self.candidate_queue.close()
+            release_thread_connections()  # 검색 스레드가 연 데이터베이스 연결 반환
+    
+    def discover_keyword(self, keyword_index, keyword, page, completed):
+        """키워드 한 개의 검색 결과 페이지를 순서대로 수집 (지원 단계가 멈췄으면 False)"""
+        metrics = self.stage_metrics['discovery']
+        self.logger.info(f"검색 조건: {keyword}, {self.config.location}, {self.config.job_type}")
+        
+        # 이전 실행에서 끝까지 확인한 가장 최신 공고 (이보다 오래된 공고는 건너뜀)
+        watermark = self.database.get_search_watermark(keyword, self.config.location)
+        watermark_rec_idx = watermark['rec_idx'] if watermark else None
+        newest = None
+        queued = 0
+        
+        while page <= self.config.max_pages:
+            self.logger.info(f"키워드 '{keyword}' - 페이지 {page} 처리 중...")
+            
+            # 지원 단계가 지원 간격을 기다리는 동안 브라우저를 빌려 검색 결과 페이지 수집
+            waited = time.perf_counter()
+            with self.driver_lock:
+                started = time.perf_counter()
+                metrics.waiting_seconds += started - waited
+                self.open_search_page(keyword, page)
+                candidates = self.get_job_candidates()
+            metrics.busy_seconds += time.perf_counter() - started
+            metrics.items += 1
+            
+            if not candidates:
+                self.logger.info(f"키워드 '{keyword}' - 더 이상 채용 공고가 없습니다.")
+                break
+            last_page = len(candidates) < RESULTS_PER_PAGE
+            newest = self.newest_candidate(candidates, newest)
+            
+            # 기준점 이전 공고는 제외하고, 페이지가 기준점을 지났으면 이 페이지까지만 처리
+            candidates, crossed = self.split_at_watermark(candidates, watermark_rec_idx)
+            if crossed:
+                self.logger.info(f"키워드 '{keyword}' - 이전 실행 기준점(공고 {watermark_rec_idx})에 도달했습니다.")
+            
+            # 이번 실행에서 이미 평가한 공고(앞선 키워드 등)는 키워드만 기록하고 제외
+            fresh = self.candidate_registry.register(keyword, candidates)
+            self.prefilter_stats['skipped_seen_in_run'] += len(candidates) - len(fresh)
+            
+            # 이미 지원한 공고/회사는 상세 페이지 방문 전에 제외
+            started = time.perf_counter()
+            candidates = self.filter_candidates(fresh)
+            metrics.busy_seconds += time.perf_counter() - started
+            
+            # 점수가 높은 순서(같으면 키워드, 페이지, 페이지 내 순서)로 지원 큐에 추가 (가득 차면 대기)
+            scores = self.ranker.score(keyword, candidates)
+            waited = time.perf_counter()
+            for position, (candidate, score) in enumerate(zip(candidates, scores)):
+                priority = (-score, keyword_index, page, position)
+                if not self.candidate_queue.put(priority, (keyword, page, candidate), position=(keyword_index, page)):
+                    return False
+                queued += 1
+            metrics.waiting_seconds += time.perf_counter() - waited
+            
+            # 결과가 한 페이지를 채우지 못하거나 기준점을 지났으면 중단
+            if last_page or crossed:
+                break
+            
+            page += 1
+        
+        if newest is not None:
+            completed[keyword] = newest
+        self.logger.info(f"키워드 '{keyword}' 검색 완료 - {queued}개 후보 지원 대기")
+        return True
+    
+    def apply_queued_candidates(self):
+        """지원 단계: 큐의 후보에 설정된 간격으로 지원 (키워드별 지원 수 반환)"""
+        metrics = self.stage_metrics['apply']
+        metrics.start()
+        keyword_applied = {}
+        cursor = None
+        try:
+            # 큐가 차거나 검색이 끝날 때까지 기다려 첫 지원부터 점수를 비교
+            waited = time.perf_counter()
+            self.candidate_queue.wait_ready()
+            metrics.waiting_seconds += time.perf_counter() - waited
+            
+            while True:
+                waited = time.perf_counter()
+                item = self.candidate_queue.get()
+                metrics.waiting_seconds += time.perf_counter() - waited
+                if item is None:
+                    break
+                keyword, page, candidate = item
                 
-                self.logger.info(f"키워드 '{keyword}' 검색 완료 - {keyword_applied}개 지원")
+                # 지원 중이거나 남은 후보 중 가장 앞선 페이지를 검색 위치로 저장 (중단 시 이 페이지부터 다시 검색)
+                position = (self.config.keyword_list.index(keyword), page)
+                oldest = self.candidate_queue.oldest_pending()
+                if oldest is not None and oldest < position:
+                    position = oldest
+                if position != cursor:
+                    cursor = position
+                    self.save_search_cursor(self.config.keyword_list[position[0]], position[1])
                 
-            except Exception as e:
-                self.logger.error(f"키워드 '{keyword}' 검색 중 오류: {str(e)}")
-                continue
+                # 지원 간격 대기는 apply_to_job 안에서 브라우저 잠금 밖에서 진행
+                started = time.perf_counter()
+                paced = self.pacer.stats['paced_seconds']
+                applied = self.apply_to_job(candidate.url, keyword, candidate=candidate)
+                metrics.busy_seconds += time.perf_counter() - started - (self.pacer.stats['paced_seconds'] - paced)
+                metrics.items += 1
+                
+                if applied:
+                    keyword_applied[keyword] = keyword_applied.get(keyword, 0) + 1
+                    if sum(keyword_applied.values()) >= self.config.max_applications_per_day:
+                        self.logger.info(f"일일 최대 지원 수({self.config.max_applications_per_day})에 도달했습니다.")
+                        break
+        finally:
+            metrics.finish()
+        return keyword_applied
+    
+    def load_ranker(self):
+        """키워드별 과거 지원 수로 후보 점수 계산기 생성"""
+        try:
+            keyword_counts = self.database.get_statistics().get('keyword_statistics', {})
+        except Exception as e:
+            keyword_counts = {}
+            self.logger.warning(f"키워드별 지원 통계 조회 실패, 최신성/마감일로만 우선순위 계산: {str(e)}")
+        self.ranker = CandidateRanker(keyword_counts)
+    
+    def log_stage_metrics(self):
+        """검색/지원 단계별 처리량 로그"""
+        discovery = self.stage_metrics['discovery']
+        apply = self.stage_metrics['apply']
+        self.logger.info(f"단계별 처리량 - {discovery.summary_line('페이지', '브라우저/큐 대기')}")
+        self.logger.info(f"단계별 처리량 - {apply.summary_line('건', '후보 대기')}, "
+                         f"지원 간격 대기 {self.pacer.stats['paced_seconds']:.1f}초")
+        if self.ranker is not None:
+            self.logger.info(f"지원 우선순위 - 후보 {self.ranker.stats['scored']}개, "
+                             f"페이지 {self.ranker.stats['batches']}개 점수 계산")
+    
+    def search_signature(self):
+        """검색 조건 식별값 (조건이 바뀌면 저장된 검색 위치를 쓰지 않음)"""
+        return "|".join([",".join(self.config.keyword_list), self.config.location, self.config.job_type])
+    
+    def load_search_cursor(self):
+        """오늘 같은 검색 조건으로 중단된 위치 ({'keyword', 'page'}) 조회"""
+        cursor = self.database.get_search_cursor()
+        if not cursor:
+            return None
+        if (cursor.get('date') != datetime.now().strftime('%Y-%m-%d')
+                or cursor.get('signature') != self.search_signature()
+                or cursor.get('keyword') not in self.config.keyword_list):
+            return None
+        return {'keyword': cursor['keyword'], 'page': max(1, int(cursor.get('page', 1)))}
+    
+    def save_search_cursor(self, keyword, page):
+        """처리 중인 키워드/페이지 저장"""
+        self.database.save_search_cursor({
+            'date': datetime.now().strftime('%Y-%m-%d'),
+            'signature': self.search_signature(),
+            'keyword': keyword,
+            'page': page
+        })
+    
+    def open_search_page(self, keyword, page):
+        """검색 결과 페이지를 URL로 바로 열고 로드 완료 대기"""
+        started = self.open_page(self.build_search_url(keyword, page), "search")
+        if page == 1:
+            self.waiter.ready("search_results", legacy_range=(3, 5))
+        else:
+            self.waiter.ready("next_page", legacy_range=(2, 4))
+        self.resource_policy.measure(self.driver, "search", time.perf_counter() - started)
+    
+    def open_page(self, url, page_type):
+        """페이지 유형의 리소스 정책 적용 후 이동 (측정 시작 시각 반환)"""
+        self.resource_policy.apply(self.driver, page_type)
+        self.navigations += 1
+        started = time.perf_counter()
+        self.driver.get(url)
+        return started
+    
+    def log_wait_metrics(self):
+        """탐색 단계별 대기 시간, 전송량과 지원 간격 통계 로그"""
+        for line in self.wait_metrics.summary_lines():
+            self.logger.info(f"대기 시간 - {line}")
+        for line in self.resource_policy.summary_lines():
+            self.logger.info(f"페이지 로드 - {line}")
+        self.logger.info(f"탐색 대기 절감: 기존 고정 대기 대비 {self.wait_metrics.saved_seconds():.1f}초, "
+                         f"지원 간격 대기 {self.pacer.stats['paced_seconds']:.1f}초 "
+                         f"({self.pacer.stats['applications']}회)")
+    
+    def log_prefilter_stats(self):
+        """목록 단계 중복 제외 통계 로그"""
+        stats = self.prefilter_stats
+        avoided = stats['skipped_job_id'] + stats['skipped_company'] + stats['skipped_company_in_run']
+        self.logger.info(f"목록 단계 중복 제외: 후보 {stats['candidates']}개, 일괄 조회 {stats['batch_queries']}회, "
+                         f"상세 페이지 방문 {avoided}회 생략 (공고 {stats['skipped_job_id']}, "
+                         f"회사 {stats['skipped_company'] + stats['skipped_company_in_run']}), "
+                         f"기준점 이전 공고 {stats['skipped_watermark']}개, "
+                         f"이번 실행에서 이미 본 공고 {stats['skipped_seen_in_run']}개 제외")
+    
+    def log_posting_cache_stats(self):
+        """상세 파싱 캐시 적중률 로그"""
+        stats = self.posting_cache_stats
+        hit_rate = stats['hits'] / stats['lookups'] * 100 if stats['lookups'] else 0.0
+        self.logger.info(f"공고 캐시: 조회 {stats['lookups']}개, 적중 {stats['hits']}개 ({hit_rate:.1f}%), "
+                         f"만료 {stats['stale']}개, 없음 {stats['misses']}개, "
+                         f"상세 페이지 방문 {stats['skipped_visits']}회 생략, "
+                         f"상세 파싱 {stats['fetched']}회 (이전과 내용 변경 {stats['changed']}개)")
+    
+    def log_keyword_overlap(self):
+        """키워드별 검색 결과 중 앞선 키워드와 겹친 공고 수 로그"""
+        for keyword, stats in self.candidate_registry.summary().items():
+            overlap_with = ", ".join(f"{other} {count}" for other, count in stats['overlap_with'].items())
+            self.logger.info(f"키워드 '{keyword}' 중복: 결과 {stats['results']}개, 신규 {stats['new']}개, "
+                             f"다른 키워드와 중복 {stats['overlap']}개" + (f" ({overlap_with})" if overlap_with else ""))
+    
+    def keyword_overlap_stats(self):
+        """실행 기록에 저장할 키워드별 중복 통계"""
+        return self.candidate_registry.summary()
+    
+    def newest_candidate(self, candidates, newest=None):
+        """공고 번호가 가장 큰 후보 (번호가 없는 후보는 무시)"""
+        for candidate in candidates:
+            rec_idx = candidate.rec_idx_number
+            if rec_idx is not None and (newest is None or rec_idx > newest.rec_idx_number):
+                newest = candidate
+        return newest
+    
+    def split_at_watermark(self, candidates, watermark_rec_idx):
+        """기준점보다 새 공고만 남기고, 페이지가 기준점을 지났는지 함께 반환"""
+        if watermark_rec_idx is None:
+            return candidates, False
         
-        self.logger.info(f"전체 검색 완료 - 총 {total_applied}개 지원")
-        return total_applied
+        def is_seen(candidate):
+            rec_idx = candidate.rec_idx_number
+            return rec_idx is not None and rec_idx <= watermark_rec_idx
+        
+        fresh = [candidate for candidate in candidates if not is_seen(candidate)]
+        self.prefilter_stats['skipped_watermark'] += len(candidates) - len(fresh)
+        tail = candidates[-WATERMARK_CROSSING_RUN:]
+        return fresh, all(is_seen(candidate) for candidate in tail)
     
-    def build_search_url(self, keyword=None):
-        """검색 URL 생성"""
+    def build_search_url(self, keyword=None, page=1):
+        """검색 URL 생성 (page: 결과 페이지 번호)"""
         search_keyword = keyword if keyword else self.config.keyword_list[0] if self.config.keyword_list else "바이오"
         
         params = {
             'searchword': search_keyword,
             'loc_mcd': self.get_location_code(self.config.location),
-            'recruitPageCount': 50,  # 페이지당 결과 수
+            'recruitPage': page,
+            'recruitPageCount': RESULTS_PER_PAGE,  # 페이지당 결과 수
             'recruitSort': 'reg_dt',  # 등록일순 정렬
             'searchType': 'search'
         }
@@ -252,206 +706,238 @@ class SaraminBot:
         }
         return location_codes.get(location, "101000")  # 기본값: 서울
     
-    def get_job_links(self):
-        """현재 페이지의 채용 공고 링크 수집"""
-        job_links = []
+    def filter_candidates(self, candidates):
+        """상세 페이지 방문 전에 이미 지원한 공고/회사 후보 제외 (페이지당 한 번의 일괄 조회)"""
+        job_ids = {candidate.url: self.candidate_job_id(candidate) for candidate in candidates}
+        companies = [candidate.company for candidate in candidates if candidate.company != "회사명 없음"]
         
         try:
-            # 채용 공고 목록 요소 찾기
-            # 웹사이트 구조 변경 시 수동 점검 필요
-            job_elements = self.driver.find_elements(
-                By.CSS_SELECTOR, 
-                ".item_recruit .job_tit a"
-            )
-            
-            for element in job_elements:
-                href = element.get_attribute("href")
-                if href and "/zf_user/jobs/relay/" in href:
-                    job_links.append(href)
-                    
-            self.logger.info(f"현재 페이지에서 {len(job_links)}개의 채용 공고를 발견했습니다.")
+            applied = self.database.find_applied(job_ids.values(), companies, days=30)
+            self.prefilter_stats['batch_queries'] += 1
+        except Exception as e:
+            self.logger.warning(f"후보 공고 일괄 중복 확인 실패, 개별 확인으로 대체: {str(e)}")
+            applied = {'job_ids': set(), 'companies': set()}
+        
+        remaining = []
+        for candidate in candidates:
+            job_id = job_ids[candidate.url]
+            if job_id in applied['job_ids'] or (self.applied_index is not None and job_id in self.applied_index.job_ids):
+                self.prefilter_stats['skipped_job_id'] += 1
+            elif candidate.company in applied['companies']:
+                self.prefilter_stats['skipped_company'] += 1
+            else:
+                remaining.append(candidate)
+        
+        self.prefilter_stats['candidates'] += len(candidates)
+        skipped = len(candidates) - len(remaining)
+        if skipped:
+            self.logger.info(f"목록 단계 중복 제외: {len(candidates)}개 중 {skipped}개 (상세 페이지 방문 생략)")
+        return self.skip_cached_postings(remaining)
+    
+    def skip_cached_postings(self, candidates):
+        """최근에 가져온 상세 파싱 결과가 마감(마감 표시 또는 마감일 경과)인 후보 제외
+
+        지원 버튼을 찾지 못한 결과는 파싱 실패나 일시적인 화면 차이일 수 있으므로
+        제외하지 않고 다음 실행에서 다시 확인한다.
+        """
+        if not candidates:
+            return candidates
+        keys = [self.candidate_job_id(candidate) for candidate in candidates]
+        try:
+            cached = self.database.get_job_postings(keys)
+            self.database.touch_job_postings(cached.keys())
+        except Exception as e:
+            self.logger.warning(f"공고 캐시 조회 실패, 상세 페이지를 모두 방문합니다: {str(e)}")
+            return candidates
+        
+        fresh_after = datetime.now() - timedelta(hours=self.config.job_posting_cache_hours)
+        today = datetime.now().date()
+        stats = self.posting_cache_stats
+        remaining = []
+        for candidate, key in zip(candidates, keys):
+            posting = cached.get(key)
+            stats['lookups'] += 1
+            if posting is None:
+                stats['misses'] += 1
+            elif posting['last_fetched_at'] < fresh_after:
+                stats['stale'] += 1
+            else:
+                stats['hits'] += 1
+                days_left = deadline_days_left(posting['deadline'] or candidate.deadline, today)
+                if posting['apply_mode'] == APPLY_MODE_CLOSED or (days_left is not None and days_left < 0):
+                    stats['skipped_visits'] += 1
+                    continue
+            if posting is not None:
+                self.posting_cache[key] = posting
+            remaining.append(candidate)
+        return remaining
+    
+    def record_posting(self, key, job_url, detail):
+        """방문한 상세 페이지 파싱 결과를 캐시에 저장 (이전 결과와 내용이 다르면 변경으로 집계)"""
+        content_hash = detail_content_hash(detail)
+        previous = self.posting_cache.get(key)
+        self.posting_cache_stats['fetched'] += 1
+        if previous is not None and previous['content_hash'] != content_hash:
+            self.posting_cache_stats['changed'] += 1
+        try:
+            self.database.save_job_posting(key, job_url, detail, content_hash)
+        except Exception as e:
+            self.logger.warning(f"공고 캐시 저장 실패: {str(e)}")
+    
+    def get_job_candidates(self) -> List[JobCandidate]:
+        """현재 페이지의 채용 공고를 한 번의 스크립트 호출로 수집"""
+        candidates = []
+        
+        try:
+            candidates = extract_search_results(self.driver)
+            self.logger.info(f"현재 페이지에서 {len(candidates)}개의 채용 공고를 발견했습니다.")
             
-        except NoSuchElementException:
-            self.logger.warning("채용 공고 목록을 찾을 수 없습니다. 웹사이트 구조가 변경되었을 수 있습니다.")
+            if not candidates:
+                self.logger.warning("채용 공고 목록을 찾을 수 없습니다. 웹사이트 구조가 변경되었을 수 있습니다.")
+                
         except Exception as e:
             self.logger.error(f"채용 공고 링크 수집 중 오류: {str(e)}")
             
-        return job_links
+        return candidates
+    
+    def get_job_links(self):
+        """현재 페이지의 채용 공고 링크 수집"""
+        return [candidate.url for candidate in self.get_job_candidates()]
     
-    def apply_to_job(self, job_url):
-        """개별 채용 공고에 지원"""
+    def apply_to_job(self, job_url, keyword=None, candidate: Optional[JobCandidate] = None):
+        """개별 채용 공고에 지원 (candidate가 있으면 목록에서 수집한 제목/회사명 사용)"""
         try:
             # 중복 지원 확인
-            job_id = self.extract_job_id(job_url)
-            if self.database.is_already_applied(job_id):
+            job_id = self.candidate_job_id(candidate) if candidate is not None else self.extract_job_id(job_url)
+            if self.is_already_applied(job_id):
                 self.logger.info(f"이미 지원한 공고입니다 (ID: {job_id})")
                 return False
             
-            # 채용 공고 페이지로 이동
-            self.driver.get(job_url)
-            self.random_wait(2, 4)
-            
-            # 페이지가 완전히 로드될 때까지 대기
-            self.random_wait(2, 3)
-            
-            # 채용 공고 제목 가져오기 (더 포괄적인 선택자 시도)
-            job_title = "제목 없음"
-            title_selectors = [
-                ".job_tit",
-                ".job-tit", 
-                "h1.job_title",
-                "h1",
-                ".title",
-                "[class*='title']",
-                ".job_sector .job_title",
-                ".content_job .job_tit",
-                ".job_summary .job_tit",
-                "h2.job_tit",
-                ".wrap_jv_cont .job_tit"
-            ]
-            
-            for selector in title_selectors:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if element and element.text.strip():
-                        job_title = element.text.strip()
-                        self.logger.info(f"제목 발견 ({selector}): {job_title}")
-                        break
-                except:
-                    continue
-            
-            # 제목을 못 찾은 경우 페이지 소스에서 title 태그 확인
-            if job_title == "제목 없음":
-                try:
-                    page_title = self.driver.title
-                    if "사람인" in page_title and "|" in page_title:
-                        job_title = page_title.split("|")[0].strip()
-                        self.logger.info(f"페이지 타이틀에서 제목 추출: {job_title}")
-                except:
-                    pass
-            
-            # 회사명 가져오기 (더 포괄적인 선택자 시도)
-            company_name = "회사명 없음"
-            company_selectors = [
-                ".company_nm a",
-                ".company_nm",
-                ".company-name",
-                ".corp_name a",
-                ".corp_name",
-                "[class*='company'] a",
-                "[class*='corp'] a",
-                ".job_sector .corp_name a",
-                ".content_job .company_nm a",
-                ".job_summary .company_nm a",
-                ".wrap_jv_cont .company_nm a",
-                "a[class*='company']",
-                ".area_job .company_nm a"
-            ]
-            
-            for selector in company_selectors:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if element and element.text.strip():
-                        company_name = element.text.strip()
-                        self.logger.info(f"회사명 발견 ({selector}): {company_name}")
-                        break
-                except:
-                    continue
-            
-            self.logger.info(f"지원 시도: {company_name} - {job_title}")
-            
-            # 회사명 기반 중복 지원 확인 (최근 30일 내)
-            if self.database.is_company_already_applied(company_name, days=30):
-                self.logger.info(f"중복 지원 방지: {company_name}에 이미 지원함 (최근 30일 내)")
-                return False
-            
-            # 지원하기 버튼 찾기 (2024년 사람인 웹사이트 구조 반영)
-            apply_button = None
+            # 같은 실행에서 방금 지원한 회사는 페이지 로드 전에 제외
+            if candidate is not None and candidate.company != "회사명 없음":
+                if self.is_company_already_applied(candidate.company, days=30):
+                    self.prefilter_stats['skipped_company_in_run'] += 1
+                    self.logger.info(f"중복 지원 방지: {candidate.company}에 이미 지원함 (최근 30일 내)")
+                    return False
             
-            # CSS 선택자들 시도
-            css_selectors = [
-                "button.btn_apply",  # 기본 지원하기 버튼
-                "a.btn_apply",       # 링크 형태 지원하기 버튼
-                ".btn-apply",        # 대시 형태
-                "button[onclick*='apply']",  # onclick 이벤트 포함
-                "a[href*='apply']",  # href에 apply 포함
-                ".apply-btn",        # 일반적인 클래스명
-                ".job_apply button", # job_apply 영역 내 버튼
-                ".apply_area button" # apply_area 영역 내 버튼
-            ]
+            # 지원 간 간격 유지 (대기 중에는 검색 단계가 브라우저 사용) 후 채용 공고 페이지로 이동
+            self.pacer.wait_turn()
+            with self.driver_lock:
+                return self.open_and_apply(job_id, job_url, keyword, candidate)
             
-            for selector in css_selectors:
-                try:
-                    apply_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if apply_button.is_displayed() and apply_button.is_enabled():
-                        self.logger.info(f"지원하기 버튼 발견 (CSS): {selector}")
-                        break
-                except:
-                    continue
+        except Exception as e:
+            self.logger.error(f"채용 공고 지원 중 오류: {str(e)}")
+            return False
+    
+    def open_and_apply(self, job_id, job_url, keyword, candidate):
+        """상세 페이지를 열고 지원 (브라우저 잠금을 잡은 상태에서 호출)"""
+        self.pacer.started()
+        started = self.open_page(job_url, "job_detail")
+        
+        # 페이지 로드 완료 및 공고 본문/지원 버튼이 나타날 때까지 대기
+        self.waiter.element("job_detail", DETAIL_READY_SELECTORS, legacy_range=(4, 7))
+        self.resource_policy.measure(self.driver, "job_detail", time.perf_counter() - started)
+        
+        # 상세 페이지 HTML을 한 번 가져와 제목/회사명/마감일/지원 방식 추출
+        page_source = self.driver.page_source
+        self.save_detail_page_html(job_id, page_source)
+        detail = parse_job_detail(page_source)
+        self.record_posting(job_id, job_url, detail)
+        
+        # 목록에서 수집한 제목/회사명 우선, 없으면 상세 페이지 값 사용
+        job_title = candidate.title if candidate is not None else "제목 없음"
+        if job_title == "제목 없음" and detail.title:
+            job_title = detail.title
+        
+        company_name = candidate.company if candidate is not None else "회사명 없음"
+        if company_name == "회사명 없음" and detail.company:
+            company_name = detail.company
+        
+        self.logger.info(f"지원 시도: {company_name} - {job_title}")
+        
+        # 회사명 기반 중복 지원 확인 (최근 30일 내)
+        if self.is_company_already_applied(company_name, days=30):
+            self.logger.info(f"중복 지원 방지: {company_name}에 이미 지원함 (최근 30일 내)")
+            return False
+        
+        # 지원하기 버튼 찾기 (2024년 사람인 웹사이트 구조 반영)
+        # CSS 선택자와 텍스트 기반 XPath를 한 번의 스크립트 호출로 평가
+        apply_selectors = [
+            css("button.btn_apply"),  # 기본 지원하기 버튼
+            css("a.btn_apply"),       # 링크 형태 지원하기 버튼
+            css(".btn-apply"),        # 대시 형태
+            css("button[onclick*='apply']"),  # onclick 이벤트 포함
+            css("a[href*='apply']"),  # href에 apply 포함
+            css(".apply-btn"),        # 일반적인 클래스명
+            css(".job_apply button"), # job_apply 영역 내 버튼
+            css(".apply_area button"), # apply_area 영역 내 버튼
+            xpath("//button[contains(text(), '지원하기')]"),
+            xpath("//a[contains(text(), '지원하기')]"),
+            xpath("//button[contains(text(), '즉시지원')]"),
+            xpath("//a[contains(text(), '즉시지원')]"),
+            xpath("//button[contains(@class, 'apply')]"),
+            xpath("//a[contains(@class, 'apply')]")
+        ]
+        
+        # 마감 버튼/마감 상태가 확인된 공고만 라이브 DOM 탐색 생략
+        # (HTML을 가져온 뒤 스크립트로 그려지는 버튼이 있으므로 파싱에서 못 찾아도 탐색)
+        apply_button = None
+        if detail.apply_mode != APPLY_MODE_CLOSED:
+            if not detail.has_apply_button:
+                self.logger.info("상세 HTML에서 지원하기 버튼을 찾지 못해 현재 화면에서 다시 찾습니다.")
+            apply_button, selector = self.selectors.resolve(self.driver, "job_detail_apply", apply_selectors,
+                                                            credit=False)
+            if apply_button:
+                self.logger.info(f"지원하기 버튼 발견 ({selector[0]}): {selector[1]}")
+        
+        if not apply_button:
+            self.logger.warning(f"지원하기 버튼을 찾을 수 없습니다.")
+            self.logger.warning(f"현재 URL: {job_url}")
             
-            # CSS 선택자로 찾지 못한 경우 XPath로 텍스트 기반 검색
-            if not apply_button:
-                xpath_selectors = [
-                    "//button[contains(text(), '지원하기')]",
-                    "//a[contains(text(), '지원하기')]",
-                    "//button[contains(text(), '즉시지원')]", 
-                    "//a[contains(text(), '즉시지원')]",
-                    "//button[contains(@class, 'apply')]",
-                    "//a[contains(@class, 'apply')]"
-                ]
-                
-                for xpath in xpath_selectors:
-                    try:
-                        apply_button = self.driver.find_element(By.XPATH, xpath)
-                        if apply_button.is_displayed() and apply_button.is_enabled():
-                            self.logger.info(f"지원하기 버튼 발견 (XPath): {xpath}")
-                            break
-                    except:
-                        continue
+            # 지원 관련 요소가 있는지 확인
+            if detail.has_apply_text and detail.apply_mode != APPLY_MODE_CLOSED:
+                self.logger.warning("페이지에 지원하기 텍스트가 있지만 버튼을 찾을 수 없습니다.")
+            else:
+                self.logger.warning(f"마감된 공고이거나 지원이 불가능한 상태입니다. (마감일: {detail.deadline or '알 수 없음'})")
             
-            if not apply_button:
-                # 페이지 HTML을 로그에 기록하여 디버깅
-                page_source = self.driver.page_source
-                current_url = self.driver.current_url
-                self.logger.warning(f"지원하기 버튼을 찾을 수 없습니다.")
-                self.logger.warning(f"현재 URL: {current_url}")
-                self.logger.warning(f"페이지에서 '지원' 관련 텍스트 확인 중...")
-                
-                # 지원 관련 요소가 있는지 확인
-                if "지원하기" in page_source or "즉시지원" in page_source:
-                    self.logger.warning("페이지에 지원하기 텍스트가 있지만 버튼을 찾을 수 없습니다.")
-                else:
-                    self.logger.warning("마감된 공고이거나 지원이 불가능한 상태입니다.")
-                
+            return False
+        
+        # 지원하기 버튼 클릭 후 지원서 화면(URL 변경, 새 창 또는 지원서 요소) 대기
+        previous_url = self.driver.current_url
+        previous_handles = len(self.driver.window_handles)
+        self.resource_policy.apply(self.driver, "apply_form")
+        self.navigations += 1
+        self.driver.execute_script("arguments[0].click();", apply_button)
+        if self.waiter.url_change("apply_form", previous_url, previous_handles, legacy_range=(2, 3),
+                                  selectors=APPLY_FORM_SELECTORS):
+            # 지원서 화면이 열린 경우에만 버튼 선택자 적중으로 기록
+            self.selectors.credit("job_detail_apply", selector)
+        
+        # 지원서 작성 페이지에서 이력서 선택 및 제출
+        if self.submit_application():
+            # 데이터베이스에 지원 기록 저장 (이미 기록된 job_id면 지원 수에 포함하지 않음)
+            if not self.database.record_application(job_id, job_url, company_name, job_title, keyword,
+                                                    defer=self.config.write_behind):
+                self.logger.warning(f"지원 기록이 추가되지 않아 지원 수에서 제외합니다 "
+                                    f"(이미 기록된 공고이거나 저장 실패): {company_name} - {job_title}")
                 return False
+            if self.applied_index is not None:
+                self.applied_index.add(job_id, company_name)
+            self.logger.info(f"지원 완료: {company_name} - {job_title}")
             
-            # 지원하기 버튼 클릭
-            self.driver.execute_script("arguments[0].click();", apply_button)
-            self.random_wait(2, 3)
+            # 웹 앱 콜백 함수 호출 (실시간 로그 표시)
+            if self.application_callback:
+                job_info = {
+                    'company': company_name,
+                    'title': job_title,
+                    'url': job_url,
+                    'job_id': job_id
+                }
+                self.application_callback(job_info)
             
-            # 지원서 작성 페이지에서 이력서 선택 및 제출
-            if self.submit_application():
-                # 데이터베이스에 지원 기록 저장
-                self.database.record_application(job_id, job_url, company_name, job_title)
-                self.logger.info(f"지원 완료: {company_name} - {job_title}")
-                
-                # 웹 앱 콜백 함수 호출 (실시간 로그 표시)
-                if self.application_callback:
-                    job_info = {
-                        'company': company_name,
-                        'title': job_title,
-                        'url': job_url,
-                        'job_id': job_id
-                    }
-                    self.application_callback(job_info)
-                
-                return True
-            else:
-                self.logger.warning(f"지원 실패: {company_name} - {job_title}")
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"채용 공고 지원 중 오류: {str(e)}")
+            return True
+        else:
+            self.logger.warning(f"지원 실패: {company_name} - {job_title}")
             return False
     
     def submit_application(self):
@@ -464,82 +950,50 @@ class SaraminBot:
             self.logger.info(f"현재 URL: {current_url}")
             
             # 이력서 선택 (다양한 선택자 시도)
-            resume_selected = False
             resume_selectors = [
-                "input[type='radio'][name*='resume']",
-                "input[type='radio'][name*='cv']", 
-                "input[type='radio'][class*='resume']",
-                ".resume-select input[type='radio']",
-                ".cv-select input[type='radio']"
+                css("input[type='radio'][name*='resume']"),
+                css("input[type='radio'][name*='cv']"),
+                css("input[type='radio'][class*='resume']"),
+                css(".resume-select input[type='radio']"),
+                css(".cv-select input[type='radio']")
             ]
             
-            for selector in resume_selectors:
-                try:
-                    resume_radios = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if resume_radios:
-                        # 첫 번째 이력서 선택
-                        first_resume = resume_radios[0]
-                        if first_resume.is_enabled():
-                            self.driver.execute_script("arguments[0].click();", first_resume)
-                            self.logger.info(f"이력서 선택 완료: {selector}")
-                            resume_selected = True
-                            self.random_wait(1, 2)
-                            break
-                except Exception as e:
-                    self.logger.debug(f"이력서 선택자 시도 실패 {selector}: {str(e)}")
-                    continue
-            
-            if not resume_selected:
+            # 라디오 버튼은 숨김 처리 후 꾸며진 경우가 많아 활성화 여부만 확인
+            first_resume, selector = self.selectors.resolve(
+                self.driver, "apply_form_resume", resume_selectors, visible=False
+            )
+            if first_resume:
+                # 첫 번째 이력서 선택
+                self.driver.execute_script("arguments[0].click();", first_resume)
+                self.logger.info(f"이력서 선택 완료: {selector[1]}")
+                self.random_wait(1, 2)
+            else:
                 self.logger.warning("이력서 선택 요소를 찾을 수 없습니다. 기본 이력서를 사용할 것으로 예상됩니다.")
             
             # 지원서 제출 버튼 찾기 (더 포괄적인 검색)
             submit_selectors = [
-                "button[class*='submit']",
-                "button[class*='apply']", 
-                "input[type='submit']",
-                "button:contains('지원하기')",
-                "button:contains('제출하기')",
-                "button:contains('지원완료')",
-                ".btn_submit",
-                ".btn_apply",
-                ".submit-btn",
-                ".apply-btn"
+                css("button[class*='submit']"),
+                css("button[class*='apply']"),
+                css("input[type='submit']"),
+                xpath("//button[contains(text(), '지원하기')]"),
+                xpath("//button[contains(text(), '제출하기')]"),
+                xpath("//button[contains(text(), '지원완료')]"),
+                xpath("//input[@type='submit' and contains(@value, '지원')]"),
+                css(".btn_submit"),
+                css(".btn_apply"),
+                css(".submit-btn"),
+                css(".apply-btn")
             ]
             
-            submit_button = None
-            for selector in submit_selectors:
-                try:
-                    if ":contains" in selector:
-                        # XPath로 텍스트 기반 검색
-                        xpath_selectors = [
-                            "//button[contains(text(), '지원하기')]",
-                            "//button[contains(text(), '제출하기')]",
-                            "//button[contains(text(), '지원완료')]",
-                            "//input[@type='submit' and contains(@value, '지원')]"
-                        ]
-                        for xpath in xpath_selectors:
-                            try:
-                                submit_button = self.driver.find_element(By.XPATH, xpath)
-                                if submit_button.is_displayed() and submit_button.is_enabled():
-                                    self.logger.info(f"제출 버튼 발견: {xpath}")
-                                    break
-                            except:
-                                continue
-                    else:
-                        submit_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if submit_button.is_displayed() and submit_button.is_enabled():
-                            self.logger.info(f"제출 버튼 발견: {selector}")
-                            break
-                except:
-                    continue
-                
-                if submit_button and submit_button.is_displayed() and submit_button.is_enabled():
-                    break
+            submit_button, selector = self.selectors.resolve(self.driver, "apply_form_submit", submit_selectors)
+            if submit_button:
+                self.logger.info(f"제출 버튼 발견: {selector[1]}")
             
             if submit_button:
                 self.logger.info("지원서 제출 버튼 클릭")
+                previous_handles = len(self.driver.window_handles)
                 self.driver.execute_script("arguments[0].click();", submit_button)
-                self.random_wait(3, 5)
+                self.waiter.url_change("submit_result", current_url, previous_handles, legacy_range=(3, 5))
                 
                 # 지원 완료 확인 (더 정확한 검증)
                 success_confirmed = False
@@ -551,20 +1005,9 @@ class SaraminBot:
                     if "complete" in new_url or "success" in new_url or "apply" in new_url:
                         success_confirmed = True
                 
-                # 성공 메시지 확인
-                success_indicators = [
-                    "지원이 완료",
-                    "지원완료", 
-                    "apply_complete",
-                    "success"
-                ]
-                
-                page_text = self.driver.page_source.lower()
-                current_url = self.driver.current_url.lower()
-                
-                for indicator in success_indicators:
-                    if indicator in page_text or indicator in current_url:
-                        return True
+                # 성공 메시지 확인 ("지원이 완료", "지원완료", "apply_complete", "success")
+                if page_indicates_success(self.driver.page_source, new_url):
+                    return True
                         
                 # 추가 확인: alert 메시지
                 try:
@@ -586,35 +1029,17 @@ class SaraminBot:
             self.logger.error(f"지원서 제출 중 오류: {str(e)}")
             return False
     
-    def go_to_next_page(self):
-        """다음 페이지로 이동"""
-        try:
-            # 다음 페이지 버튼 찾기
-            next_selectors = [
-                ".btn_next",
-                "a[class*='next']",
-                ".paging .next"
-            ]
-            
-            for selector in next_selectors:
-                try:
-                    next_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if next_button.is_displayed() and next_button.is_enabled():
-                        next_button.click()
-                        self.random_wait(2, 4)
-                        return True
-                except:
-                    continue
-                    
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"다음 페이지 이동 중 오류: {str(e)}")
-            return False
+    def candidate_job_id(self, candidate):
+        """후보 공고 ID (목록에서 수집한 공고 번호 우선)"""
+        return candidate.rec_idx or self.extract_job_id(candidate.url)
     
     def extract_job_id(self, job_url):
-        """URL에서 채용 공고 ID 추출"""
+        """URL에서 채용 공고 ID 추출 (사람인 공고 번호 rec_idx 우선)"""
         try:
+            rec_idx = canonical_job_id(job_url)
+            if rec_idx:
+                return rec_idx
+            
             # URL에서 ID 패턴 추출
             import re
             match = re.search(r'/(\d+)/?', job_url)
@@ -657,10 +1082,65 @@ class SaraminBot:
         time.sleep(wait_time)
     
     def close(self):
-        """브라우저 닫기"""
-        if self.driver:
+        """브라우저 닫기 (저장 중 오류가 나도 브라우저 종료/반환과 프로필 잠금 해제는 항상 수행)
+
+        여러 번 호출해도 되므로 실행 코드는 finally에서 항상 호출한다.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            if self.config.write_behind:
+                try:
+                    unsaved = self.database.flush_pending_writes()
+                    stats = self.database.get_write_queue_stats()
+                    self.logger.info(f"지연 쓰기 완료: {stats['written']}건 저장, 배치 {stats['batches']}회, "
+                                     f"평균 {stats['avg_batch_latency_ms']:.1f}ms, 대기 {stats['queue_depth']}건")
+                    if unsaved:
+                        self.logger.error(f"지연 쓰기 저장 실패: {unsaved}건을 아직 저장하지 못했습니다 "
+                                          f"(종료 전까지 재시도, 종료 시 기록 내용 출력)")
+                except Exception as e:
+                    self.logger.error(f"지연 쓰기 저장 중 오류: {str(e)}")
+            
             try:
-                self.driver.quit()
-                self.logger.info("브라우저를 닫았습니다.")
+                self.selectors.save()
             except Exception as e:
-                self.logger.error(f"브라우저 종료 중 오류: {str(e)}")
+                self.logger.error(f"선택자 통계 저장 중 오류: {str(e)}")
+            
+            if self.applied_index is not None:
+                try:
+                    self.applied_index.save()
+                except Exception as e:
+                    self.logger.error(f"지원 이력 인덱스 저장 중 오류: {str(e)}")
+            
+            if self.driver and self.profile is not None:
+                try:
+                    self.profile.save_cookies(self.driver)
+                except Exception as e:
+                    self.logger.error(f"쿠키 저장 중 오류: {str(e)}")
+        finally:
+            self.release_browser()
+    
+    def release_browser(self):
+        """풀에서 빌린 브라우저는 반환하고, 직접 실행한 브라우저는 종료 후 프로필 잠금 해제"""
+        if self.lease is not None:
+            # 풀에서 빌린 브라우저는 종료하지 않고 반환 (프로필 잠금도 풀이 관리)
+            lease, self.lease = self.lease, None
+            self.profile = None
+            self.driver = None
+            lease.release(self.navigations)
+            self.logger.info("브라우저를 드라이버 풀에 반환했습니다.")
+            return
+        
+        try:
+            if self.driver:
+                try:
+                    self.driver.quit()
+                    self.logger.info("브라우저를 닫았습니다.")
+                except Exception as e:
+                    self.logger.error(f"브라우저 종료 중 오류: {str(e)}")
+                self.driver = None
+        finally:
+            if self.profile is not None:
+                self.profile.release()
+                self.profile = None
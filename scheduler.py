@@ -33,6 +33,28 @@ def run_saramin_bot():
     except Exception as e:
         logger.error(f"스케줄러 실행 중 오류: {str(e)}")
 
+def run_maintenance():
+    """데이터베이스 보존 기간 정리 실행"""
+    logger = setup_logger("scheduler.log")
+    
+    try:
+        logger.info("데이터베이스 유지보수 시작")
+        
+        result = subprocess.run([sys.executable, "maintenance.py"],
+                              capture_output=True,
+                              text=True,
+                              encoding='utf-8')
+        
+        if result.returncode == 0:
+            logger.info("데이터베이스 유지보수 완료")
+            logger.info(f"출력: {result.stdout}")
+        else:
+            logger.error(f"데이터베이스 유지보수 실패 (코드: {result.returncode})")
+            logger.error(f"오류: {result.stderr}")
+            
+    except Exception as e:
+        logger.error(f"유지보수 실행 중 오류: {str(e)}")
+
 def main():
     """스케줄러 메인 함수"""
     logger = setup_logger("scheduler.log")
@@ -45,7 +67,12 @@ def main():
     scheduled_time = os.getenv("SCHEDULED_TIME", "09:00")
     schedule.every().day.at(scheduled_time).do(run_saramin_bot)
     
+    # 매일 새벽 보존 기간 정리 (파티션 삭제 / 배치 삭제)
+    maintenance_time = os.getenv("MAINTENANCE_TIME", "03:30")
+    schedule.every().day.at(maintenance_time).do(run_maintenance)
+    
     logger.info(f"스케줄러 시작 - 매일 {scheduled_time}에 실행됩니다.")
+    logger.info(f"데이터베이스 유지보수 - 매일 {maintenance_time}에 실행됩니다.")
     
     # 즉시 실행 옵션
     if "--run-now" in sys.argv:
@@ -0,0 +1,191 @@
+"""
+선택자 탐색 엔진 모듈
+Batched in-page selector resolution with hit-rate ordering
+
+후보 선택자 목록 전체를 한 번의 execute_script 호출로 평가하여
+보이고 활성화된 첫 번째 요소를 반환한다. 페이지 유형별 선택자 적중 통계를
+데이터베이스에 기록하고, 다음 탐색부터 적중률이 높은 선택자를 먼저 사용한다.
+적중은 실제로 반환(사용)된 선택자에만 기록하므로, 넓게 일치하는 일반 선택자가
+원래 버튼 선택자보다 앞서지 않는다.
+"""
+
+import threading
+from datetime import datetime
+
+# arguments[0]: [[종류("css"|"xpath"), 선택자], ...], arguments[1]: 조건
+# 반환값: [적중 선택자 인덱스 목록, 첫 번째 적중 요소] (적중이 없으면 요소는 null)
+RESOLVE_SCRIPT = """
+const selectors = arguments[0];
+const options = arguments[1];
+
+const usable = element => {
+    if (options.enabled && element.disabled) {
+        return false;
+    }
+    if (options.visible) {
+        const style = window.getComputedStyle(element);
+        if (style.visibility === 'hidden' || style.display === 'none' || element.getClientRects().length === 0) {
+            return false;
+        }
+    }
+    if (options.text && !(element.textContent || element.value || '').trim()) {
+        return false;
+    }
+    return true;
+};
+
+const find = (kind, selector) => {
+    try {
+        if (kind === 'xpath') {
+            const snapshot = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let i = 0; i < snapshot.snapshotLength; i++) {
+                if (usable(snapshot.snapshotItem(i))) {
+                    return snapshot.snapshotItem(i);
+                }
+            }
+            return null;
+        }
+        return Array.from(document.querySelectorAll(selector)).find(usable) || null;
+    } catch (e) {
+        return null;  // 잘못된 선택자는 미적중으로 처리
+    }
+};
+
+const hits = [];
+let first = null;
+selectors.forEach(([kind, selector], index) => {
+    const element = find(kind, selector);
+    if (element) {
+        hits.push(index);
+        if (first === null) {
+            first = element;
+        }
+    }
+});
+return [hits, first];
+"""
+
+def css(selector):
+    """CSS 선택자"""
+    return ("css", selector)
+
+def xpath(selector):
+    """XPath 선택자"""
+    return ("xpath", selector)
+
+def selector_key(selector):
+    """통계 저장용 선택자 키 (예: "css:button.btn_apply")"""
+    return f"{selector[0]}:{selector[1]}"
+
+class SelectorEngine:
+    """페이지 유형별 적중률로 선택자 순서를 학습하는 탐색기
+
+    resolve()는 후보 전체를 한 번에 평가하여 모든 후보의 시도 수를 늘리고,
+    반환한 선택자에만 적중을 기록한다 (credit=False이면 호출 쪽에서 credit()으로 기록).
+    한 번도 사용되지 않은 선택자는 작성된 순서를 유지하고, 사용된 적이 있는 선택자만
+    적중률 순서로 앞에 둔다. 통계는 메모리에 누적했다가 save()에서 한 번의 일괄 쿼리로 저장한다.
+    """
+
+    def __init__(self, database, logger=None):
+        self.database = database
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._stats = None  # {(페이지 유형, 선택자 키): [시도 수, 적중 수]}
+        self._pending = {}  # 저장 대기 중인 증가분 {(페이지 유형, 선택자 키): [시도, 적중, 마지막 적중 시각]}
+        self.stats = {'resolves': 0, 'misses': 0, 'script_calls': 0}
+
+    def _load(self):
+        """적중 통계를 한 번의 쿼리로 불러오기 (실패 시 빈 통계로 시작)"""
+        if self._stats is not None:
+            return
+        try:
+            self._stats = {key: list(value) for key, value in self.database.load_selector_stats().items()}
+        except Exception as e:
+            self._stats = {}
+            if self.logger:
+                self.logger.warning(f"선택자 통계 로드 실패, 기본 순서 사용: {str(e)}")
+
+    def ordered(self, page_type, selectors):
+        """사용된 적이 있는 선택자를 적중률 순서로 앞에 둔 목록 (나머지는 원래 순서 유지)"""
+        with self._lock:
+            self._load()
+
+            def hit_rate(item):
+                index, selector = item
+                attempts, hits = self._stats.get((page_type, selector_key(selector)), (0, 0))
+                if not hits:
+                    return (1, 0.0, index)
+                # 시도가 적은 선택자도 기회를 갖도록 평활화한 적중률 사용 (같으면 작성 순서)
+                return (0, -(hits + 1) / (attempts + 2), index)
+
+            return [selector for _, selector in sorted(enumerate(selectors), key=hit_rate)]
+
+    def resolve(self, driver, page_type, selectors, visible=True, enabled=True, text=False, credit=True):
+        """후보 선택자 중 조건을 만족하는 첫 번째 요소 조회
+
+        (요소, 선택자)를 반환하며 적중이 없으면 (None, None)을 반환한다.
+        credit=False이면 적중을 기록하지 않으므로, 클릭 등이 성공한 뒤 credit()을 호출한다.
+        """
+        selectors = self.ordered(page_type, selectors)
+        hits, element = driver.execute_script(
+            RESOLVE_SCRIPT,
+            [list(selector) for selector in selectors],
+            {'visible': visible, 'enabled': enabled, 'text': text}
+        )
+        self.stats['script_calls'] += 1
+        self.stats['resolves'] += 1
+
+        with self._lock:
+            for selector in selectors:
+                key = (page_type, selector_key(selector))
+                self._stats.setdefault(key, [0, 0])[0] += 1
+                self._pending.setdefault(key, [0, 0, None])[0] += 1
+
+        if element is None:
+            self.stats['misses'] += 1
+            return None, None
+        selector = selectors[min(hits)]
+        if credit:
+            self.credit(page_type, selector)
+        return element, selector
+
+    def credit(self, page_type, selector):
+        """사용에 성공한 선택자의 적중 기록"""
+        key = (page_type, selector_key(selector))
+        with self._lock:
+            self._load()
+            self._stats.setdefault(key, [0, 0])[1] += 1
+            pending = self._pending.setdefault(key, [0, 0, None])
+            pending[1] += 1
+            pending[2] = datetime.now()
+
+    def save(self):
+        """누적된 적중 통계 증가분 저장"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        updates = [
+            {
+                'page_type': page_type,
+                'selector': key,
+                'attempts': attempts,
+                'hits': hits,
+                'last_hit_at': last_hit_at
+            }
+            for (page_type, key), (attempts, hits, last_hit_at) in pending.items()
+        ]
+        try:
+            return self.database.record_selector_stats(updates)
+        except Exception as e:
+            # 저장 실패 시 다음 저장 때 다시 시도
+            with self._lock:
+                for key, (attempts, hits, last_hit_at) in pending.items():
+                    merged = self._pending.setdefault(key, [0, 0, None])
+                    merged[0] += attempts
+                    merged[1] += hits
+                    merged[2] = merged[2] or last_hit_at
+            if self.logger:
+                self.logger.warning(f"선택자 통계 저장 실패: {str(e)}")
+            return 0
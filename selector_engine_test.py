@@ -0,0 +1,96 @@
+"""
+선택자 탐색 엔진 테스트
+Unit tests for SelectorEngine ordering and hit crediting
+"""
+
+from selector_engine import SelectorEngine, css, xpath
+
+BUTTON = css("button.btn_apply")
+GENERIC = css("button[class*='apply']")
+TEXT = xpath("//button[contains(text(), '지원하기')]")
+
+class FakeDriver:
+    """execute_script에 전달된 선택자 중 matches에 있는 것을 적중으로 반환"""
+
+    def __init__(self, matches):
+        self.matches = matches
+        self.calls = []
+
+    def execute_script(self, script, selectors, options):
+        self.calls.append([tuple(selector) for selector in selectors])
+        hits = [index for index, selector in enumerate(selectors) if tuple(selector) in self.matches]
+        return [hits, "element" if hits else None]
+
+class FakeDatabase:
+    def __init__(self, stats=None):
+        self.stats = stats or {}
+        self.saved = []
+
+    def load_selector_stats(self):
+        return self.stats
+
+    def record_selector_stats(self, updates):
+        self.saved.extend(updates)
+        return len(updates)
+
+def test_resolve_credits_only_returned_selector():
+    """함께 일치한 일반 선택자에는 적중을 기록하지 않음"""
+    database = FakeDatabase()
+    engine = SelectorEngine(database)
+    driver = FakeDriver({BUTTON, GENERIC})
+
+    assert engine.resolve(driver, "detail", [BUTTON, GENERIC, TEXT]) == ("element", BUTTON)
+    assert engine.save() == 3
+    saved = {update['selector']: (update['attempts'], update['hits']) for update in database.saved}
+    assert saved == {
+        "css:button.btn_apply": (1, 1),
+        "css:button[class*='apply']": (1, 0),
+        "xpath://button[contains(text(), '지원하기')]": (1, 0)
+    }
+    assert engine.save() == 0
+
+def test_hit_selectors_move_ahead_of_authored_order():
+    """사용된 선택자만 적중률 순서로 앞에 두고 나머지는 작성 순서 유지"""
+    database = FakeDatabase({
+        ("detail", "xpath://button[contains(text(), '지원하기')]"): (10, 9),
+        ("detail", "css:button[class*='apply']"): (50, 0)
+    })
+    engine = SelectorEngine(database)
+    assert engine.ordered("detail", [BUTTON, GENERIC, TEXT]) == [TEXT, BUTTON, GENERIC]
+    assert engine.ordered("list", [BUTTON, GENERIC, TEXT]) == [BUTTON, GENERIC, TEXT]
+
+def test_credit_after_successful_use():
+    """credit=False로 찾은 선택자는 사용에 성공한 뒤에만 적중 기록"""
+    database = FakeDatabase()
+    engine = SelectorEngine(database)
+    driver = FakeDriver({GENERIC})
+
+    element, selector = engine.resolve(driver, "detail", [BUTTON, GENERIC], credit=False)
+    assert (element, selector) == ("element", GENERIC)
+    assert engine.ordered("detail", [BUTTON, GENERIC]) == [BUTTON, GENERIC]
+
+    engine.credit("detail", selector)
+    assert engine.ordered("detail", [BUTTON, GENERIC]) == [GENERIC, BUTTON]
+
+def test_miss_returns_none():
+    """적중이 없으면 (None, None)"""
+    engine = SelectorEngine(FakeDatabase())
+    assert engine.resolve(FakeDriver(set()), "detail", [BUTTON]) == (None, None)
+    assert engine.stats['misses'] == 1
+
+def test_failed_save_is_retried():
+    """저장에 실패한 증가분은 다음 저장 때 다시 시도"""
+    database = FakeDatabase()
+    engine = SelectorEngine(database)
+    engine.resolve(FakeDriver({BUTTON}), "detail", [BUTTON])
+
+    def fail(updates):
+        raise RuntimeError("저장 실패")
+    database.record_selector_stats = fail
+    assert engine.save() == 0
+
+    del database.record_selector_stats
+    engine.resolve(FakeDriver({BUTTON}), "detail", [BUTTON])
+    assert engine.save() == 1
+    assert database.saved[0]['attempts'] == 2
+    assert database.saved[0]['hits'] == 2
@@ -0,0 +1,230 @@
+"""
+SQLite 저장소 테스트
+Unit tests for the SQLite ApplicationStore and its schema migrations
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+import database
+from database import ApplicationDatabase, SCHEMA_VERSION, close_thread_connections
+from job_detail import JobDetail
+
+RELAY_URL = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx={}&search_uuid=abc"
+
+STATISTICS_KEYS = {
+    'total_applications', 'today_applications', 'week_applications', 'month_applications',
+    'total_executions', 'keyword_statistics', 'top_companies'
+}
+
+@pytest.fixture
+def db(tmp_path):
+    """테스트마다 새 파일을 쓰는 SQLite 저장소"""
+    store = ApplicationDatabase(str(tmp_path / "applications.db"))
+    yield store
+    store.flush_pending_writes()
+    store.close()
+
+def reopen(db_file):
+    """같은 파일을 처음 여는 것처럼 다시 초기화"""
+    close_thread_connections()
+    database._initialized_files.discard(str(db_file))
+    return ApplicationDatabase(str(db_file))
+
+def test_record_application_rejects_duplicates(db):
+    """같은 job_id는 한 번만 저장"""
+    assert db.record_application("100", RELAY_URL.format(100), "가회사", "개발자", "개발")
+    assert not db.record_application("100", RELAY_URL.format(100), "가회사", "개발자", "개발")
+    assert db.is_already_applied("100")
+    assert not db.is_already_applied("200")
+    assert db.is_company_already_applied("가회사")
+
+def test_deferred_application_rejects_duplicates(db):
+    """지연 저장도 이미 지원했거나 큐에 있는 job_id는 False"""
+    db.record_application("100", RELAY_URL.format(100), "가회사", "개발자")
+    assert not db.record_application("100", RELAY_URL.format(100), "가회사", "개발자", defer=True)
+    assert db.record_application("200", RELAY_URL.format(200), "나회사", "개발자", defer=True)
+    assert not db.record_application("200", RELAY_URL.format(200), "나회사", "개발자", defer=True)
+
+    assert db.flush_pending_writes() == 0
+    assert db.is_already_applied("200")
+    assert db.get_statistics()['total_applications'] == 2
+
+def test_find_applied_and_dedup_snapshot(db):
+    """후보 공고 중 이미 지원한 job_id와 최근 지원한 회사를 한 번에 조회"""
+    db.record_applications_batch([
+        {'job_id': "100", 'job_url': "u1", 'company_name': "가회사", 'job_title': "t",
+         'application_date': datetime.now() - timedelta(days=40)},
+        {'job_id': "200", 'job_url': "u2", 'company_name': "나회사", 'job_title': "t",
+         'application_date': datetime.now()}
+    ])
+
+    found = db.find_applied(["100", "300"], ["가회사", "나회사", "다회사"])
+    assert found == {'job_ids': {"100"}, 'companies': {"나회사"}}
+    assert db.find_applied([], []) == {'job_ids': set(), 'companies': set()}
+
+    snapshot = db.get_dedup_snapshot()
+    assert sorted(snapshot['job_ids']) == ["100", "200"]
+    assert set(snapshot['companies']) == {"나회사"}
+    assert db.get_dedup_snapshot(since_id=snapshot['max_id'])['job_ids'] == []
+
+def test_statistics_windows(db):
+    """오늘/최근 7일/이번 달/전체 지원 수와 키워드, 회사 통계"""
+    now = datetime.now()
+    db.record_applications_batch([
+        {'job_id': str(i), 'job_url': f"u{i}", 'company_name': company, 'job_title': "t",
+         'keyword': keyword, 'application_date': now - timedelta(days=days)}
+        for i, (days, company, keyword) in enumerate([
+            (0, "가회사", "개발"), (6, "가회사", "개발"), (7, "나회사", "바이오"), (400, "다회사", None)
+        ])
+    ])
+    db.record_execution(now.strftime('%Y-%m-%d'), 4, ["개발", "바이오"])
+
+    stats = db.get_statistics()
+    assert set(stats) == STATISTICS_KEYS
+    assert stats['total_applications'] == 4
+    assert stats['today_applications'] == 1
+    assert stats['week_applications'] == 2
+    assert stats['month_applications'] == sum(
+        (now - timedelta(days=days)).date() >= now.date().replace(day=1) for days in (0, 6, 7, 400)
+    )
+    assert stats['total_executions'] == 1
+    assert stats['keyword_statistics'] == {"개발": 2, "바이오": 1}
+    assert stats['top_companies'][0] == ("가회사", 2)
+
+def test_application_history_pages(db):
+    """커서 기반 페이지 조회는 최신순으로 빠짐없이 반환"""
+    now = datetime.now()
+    db.record_applications_batch([
+        {'job_id': str(i), 'job_url': f"u{i}", 'company_name': "회사", 'job_title': f"t{i}",
+         'application_date': now - timedelta(minutes=i)}
+        for i in range(5)
+    ])
+
+    seen = []
+    cursor = None
+    while True:
+        page = db.get_application_history_page(page_size=2, cursor=cursor)
+        seen.extend(item['job_id'] for item in page['items'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+    assert seen == ["0", "1", "2", "3", "4"]
+
+def test_configuration_version(db):
+    """설정 저장은 버전을 올리고, 검색 위치 저장은 버전을 올리지 않음"""
+    assert db.get_configuration_version() == 0
+    db.set_configuration("max_applications", 10)
+    assert db.get_configuration("max_applications") == "10"
+    version = db.get_configuration_version()
+    assert version == 1
+
+    db.save_search_cursor({'keyword_index': 2, 'page': 3})
+    assert db.get_search_cursor() == {'keyword_index': 2, 'page': 3}
+    assert db.get_configuration_version() == version
+    assert "search_cursor" not in db.load_configurations()
+
+    db.save_search_cursor(None)
+    assert db.get_search_cursor() is None
+
+def test_search_watermark_only_moves_forward(db):
+    """증분 수집 기준점은 더 최신 공고 번호일 때만 갱신"""
+    assert db.get_search_watermark("개발", "서울") is None
+    db.save_search_watermark("개발", "서울", 200, datetime(2026, 10, 17))
+    db.save_search_watermark("개발", "서울", 100, datetime(2026, 10, 1))
+    assert db.get_search_watermark("개발", "서울") == {'rec_idx': 200, 'registered_at': datetime(2026, 10, 17)}
+
+def test_selector_stats_accumulate(db):
+    """선택자 시도/적중 수는 누적"""
+    update = {'page_type': "detail", 'selector': ".btn_apply", 'attempts': 2, 'hits': 1,
+              'last_hit_at': datetime.now()}
+    assert db.record_selector_stats([update, {**update, 'selector': ".apply-btn", 'hits': 0}]) == 2
+    db.record_selector_stats([update])
+    assert db.load_selector_stats() == {("detail", ".btn_apply"): (4, 2), ("detail", ".apply-btn"): (2, 0)}
+    assert db.record_selector_stats([]) == 0
+
+def test_job_posting_cache(db):
+    """상세 파싱 결과 저장과 조회"""
+    detail = JobDetail("개발자", "가회사", "~ 10/31", True, "immediate", True)
+    db.save_job_posting("100", RELAY_URL.format(100), detail, "hash")
+    db.touch_job_postings(["100", "200"])
+
+    postings = db.get_job_postings(["100", "200"])
+    assert set(postings) == {"100"}
+    assert postings["100"]['title'] == "개발자"
+    assert postings["100"]['has_apply_button'] is True
+    assert postings["100"]['content_hash'] == "hash"
+    assert db.get_job_postings([]) == {}
+
+def test_upgrade_from_version_6(db):
+    """이전 버전 파일은 job_id 정규화, 설정 테이블의 검색 위치 삭제, 선택자 통계 초기화"""
+    db.record_applications_batch([
+        {'job_id': "hash-a", 'job_url': RELAY_URL.format(100), 'company_name': "가회사", 'job_title': "t",
+         'application_date': datetime.now()}
+    ])
+    db.store_search_cursor_value("search_cursor", '{"page": 1}')
+    with db.get_connection() as conn:
+        with conn:
+            conn.execute('''
+                INSERT INTO user_configurations (config_key, config_value, created_at, updated_at)
+                VALUES ('search_cursor', '{}', '2024-01-02 10:00:00', '2024-01-02 10:00:00')
+            ''')
+            conn.execute("INSERT INTO selector_stats (page_type, selector, attempts, hits) VALUES ('d', 's', 5, 5)")
+            conn.execute("PRAGMA user_version = 6")
+
+    upgraded = reopen(db.db_path)
+    assert upgraded.is_already_applied("100")
+    assert not upgraded.is_already_applied("hash-a")
+    assert "search_cursor" not in upgraded.load_configurations()
+    assert upgraded.get_search_cursor() == {'page': 1}
+    assert upgraded.load_selector_stats() == {}
+    with upgraded.get_connection() as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+def test_migrates_legacy_tables(tmp_path):
+    """이전 스키마(applications, execution_log)의 기록을 옮김"""
+    db_file = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_file)
+    conn.executescript('''
+        CREATE TABLE applications (
+            id INTEGER PRIMARY KEY, job_id TEXT UNIQUE, job_url TEXT, company_name TEXT,
+            job_title TEXT, applied_date TEXT, created_at TEXT
+        );
+        CREATE TABLE execution_log (
+            id INTEGER PRIMARY KEY, execution_date TEXT, applications_count INTEGER, created_at TEXT
+        );
+        INSERT INTO applications (job_id, job_url, company_name, job_title, applied_date, created_at)
+        VALUES ('old', 'https://example.com/old', NULL, '예전 공고', '2024-01-02 10:00:00', '2024-01-02 10:00:00');
+        INSERT INTO execution_log (execution_date, applications_count, created_at)
+        VALUES ('2024-01-02', 1, '2024-01-02 10:00:00');
+    ''')
+    conn.close()
+
+    store = reopen(db_file)
+    assert store.is_already_applied("old")
+    assert store.is_executed_today("2024-01-02")
+    stats = store.get_statistics()
+    assert stats['total_applications'] == 1
+    assert stats['total_executions'] == 1
+    store.close()
+
+def test_connections_are_per_thread(db):
+    """스레드마다 연결을 열고, 스레드 종료 시 닫은 연결은 상태에서 빠짐"""
+    db.is_already_applied("100")
+    assert db.get_pool_status()['pool_size'] == 1
+
+    def worker():
+        db.is_already_applied("100")
+        assert db.get_pool_status()['pool_size'] == 2
+        close_thread_connections()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert db.get_pool_status()['pool_size'] == 1
+
+    db.close()
+    assert db.get_pool_status()['pool_size'] == 0
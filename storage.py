@@ -0,0 +1,326 @@
+"""
+지원 기록 저장소 공통 인터페이스
+Common storage interface shared by the PostgreSQL and SQLite backends
+"""
+
+import os
+import abc
+import json
+import base64
+from write_behind import get_write_behind_queue, flush_write_behind_queue
+from config_cache import ConfigurationCache, get_configuration_cache
+
+HISTORY_PAGE_SIZE = 50
+MAX_HISTORY_PAGE_SIZE = 200
+
+SEARCH_CURSOR_KEY = "search_cursor"
+
+def encode_cursor(sort_value, row_id):
+    """(정렬값, id)를 페이지 커서 문자열로 변환"""
+    raw = f"{sort_value}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor):
+    """페이지 커서를 (정렬값 문자열, id)로 변환 (형식이 잘못되면 ValueError)"""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    sort_value, row_id = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").rsplit("|", 1)
+    return sort_value, int(row_id)
+
+def clamp_page_size(page_size):
+    """페이지 크기를 1~MAX_HISTORY_PAGE_SIZE 범위로 제한"""
+    try:
+        page_size = int(page_size)
+    except (TypeError, ValueError):
+        return HISTORY_PAGE_SIZE
+    return max(1, min(page_size, MAX_HISTORY_PAGE_SIZE))
+
+class ApplicationStore(abc.ABC):
+    """지원 기록 저장소 기본 클래스
+
+    PostgreSQL(PostgresApplicationDatabase)과 SQLite(ApplicationDatabase) 구현이
+    같은 메서드와 스키마를 제공한다. 백엔드와 무관한 기능(지연 쓰기, 마지막 사용 설정)은
+    이 클래스에서 구현하고, 나머지는 추상 메서드로 구현체가 모두 제공해야 생성할 수 있다.
+    """
+
+    # 지연 쓰기 큐를 구분하는 키 (구현체에서 지정)
+    write_queue_key = None
+
+    # --- 구현체에서 제공해야 하는 메서드 ---
+
+    @abc.abstractmethod
+    def is_already_applied(self, job_id):
+        """중복 지원 확인"""
+
+    @abc.abstractmethod
+    def is_company_already_applied(self, company_name, days=30):
+        """회사명 기반 중복 지원 확인 (최근 30일 내)"""
+
+    @abc.abstractmethod
+    def find_applied(self, job_ids, company_names, days=30):
+        """후보 공고 중 이미 지원한 job_id와 최근 days일 내 지원한 회사를 한 번의 쿼리로 조회
+
+        {'job_ids': set, 'companies': set} 형태로 반환한다.
+        """
+
+    @abc.abstractmethod
+    def get_dedup_snapshot(self, days=30, since_id=0):
+        """중복 확인 인덱스용 지원 이력 일괄 조회"""
+
+    @abc.abstractmethod
+    def record_application(self, job_id, job_url, company_name, job_title, keyword=None, defer=False):
+        """지원 기록 저장"""
+
+    @abc.abstractmethod
+    def record_applications_batch(self, applications):
+        """지원 기록 일괄 저장"""
+
+    @abc.abstractmethod
+    def is_executed_today(self, execution_date):
+        """당일 실행 여부 확인"""
+
+    @abc.abstractmethod
+    def record_execution(self, execution_date, applications_count, keywords=None, status='completed', error_message=None,
+                         keyword_stats=None):
+        """실행 기록 저장 (keyword_stats: 키워드별 결과/신규/중복 공고 수)"""
+
+    @abc.abstractmethod
+    def get_application_history(self, days=30):
+        """지원 이력 조회"""
+
+    @abc.abstractmethod
+    def get_execution_history(self, days=30):
+        """실행 이력 조회"""
+
+    @abc.abstractmethod
+    def get_application_history_page(self, page_size=HISTORY_PAGE_SIZE, cursor=None):
+        """지원 이력 페이지 조회 ((application_date, id) 기준 키셋 페이지네이션)
+
+        {'items': [...], 'next_cursor': 다음 페이지 커서 또는 None} 형태로 반환한다.
+        """
+
+    @abc.abstractmethod
+    def get_execution_history_page(self, page_size=HISTORY_PAGE_SIZE, cursor=None):
+        """실행 이력 페이지 조회 ((execution_date, id) 기준 키셋 페이지네이션)"""
+
+    @abc.abstractmethod
+    def get_statistics(self):
+        """통계 정보 조회
+
+        total_applications, today_applications, week_applications(오늘 포함 최근 7일),
+        month_applications(이번 달), total_executions, keyword_statistics({키워드: 지원 수}),
+        top_companies([(회사명, 지원 수)] 상위 5개) 키를 가진 dict를 반환한다.
+        """
+
+    @abc.abstractmethod
+    def cleanup_old_records(self, days=90, batch_size=5000, progress=print):
+        """오래된 기록 정리"""
+
+    @abc.abstractmethod
+    def log_system_message(self, level, message, module=None, function_name=None, execution_id=None, defer=False):
+        """시스템 로그 기록"""
+
+    @abc.abstractmethod
+    def log_system_messages_batch(self, messages):
+        """시스템 로그 일괄 기록"""
+
+    @abc.abstractmethod
+    def load_configurations(self):
+        """설정 전체를 한 번의 쿼리로 조회 ({키: 값}, 버전 카운터 행 포함)"""
+
+    @abc.abstractmethod
+    def get_configuration_version(self):
+        """설정 버전 카운터 조회"""
+
+    @abc.abstractmethod
+    def save_configurations(self, items):
+        """{키: (값, 설명)}을 한 트랜잭션으로 저장하고 증가한 설정 버전 반환"""
+
+    @abc.abstractmethod
+    def load_selector_stats(self):
+        """선택자 적중 통계 전체 조회 {(페이지 유형, 선택자): (시도 수, 적중 수)}"""
+
+    @abc.abstractmethod
+    def record_selector_stats(self, updates):
+        """선택자 시도/적중 증가분 일괄 반영
+
+        updates는 page_type, selector, attempts, hits, last_hit_at 키를 가진 dict 목록이다.
+        """
+
+    @abc.abstractmethod
+    def get_search_watermark(self, keyword, location):
+        """키워드/지역의 증분 수집 기준점 조회 ({'rec_idx', 'registered_at'} 또는 None)"""
+
+    @abc.abstractmethod
+    def save_search_watermark(self, keyword, location, rec_idx, registered_at=None):
+        """증분 수집 기준점 저장 (기존 값보다 최신일 때만 앞으로 이동)"""
+
+    @abc.abstractmethod
+    def load_search_cursor_value(self, name):
+        """저장된 검색 위치 문자열 조회 (없으면 None)"""
+
+    @abc.abstractmethod
+    def store_search_cursor_value(self, name, value):
+        """검색 위치 문자열 저장 (설정 버전을 올리지 않음, value가 None이면 삭제)"""
+
+    @abc.abstractmethod
+    def get_job_postings(self, job_ids):
+        """공고 번호별 캐시된 상세 파싱 결과를 한 번의 쿼리로 조회 ({job_id: dict})"""
+
+    @abc.abstractmethod
+    def save_job_posting(self, job_id, job_url, detail, content_hash):
+        """상세 파싱 결과 저장 (마지막으로 본/가져온 시각 갱신)"""
+
+    @abc.abstractmethod
+    def touch_job_postings(self, job_ids):
+        """검색 결과에서 다시 본 캐시 공고의 마지막으로 본 시각 갱신"""
+
+    @abc.abstractmethod
+    def get_last_used_keywords(self):
+        """마지막으로 사용한 검색 키워드 조회"""
+
+    @abc.abstractmethod
+    def get_pool_status(self):
+        """연결 상태 조회"""
+
+    # --- 공통 구현 ---
+
+    def _get_write_queue(self):
+        """지연 쓰기 큐 조회"""
+        return get_write_behind_queue(self.write_queue_key, lambda: {
+            'application': self.record_applications_batch,
+            'system_log': self.log_system_messages_batch
+        })
+
+    def _defer_application(self, application):
+        """지원 기록을 지연 쓰기 큐에 추가 (이미 지원했거나 큐에 있는 job_id면 False)
+
+        큐에 넣은 뒤에는 유니크 제약으로 중복을 판정할 수 없으므로 넣기 전에 확인한다.
+        """
+        job_id = application['job_id']
+        if job_id in self.find_applied([job_id], [])['job_ids']:
+            return False
+        return self._get_write_queue().put('application', application, key=job_id)
+
+    def flush_pending_writes(self):
+        """지연 쓰기 큐에 남은 작업 저장 (저장하지 못한 레코드 수 반환)"""
+        return flush_write_behind_queue(self.write_queue_key)
+
+    def get_write_queue_stats(self):
+        """지연 쓰기 큐 길이 및 배치 지연 시간 통계"""
+        return self._get_write_queue().get_stats()
+
+    def _get_configuration_cache(self):
+        """설정 캐시 조회 (같은 저장소를 쓰는 인스턴스끼리 공유)"""
+        return get_configuration_cache(self.write_queue_key, lambda: ConfigurationCache(
+            self.load_configurations,
+            self.get_configuration_version,
+            self.save_configurations
+        ))
+
+    def get_configuration(self, key, default_value=None):
+        """설정값 조회 (캐시)"""
+        try:
+            return self._get_configuration_cache().get(key, default_value)
+        except Exception as e:
+            print(f"설정 조회 오류: {str(e)}")
+            return default_value
+
+    def set_configuration(self, key, value, description=None):
+        """설정값 저장 (데이터베이스에 먼저 저장 후 캐시 갱신)"""
+        self._get_configuration_cache().set_many({key: (value, description)})
+
+    def set_configurations(self, items):
+        """설정값 여러 개를 한 번에 저장 ({키: (값, 설명)})"""
+        self._get_configuration_cache().set_many(items)
+
+    def save_last_used_settings(self, keywords=None, location=None, max_applications=None):
+        """마지막 사용 키워드/지역/최대 지원수를 한 번에 저장"""
+        items = {}
+        if keywords:
+            items['last_keywords'] = (keywords, '마지막으로 사용한 검색 키워드')
+        if location:
+            items['last_location'] = (location, '마지막으로 사용한 검색 지역')
+        if max_applications:
+            items['last_max_applications'] = (str(max_applications), '마지막으로 사용한 최대 지원수')
+        self.set_configurations(items)
+
+    def save_last_used_keywords(self, keywords):
+        """마지막 사용 키워드 저장"""
+        try:
+            self.set_configuration('last_keywords', keywords, '마지막으로 사용한 검색 키워드')
+        except Exception as e:
+            pass  # 저장 실패해도 진행
+
+    def get_last_used_location(self):
+        """마지막으로 사용한 지역 조회"""
+        try:
+            return self.get_configuration('last_location', '서울')
+        except Exception as e:
+            return '서울'  # 기본값
+
+    def save_last_used_location(self, location):
+        """마지막 사용 지역 저장"""
+        try:
+            self.set_configuration('last_location', location, '마지막으로 사용한 검색 지역')
+        except Exception as e:
+            pass  # 저장 실패해도 진행
+
+    def get_last_used_max_applications(self):
+        """마지막으로 사용한 최대 지원수 조회"""
+        try:
+            return int(self.get_configuration('last_max_applications', '100'))
+        except Exception as e:
+            return 100  # 기본값
+
+    def save_last_used_max_applications(self, max_apps):
+        """마지막 사용 최대 지원수 저장"""
+        try:
+            self.set_configuration('last_max_applications', str(max_apps), '마지막으로 사용한 최대 지원수')
+        except Exception as e:
+            pass  # 저장 실패해도 진행
+
+    def get_search_cursor(self):
+        """진행 중인 검색 위치 조회 (없거나 손상되었으면 None)"""
+        try:
+            value = self.load_search_cursor_value(SEARCH_CURSOR_KEY)
+            return json.loads(value) if value else None
+        except (ValueError, TypeError):
+            return None
+
+    def save_search_cursor(self, cursor):
+        """검색 위치 저장 (cursor가 None이면 초기화)
+
+        페이지마다 갱신되므로 설정 테이블이 아닌 별도 테이블에 저장하여
+        다른 프로세스의 설정 캐시를 무효화하지 않는다.
+        """
+        try:
+            value = json.dumps(cursor, ensure_ascii=False) if cursor else None
+            self.store_search_cursor_value(SEARCH_CURSOR_KEY, value)
+        except Exception as e:
+            print(f"검색 위치 저장 오류: {str(e)}")
+
+def get_storage_backend():
+    """사용할 저장소 백엔드 (DATABASE_BACKEND, 미지정 시 DATABASE_URL 유무로 결정)"""
+    backend = os.getenv("DATABASE_BACKEND", "").lower()
+    if backend in ("postgres", "postgresql", "sqlite"):
+        return "sqlite" if backend == "sqlite" else "postgresql"
+    return "postgresql" if os.getenv("DATABASE_URL") else "sqlite"
+
+def create_database():
+    """설정된 백엔드의 저장소 생성"""
+    if get_storage_backend() == "sqlite":
+        from database import ApplicationDatabase
+        return ApplicationDatabase(os.getenv("DB_FILE", "applications.db"))
+
+    from postgres_database import PostgresApplicationDatabase
+    return PostgresApplicationDatabase()
+
+def release_thread_connections():
+    """현재 스레드의 데이터베이스 연결 반환 (요청/스레드 종료 시 호출)"""
+    if get_storage_backend() == "sqlite":
+        from database import close_thread_connections
+        close_thread_connections()
+        return
+
+    from models import remove_session
+    remove_session()
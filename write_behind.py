@@ -0,0 +1,248 @@
+"""
+지연 쓰기(write-behind) 큐 모듈
+Background writer that batches application records and system logs
+"""
+
+import atexit
+import queue
+import threading
+import time
+
+class WriteBehindQueue:
+    """제한된 크기의 큐에 쓰기 작업을 모아 백그라운드 스레드에서 일괄 저장
+
+    handlers는 {작업 종류: 일괄 저장 함수} 형태이며, 저장 함수는 같은 종류의
+    레코드 목록을 받아 한 번의 INSERT로 기록한다.
+    배치 크기(batch_size)에 도달하거나 flush_interval초가 지나면 저장한다.
+    저장에 실패하면 간격을 늘려 가며 재시도하고, 그래도 실패한 레코드는 버리지 않고
+    다음 저장 주기에 다시 시도한다. flush()/close()는 아직 저장하지 못한 레코드 수를 반환한다.
+    """
+
+    _FLUSH = object()
+    _STOP = object()
+
+    def __init__(self, handlers, batch_size=50, flush_interval=2.0, max_queue_size=1000, put_timeout=5.0,
+                 max_retries=3, retry_backoff=0.5):
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._unsaved = {kind: [] for kind in handlers}  # 재시도 후에도 저장하지 못한 레코드
+        self._keys = {kind: set() for kind in handlers}  # put(key=...)로 이미 받은 레코드 키
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self.stats = {
+            'enqueued': 0,
+            'written': 0,
+            'failed': 0,
+            'retries': 0,
+            'duplicates': 0,
+            'sync_fallbacks': 0,
+            'batches': 0,
+            'last_batch_size': 0,
+            'last_batch_latency_ms': 0.0,
+            'max_batch_latency_ms': 0.0,
+            'total_batch_latency_ms': 0.0
+        }
+
+    def start(self):
+        """백그라운드 쓰기 스레드 시작"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._closed = False
+                self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+                self._thread.start()
+
+    def _count(self, name, amount=1):
+        """통계 증가 (호출 스레드와 쓰기 스레드가 함께 갱신)"""
+        with self._lock:
+            self.stats[name] += amount
+
+    def put(self, kind, record, key=None):
+        """쓰기 작업 추가 (큐가 가득 차면 대기 후 직접 저장)
+
+        key가 있으면 이미 받은 키의 레코드는 넣지 않고 False를 반환한다.
+        직접 저장에 실패해도 False를 반환한다.
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"알 수 없는 쓰기 작업 종류: {kind}")
+
+        if key is not None:
+            with self._lock:
+                if key in self._keys[kind]:
+                    self.stats['duplicates'] += 1
+                    return False
+                self._keys[kind].add(key)
+
+        if self._closed:
+            return self._write_now(kind, record, key)
+
+        self.start()
+        try:
+            self._queue.put((kind, record), timeout=self.put_timeout)
+            self._count('enqueued')
+            return True
+        except queue.Full:
+            self._count('sync_fallbacks')
+            return self._write_now(kind, record, key)
+
+    def _write_now(self, kind, record, key):
+        """레코드 한 건 직접 저장 (실패하면 키를 지워 다시 넣을 수 있게 함)"""
+        if not self._write_batch(kind, [record]):
+            return True
+        if key is not None:
+            with self._lock:
+                self._keys[kind].discard(key)
+        return False
+
+    def flush(self):
+        """대기 중인 모든 쓰기 작업의 저장을 시도하고 저장하지 못한 레코드 수 반환"""
+        if self._thread is None or not self._thread.is_alive():
+            return self.unsaved_count()
+        self._queue.put(self._FLUSH)
+        self._queue.join()
+        return self.unsaved_count()
+
+    def close(self):
+        """남은 작업을 저장하고 쓰기 스레드 종료 (끝내 저장하지 못한 레코드는 내용을 출력)"""
+        with self._lock:
+            if self._closed:
+                return self.unsaved_count()
+            self._closed = True
+            thread = self._thread
+
+        if thread is not None and thread.is_alive():
+            self._queue.put(self._STOP)
+            thread.join()
+
+        for kind, records in self._unsaved.items():
+            for record in records:
+                print(f"지연 쓰기 저장 실패로 기록되지 않은 {kind}: {record}")
+        return self.unsaved_count()
+
+    def unsaved_count(self):
+        """재시도 후에도 저장하지 못해 다음 주기를 기다리는 레코드 수"""
+        return sum(len(records) for records in self._unsaved.values())
+
+    def queue_depth(self):
+        """현재 큐에 쌓인 작업 수"""
+        return self._queue.qsize()
+
+    def get_stats(self):
+        """큐 길이와 배치 지연 시간 통계"""
+        with self._lock:
+            stats = dict(self.stats)
+        stats['queue_depth'] = self.queue_depth()
+        stats['unsaved'] = self.unsaved_count()
+        stats['avg_batch_latency_ms'] = (
+            stats['total_batch_latency_ms'] / stats['batches'] if stats['batches'] else 0.0
+        )
+        return stats
+
+    def _run(self):
+        """백그라운드 쓰기 루프"""
+        pending = {kind: [] for kind in self.handlers}
+        taken = 0
+        deadline = time.monotonic() + self.flush_interval
+
+        while True:
+            timeout = max(deadline - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            stop = item is self._STOP
+            if item is not None:
+                taken += 1
+                if item is not self._FLUSH and not stop:
+                    kind, record = item
+                    pending[kind].append(record)
+
+            pending_count = sum(len(records) for records in pending.values())
+            if (item is self._FLUSH or stop or pending_count >= self.batch_size
+                    or time.monotonic() >= deadline):
+                for kind, records in pending.items():
+                    # 이전 주기에 저장하지 못한 레코드를 먼저 다시 시도
+                    records = self._unsaved[kind] + records
+                    self._unsaved[kind] = []
+                    if records:
+                        self._unsaved[kind] = self._write_batch(kind, records)
+                        pending[kind] = []
+                for _ in range(taken):
+                    self._queue.task_done()
+                taken = 0
+                deadline = time.monotonic() + self.flush_interval
+
+            if stop:
+                break
+
+    def _write_batch(self, kind, records):
+        """같은 종류의 레코드를 한 번에 저장하고 저장하지 못한 레코드 목록 반환
+
+        실패하면 retry_backoff초부터 두 배씩 늘려 max_retries번 재시도하고,
+        그래도 실패하면 한 건씩 저장하여 문제가 되는 레코드만 남긴다.
+        """
+        started = time.perf_counter()
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    self.handlers[kind](records)
+                    self._count('written', len(records))
+                    return []
+                except Exception as e:
+                    error = e
+                if attempt < self.max_retries:
+                    self._count('retries')
+                    time.sleep(self.retry_backoff * (2 ** attempt))
+
+            failed = list(records)
+            if len(records) > 1:
+                failed = []
+                for record in records:
+                    try:
+                        self.handlers[kind]([record])
+                        self._count('written')
+                    except Exception:
+                        failed.append(record)
+            self._count('failed', len(failed))
+            print(f"지연 쓰기 배치 저장 오류 ({kind}, {len(failed)}건 저장 실패): {str(error)}")
+            return failed
+        finally:
+            latency_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self.stats['batches'] += 1
+                self.stats['last_batch_size'] = len(records)
+                self.stats['last_batch_latency_ms'] = latency_ms
+                self.stats['max_batch_latency_ms'] = max(self.stats['max_batch_latency_ms'], latency_ms)
+                self.stats['total_batch_latency_ms'] += latency_ms
+
+_write_behind_queues = {}
+_write_behind_lock = threading.Lock()
+
+def get_write_behind_queue(key, handlers_factory):
+    """저장소별 지연 쓰기 큐 조회 (최초 호출 시 생성, 종료 시 자동 저장)"""
+    write_queue = _write_behind_queues.get(key)
+    if write_queue is None:
+        with _write_behind_lock:
+            write_queue = _write_behind_queues.get(key)
+            if write_queue is None:
+                write_queue = WriteBehindQueue(handlers_factory())
+                atexit.register(write_queue.close)
+                _write_behind_queues[key] = write_queue
+    return write_queue
+
+def flush_write_behind_queue(key=None):
+    """지연 쓰기 큐 비우기 (key가 없으면 전체, 생성되지 않은 큐는 무시) 후 저장하지 못한 레코드 수 반환"""
+    if key is not None:
+        write_queue = _write_behind_queues.get(key)
+        return write_queue.flush() if write_queue is not None else 0
+    
+    unsaved = 0
+    for write_queue in list(_write_behind_queues.values()):
+        unsaved += write_queue.flush()
+    return unsaved
@@ -0,0 +1,111 @@
+"""
+지연 쓰기 큐 테스트
+Unit tests for WriteBehindQueue retry, requeue and duplicate handling
+"""
+
+import pytest
+
+from write_behind import WriteBehindQueue
+
+class FlakyHandler:
+    """처음 fail_first번 호출과 bad 레코드가 포함된 호출은 실패하는 저장 함수"""
+
+    def __init__(self, fail_first=0, bad=()):
+        self.fail_first = fail_first
+        self.bad = set(bad)
+        self.calls = 0
+        self.saved = []
+
+    def __call__(self, records):
+        self.calls += 1
+        if self.calls <= self.fail_first or self.bad.intersection(records):
+            raise RuntimeError("저장 실패")
+        self.saved.extend(records)
+
+def make_queue(handler, **kwargs):
+    """테스트용 큐 (재시도 대기 없음, 시간 기준 저장 없음)"""
+    options = {'flush_interval': 60, 'max_retries': 2, 'retry_backoff': 0}
+    options.update(kwargs)
+    return WriteBehindQueue({'item': handler}, **options)
+
+def test_flush_writes_batch():
+    """flush()는 대기 중인 레코드를 한 배치로 저장"""
+    handler = FlakyHandler()
+    write_queue = make_queue(handler)
+    for record in range(5):
+        assert write_queue.put('item', record)
+
+    assert write_queue.flush() == 0
+    assert handler.saved == [0, 1, 2, 3, 4]
+    assert handler.calls == 1
+
+    stats = write_queue.get_stats()
+    assert stats['written'] == 5
+    assert stats['queue_depth'] == 0
+    assert stats['unsaved'] == 0
+    assert write_queue.close() == 0
+
+def test_failed_records_are_requeued():
+    """재시도 후에도 실패한 레코드는 버리지 않고 다음 주기에 다시 저장"""
+    handler = FlakyHandler(fail_first=6, bad={3})
+    write_queue = make_queue(handler)
+    for record in range(5):
+        write_queue.put('item', record)
+
+    # 배치 3회 + 한 건씩 저장 3회 실패 → 4건이 남음
+    assert write_queue.flush() == 4
+    assert handler.saved == [4]
+
+    # 다음 주기에 남은 레코드를 다시 시도하고 계속 실패하는 레코드만 남김
+    assert write_queue.flush() == 1
+    assert sorted(handler.saved) == [0, 1, 2, 4]
+
+    stats = write_queue.get_stats()
+    assert stats['retries'] == 4
+    assert stats['written'] == 4
+    assert write_queue.close() == 1
+
+def test_duplicate_key_is_rejected():
+    """같은 key로 다시 넣으면 False를 반환하고 중복 통계만 증가"""
+    handler = FlakyHandler()
+    write_queue = make_queue(handler)
+    assert write_queue.put('item', 'a', key='job-1')
+    assert not write_queue.put('item', 'a', key='job-1')
+    assert write_queue.put('item', 'b', key='job-2')
+
+    write_queue.close()
+    assert handler.saved == ['a', 'b']
+    assert write_queue.get_stats()['duplicates'] == 1
+
+def test_put_after_close_writes_directly():
+    """close() 이후에는 직접 저장하고, 실패하면 False를 반환하며 키를 다시 받을 수 있게 함"""
+    handler = FlakyHandler(bad={'bad'})
+    write_queue = make_queue(handler)
+    assert write_queue.close() == 0
+    assert write_queue.close() == 0
+
+    assert write_queue.put('item', 'good', key='good')
+    assert handler.saved == ['good']
+
+    assert not write_queue.put('item', 'bad', key='bad')
+    handler.bad.clear()
+    assert write_queue.put('item', 'bad', key='bad')
+    assert handler.saved == ['good', 'bad']
+
+def test_full_queue_falls_back_to_direct_write():
+    """큐가 가득 차면 기다린 뒤 직접 저장"""
+    handler = FlakyHandler()
+    write_queue = make_queue(handler, max_queue_size=1, put_timeout=0.01)
+    # 쓰기 스레드가 꺼내 가기 전에 큐를 채우기 위해 스레드 시작을 막음
+    write_queue.start = lambda: None
+    assert write_queue.put('item', 1)
+    assert write_queue.put('item', 2)
+
+    assert handler.saved == [2]
+    assert write_queue.get_stats()['sync_fallbacks'] == 1
+
+def test_unknown_kind_raises():
+    """등록되지 않은 작업 종류는 ValueError"""
+    write_queue = make_queue(FlakyHandler())
+    with pytest.raises(ValueError):
+        write_queue.put('unknown', 1)